@@ -1,28 +1,15 @@
+from aocutils import Parser
+
+# the input is streamed one elf at a time
+parser = Parser("input.txt", lazy=True)
+elf_calories_list = [
+    sum(map(int, section.split())) for section in parser.iter_sections()
+]
+
 # part 1
 
-max_calories = 0
-with open("input.txt", "r") as f:
-    elf_calories = 0
-    for line in f:
-        if line.strip() == "":
-            if elf_calories > max_calories:
-                max_calories = elf_calories
-            elf_calories = 0
-        else:
-            cal = int(line.strip())
-            elf_calories += cal
-print("max calories:", max_calories)
+print("max calories:", max(elf_calories_list))
 
 # part 2
 
-top_3_list = [0, 0, 0]
-with open("input.txt", "r") as f:
-    elf_calories = 0
-    for line in f:
-        if line.strip() == "":
-            top_3_list = sorted(top_3_list + [elf_calories])[1:]
-            elf_calories = 0
-        else:
-            cal = int(line.strip())
-            elf_calories += cal
-print("max calories with top 3 elves:", sum(top_3_list))
\ No newline at end of file
+print("max calories with top 3 elves:", sum(sorted(elf_calories_list)[-3:]))
@@ -6,7 +6,7 @@ from aocutils import Parser, timeit
 @timeit
 def solve_part1(parser):
     part1_regex = re.compile(r"\d")
-    digits_found = parser.apply_regex(part1_regex)
+    digits_found = parser.apply_regex(part1_regex, whole_buffer=True)
     total = 0
     for line_digits in digits_found:
         cal_value = 10*int(line_digits[0]) + int(line_digits[-1])
@@ -21,7 +21,7 @@ def solve_part2(parser):
         "six": 6, "seven": 7, "eight": 8, "nine": 9,
         }
     part2_regex = re.compile(r"(?=(" + "|".join(alphabet_digits.keys()) + r"|\d))")
-    digits_found = parser.apply_regex(part2_regex)
+    digits_found = parser.apply_regex(part2_regex, whole_buffer=True)
     total = 0
     for line_digits in digits_found:
         first_digit = alphabet_digits.get(line_digits[0], line_digits[0])
@@ -1,24 +1,24 @@
-from aocutils import Parser, Grid, timeit
+from aocutils import Parser, Grid, cached_parse, timeit
 from utils.day10 import Pipe, find_loop, infer_start_pipe_type, scan
 
 
+# the Pipe objects of the result are built by utils/day10.py
+@cached_parse(depends=[Pipe])
 def parse_input(file_name: str):
     lines = Parser(file_name).get_lines()
-    grid = Grid()
-    # elem location is i+1, j+1 because of the padding after the loop
+    # reading outside the grid gives "." so that edge tiles have neighbours
+    grid = Grid(border=".")
     for i, line in enumerate(lines):
         line_list = []  # list of pipes or tuples of the form (ch, i, j)
         for j, ch in enumerate(line.strip()):
             if ch not in [".", "S"]:
-                pipe = Pipe((i + 1, j + 1), ch)
+                pipe = Pipe((i, j), ch)
                 line_list.append(pipe)
             else:
-                # line_list.append((ch, i + 1, j + 1))
                 line_list.append(ch)
                 if ch == "S":
-                    starting_i, starting_j = (i + 1, j + 1)
+                    starting_i, starting_j = (i, j)
         grid.append_row(line_list)
-    grid.pad()
     return grid, starting_i, starting_j
 
 
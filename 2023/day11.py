@@ -2,48 +2,33 @@ from typing import List, Tuple
 from functools import reduce
 from itertools import combinations
 
-from aocutils import Parser
+from aocutils import Parser, Grid
 
 
 class Universe:
-    def __init__(self, init_grid: List[List[str]], galaxy_loc_list: List[Tuple[int]]):
-        self.init_grid = [row.copy() for row in init_grid]
+    def __init__(self, init_grid: Grid, galaxy_loc_list: List[Tuple[int]]):
+        self.init_grid = init_grid
         self.galaxy_loc_list = galaxy_loc_list.copy()
 
     def get_distance(self, loc1: Tuple[int], loc2: Tuple[int]):
         return abs(loc1[0] - loc2[0]) + abs(loc1[1] - loc2[1])
 
     def expand(self, multiplier: int):
-        # expand rows from last to first
-        universe_width = len(self.init_grid)
-        for i, row in enumerate(self.init_grid[-1::-1]):
-            if "#" not in row:
-                row_idx = universe_width - i - 1
-                self.galaxy_loc_list = [
-                    (g_i + multiplier - 1, g_j) if g_i > row_idx else (g_i, g_j)
-                    for g_i, g_j in self.galaxy_loc_list
-                ]
-        # expand columns from last to first
-        column_list = self._copy_transpose()
-        universe_tr_width = len(column_list)
-        for j, column in enumerate(column_list[-1::-1]):
-            if "#" not in column:
-                column_idx = universe_tr_width - j - 1
-                self.galaxy_loc_list = [
-                    (g_i, g_j + multiplier - 1) if g_j > column_idx else (g_i, g_j)
-                    for g_i, g_j in self.galaxy_loc_list
-                ]
-
-    def _copy_transpose(self):
-        return [
-            [self.init_grid[i][j] for i in range(len(self.init_grid))]
-            for j in range(len(self.init_grid[0]))
+        # each galaxy moves by the number of empty rows (columns) before it.
+        # The counts are cached on the grid, so expanding again is O(galaxies).
+        counts = self.init_grid.line_counts("#")
+        self.galaxy_loc_list = [
+            (
+                g_i + (multiplier - 1) * counts.empty_row_prefix[g_i],
+                g_j + (multiplier - 1) * counts.empty_col_prefix[g_j],
+            )
+            for g_i, g_j in self.galaxy_loc_list
         ]
 
 
 def parse_input(file_name: str):
     lines = Parser(file_name).get_lines()
-    grid = []
+    grid = Grid()
     galaxy_loc_list = []
     i = 0
     for line in lines:
@@ -55,7 +40,7 @@ def parse_input(file_name: str):
                 galaxy_loc_list.append((i, j))
             j += 1
         i += 1
-        grid.append(line_list)
+        grid.append_row(line_list)
     return grid, galaxy_loc_list
 
 
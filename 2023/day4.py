@@ -3,39 +3,14 @@ from collections import defaultdict
 from aocutils import Parser
 
 
-def parse_line(line: str):
-    """Parses a line of input containing card information and returns relevant data.
-
-    Args:
-        line (str): A string representing input with the following format:
-        "Card <card_id>: <winning_set> | <elf_set>".
-
-    Returns:
-        Tuple[int, Set[int], Set[int]]: A tuple containing the card ID, winning set,
-            and elf set parsed from the input.
-
-    Example:
-    >>> parse_input("Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53")
-    (1, {41, 48, 83, 86, 17}, {83, 86, 6, 31, 17, 9, 48, 53})
-    """
-    card_id_part = line.split(": ")[0].strip()
-    card_id = int(card_id_part.strip().split()[1])
-    two_sets_part = line.split(": ")[1].strip()
-    winning_set_part, elf_set_part = two_sets_part.split("|")
-    winning_set = set(int(i.strip()) for i in winning_set_part.strip().split())
-    elf_set = set(int(i.strip()) for i in elf_set_part.strip().split())
-
-    return card_id, winning_set, elf_set
-
-
 def main():
     parser = Parser("../AoC-input/2023/day4.txt")
-    line_list = parser.get_lines()
+    card_list = parser.parse_template("Card {card_id:d}: {winning:ints} | {elf:ints}")
     # part 1 & 2
     total_points = 0
     new_pile_dict = defaultdict(lambda: 1)  # count of each card
-    for line in line_list:
-        card_id, winning_set, elf_set = parse_line(line)
+    for card_id, winning_list, elf_list in card_list:
+        winning_set, elf_set = set(winning_list), set(elf_list)
 
         # part 1
         n_winning_cards = len(winning_set.intersection(elf_set))
@@ -1,4 +1,4 @@
-from aocutils import Parser, IntInterval, Subset, Mapper, timeit
+from aocutils import Parser, IntInterval, Subset, Mapper, cached_parse, timeit
 
 
 @timeit
@@ -21,6 +21,7 @@ def get_last_output(input_subset, mapper_dict):
     return intermediate_output
 
 
+@cached_parse
 def parse_input(file_name):
     parser = Parser(file_name)
     section_list = parser.get_sections()
@@ -37,13 +37,11 @@ from aocutils import Parser, timeit
 
 
 def parse_input(file_name: str):
-    section_list = Parser(file_name).get_sections()
-    instruction_seq = section_list[0]
-    node_dict = {}
-    for line in section_list[1].split("\n"):
-        node, dest = line.split(" = ")
-        left, right = dest.strip()[1:-1].split(", ")
-        node_dict[node] = (left, right)
+    parser = Parser(file_name)
+    instruction_seq = parser.get_sections()[0]
+    # the instruction line doesn't match the template and is skipped
+    node_list = parser.parse_template("{node:w} = ({left:w}, {right:w})", strict=False)
+    node_dict = {node: (left, right) for node, left, right in node_list}
     return instruction_seq, node_dict
 
 
@@ -1,3 +1,5 @@
+import numpy as np
+
 from aocutils import Parser
 
 
@@ -18,10 +20,32 @@ def predict(history_list, direction="forward"):
     return predict_value
 
 
+def predict_all(history_array):
+    """Extrapolates all the histories (one per row) forward and backward at once."""
+    forward = np.zeros(len(history_array), dtype=np.int64)
+    backward = np.zeros(len(history_array), dtype=np.int64)
+    sign = 1
+    diff_array = history_array
+    while diff_array.shape[1] and diff_array.any():
+        forward += diff_array[:, -1]
+        backward += sign * diff_array[:, 0]
+        sign = -sign
+        diff_array = np.diff(diff_array, axis=1)
+    return forward, backward
+
+
 def main():
-    integers = Parser("../AoC-input/2023/day9.txt").get_integers(sep=" ")
-    total_forward = sum(predict(h_list, direction="forward") for h_list in integers)
-    total_backward = sum(predict(h_list, direction="backward") for h_list in integers)
+    parser = Parser("../AoC-input/2023/day9.txt")
+    integers = parser.get_integers(sep=" ", as_array="numpy")
+    if isinstance(integers, np.ndarray):
+        forward, backward = predict_all(integers)
+        total_forward, total_backward = int(forward.sum()), int(backward.sum())
+    else:  # histories of different lengths
+        integers = parser.get_integers(sep=" ")
+        total_forward = sum(predict(h_list, direction="forward") for h_list in integers)
+        total_backward = sum(
+            predict(h_list, direction="backward") for h_list in integers
+        )
 
     print("The sum of extrapolated values (forward)", total_forward)
     print("The sum of extrapolated values (backward)", total_backward)
@@ -1,4 +1,4 @@
-from copy import deepcopy
+from aocutils import follow_path
 
 
 # S will have exactly two pipes connecting to it
@@ -55,44 +55,6 @@ class Pipe:
         return (self.i == other.i) and (self.j == other.j) and (self.type == other.type)
 
 
-class Loop:
-    # ordered list of pipes that connect to each other
-    # A loop starts with a pipe that connects to the starting point S and another pipe
-    def __init__(self, pipe_list):
-        assert len(pipe_list) > 0
-        # TODO: ensure the pipe_list is compatible
-        self.pipe_list = deepcopy(pipe_list)
-        self.is_finished = False
-
-    def extend(self, grid):
-        # find the next pipe that connects to the last pipe in self.pipe_list
-        last_pipe = self.pipe_list[-1]
-        # get the next pipe
-        if len(self.pipe_list) == 1:
-            # get the next pipe that is not an S
-            next_pipe = grid[last_pipe.start_i, last_pipe.start_j]
-            if next_pipe == "S":
-                next_pipe = grid[last_pipe.end_i, last_pipe.end_j]
-        else:
-            # get the next pipe that is not the one just before the last pipe
-            next_pipe = grid[last_pipe.start_i, last_pipe.start_j]
-            if next_pipe == self.pipe_list[-2]:
-                next_pipe = grid[last_pipe.end_i, last_pipe.end_j]
-            # check if you reached the starting tile
-            if next_pipe == "S":
-                self.is_finished = True
-                # don't add it so that self.pipe_list is a list of pipes only
-                return
-        # add to the list and check if it reaches the border of the grid
-        self.pipe_list.append(next_pipe)
-
-    def __repr__(self) -> str:
-        pipe_repr = "".join(pipe.type for pipe in self.pipe_list)
-        start = self.pipe_list[0].location
-        finish = self.pipe_list[-1].location
-        return f"Pipe '{pipe_repr}' from {start} to {finish}"
-
-
 def find_loop(grid, starting_i, starting_j):
     # Assumption: S will have exactly two pipes connecting to it
     # find the next pipe to starting position
@@ -109,11 +71,23 @@ def find_loop(grid, starting_i, starting_j):
         ):
             second_pipe = next_tile
             break
-    # define a long pipe and extend when possible
-    long_pipe = Loop([second_pipe])
-    while not long_pipe.is_finished:
-        long_pipe.extend(grid)
-    loop = long_pipe.pipe_list
+
+    def next_cell(prev, cur):
+        # go to the end of the current pipe that we did not come from
+        pipe = grid.get_flat(cur)
+        next_idx = grid.index(pipe.start_i, pipe.start_j)
+        if next_idx == prev:
+            next_idx = grid.index(pipe.end_i, pipe.end_j)
+        return next_idx
+
+    # walk on flat cell ids, the path ends when it gets back to S
+    path = follow_path(
+        grid.index(starting_i, starting_j),
+        next_cell,
+        first=grid.index(second_pipe.i, second_pipe.j),
+    )
+    # the loop is the list of pipes only, without S
+    loop = [grid.get_flat(idx) for idx in path[1:]]
 
     return loop
 
@@ -1,7 +1,14 @@
 # flake8: noqa
-from .grid import Grid
+from .grid import Grid, GridView, GridHistory, LineCounts, DIRECTIONS, byte_table
 from .parse import Parser
 from .utils import timeit
 from .interval import IntInterval, Subset
 from .map import Mapper
 from .math import solve_quadratic_eqn
+from .traverse import bfs, flood_fill, follow_path
+from .sparse import SparseGrid
+from .components import UnionFind, Components
+from .bitgrid import BitGrid
+from .tiled import TiledGrid
+from .cache import cached_parse
+from .template import Template
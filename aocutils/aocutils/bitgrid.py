@@ -0,0 +1,246 @@
+from functools import lru_cache
+from typing import List
+
+from .grid import DIRECTIONS, Grid
+
+try:
+    _popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+
+    def _popcount(x):
+        return bin(x).count("1")
+
+
+@lru_cache(maxsize=None)
+def _bit_table(on):
+    # maps `on` to "1" and any other latin-1 character to "0"
+    table = {code: "0" for code in range(256)}
+    table[ord(on)] = "1"
+    return table
+
+
+# maps the bytes of a 0/1 mask to the characters "0" and "1"
+_MASK_TO_DIGITS = bytes([ord("0"), ord("1")]) + bytes(254)
+
+
+class BitGrid:
+    """Represents a 2D grid of booleans with one bit per cell.
+
+    Each row is a Python int where bit j is the cell of column j, so whole-grid
+    operations (AND/OR/XOR, shifts, popcounts) work on many cells per machine word.
+
+    Attributes:
+        rows (List[int]): The rows as bit sets.
+        shape (Tuple[int, int]): Shape of the grid (n_rows, n_columns).
+
+    Methods:
+        from_lines(cls, lines: List[str], on: str = "#") -> BitGrid:
+            Builds a bit grid from text lines.
+
+        from_grid(cls, grid: Grid, predicate) -> BitGrid:
+            Builds a bit grid from the cells of a Grid matching a predicate.
+
+        shift(self, di: int, dj: int) -> BitGrid:
+            Returns the grid with its cells moved by (di, dj).
+
+        neighbor_mask(self, connectivity: int = 4) -> BitGrid:
+            Returns the cells that have at least one set neighbour.
+
+        count(self) / row_counts(self) / col_counts(self):
+            Counts the set cells in total, per row and per column.
+
+    Example usage:
+    ```python
+    grid = BitGrid.from_lines(["#..", "..#"])
+    print(grid.row_counts(), grid.col_counts())  # [1, 1] [1, 0, 1]
+    print(grid.shift(1, 0))  # "...\\n#.."
+    print((grid | grid.shift(0, 1)).count())  # 3
+    ```
+    """
+
+    def __init__(self, rows: List[int] = None, n_columns: int = 0):
+        """Initializes a BitGrid object.
+
+        Args:
+            rows (List[int], optional): Rows as bit sets. Defaults to None.
+            n_columns (int, optional): Number of columns. Defaults to 0.
+        """
+        self.rows = list(rows) if rows else []
+        self.n_columns = n_columns
+        self._full_row = (1 << n_columns) - 1
+        for row in self.rows:
+            assert 0 <= row <= self._full_row
+
+    @classmethod
+    def from_lines(cls, lines: List[str], on: str = "#"):
+        """Builds a bit grid from text lines.
+
+        Args:
+            lines (List[str]): Lines of the grid, all of the same length.
+            on (str, optional): Character of the set cells. Defaults to "#".
+
+        Returns:
+            BitGrid: The bit grid.
+        """
+        table = _bit_table(on)
+        n_columns = len(lines[0]) if lines else 0
+        assert all(len(line) == n_columns for line in lines)
+        # bit j is column j, so the binary string is the reversed line
+        rows = [int(line[::-1].translate(table) or "0", 2) for line in lines]
+        return cls(rows, n_columns)
+
+    @classmethod
+    def from_grid(cls, grid: Grid, predicate="#"):
+        """Builds a bit grid from the cells of a Grid matching a predicate.
+
+        Args:
+            grid (Grid): Any Grid, e.g. from `Parser.get_grid(encoding="bytes")`.
+            predicate (Callable[[Any], bool] | Any, optional): Function telling
+            whether a cell is set, or the value of the set cells. Defaults to "#".
+
+        Returns:
+            BitGrid: The bit grid.
+        """
+        n_rows, n_columns = grid.shape
+        digits = grid.mask(predicate).translate(_MASK_TO_DIGITS)
+        rows = [
+            int(digits[start: start + n_columns][::-1], 2)
+            for start in range(0, n_rows * n_columns, n_columns)
+        ]
+        return cls(rows, n_columns)
+
+    def to_grid(self, on="#", off=".", **kwargs) -> Grid:
+        """Builds a Grid with `on` for the set cells and `off` elsewhere.
+
+        Args:
+            on (Any, optional): Value of the set cells. Defaults to "#".
+            off (Any, optional): Value of the other cells. Defaults to ".".
+            **kwargs: Passed to the Grid constructor, e.g. `backend`.
+
+        Returns:
+            Grid: The grid.
+        """
+        content = [
+            [on if row >> j & 1 else off for j in range(self.n_columns)]
+            for row in self.rows
+        ]
+        return Grid(content, **kwargs)
+
+    @property
+    def shape(self):
+        return len(self.rows), self.n_columns
+
+    def _column(self, j):
+        # negative columns count from the end like Grid's, bits past the last
+        # column must stay unset
+        if not -self.n_columns <= j < self.n_columns:
+            raise IndexError(
+                f"Column {j} is out of the grid of shape {self.shape}."
+            )
+        return j % self.n_columns
+
+    def __getitem__(self, coords):
+        i, j = coords
+        return bool(self.rows[i] >> self._column(j) & 1)
+
+    def __setitem__(self, coords, value):
+        i, j = coords
+        j = self._column(j)
+        if value:
+            self.rows[i] |= 1 << j
+        else:
+            self.rows[i] &= ~(1 << j)
+
+    def _like(self, rows):
+        grid = BitGrid.__new__(BitGrid)
+        grid.rows, grid.n_columns, grid._full_row = rows, self.n_columns, self._full_row
+        return grid
+
+    def _check_shape(self, other):
+        if self.shape != other.shape:
+            raise ValueError(f"Shapes {self.shape} and {other.shape} don't match.")
+
+    def __and__(self, other):
+        self._check_shape(other)
+        return self._like([a & b for a, b in zip(self.rows, other.rows)])
+
+    def __or__(self, other):
+        self._check_shape(other)
+        return self._like([a | b for a, b in zip(self.rows, other.rows)])
+
+    def __xor__(self, other):
+        self._check_shape(other)
+        return self._like([a ^ b for a, b in zip(self.rows, other.rows)])
+
+    def __invert__(self):
+        return self._like([row ^ self._full_row for row in self.rows])
+
+    def __eq__(self, other):
+        if not isinstance(other, BitGrid):
+            return False
+        return self.shape == other.shape and self.rows == other.rows
+
+    def shift(self, di, dj):
+        """Moves all cells by (di, dj), i.e. `shifted[i, j] == self[i - di, j - dj]`.
+
+        Cells moved out of the grid are dropped and the freed cells are unset.
+
+        Args:
+            di (int): Rows to move down (up if negative).
+            dj (int): Columns to move right (left if negative).
+
+        Returns:
+            BitGrid: The shifted grid.
+        """
+        n_rows = len(self.rows)
+        if dj >= 0:
+            rows = [(row << dj) & self._full_row for row in self.rows]
+        else:
+            rows = [row >> -dj for row in self.rows]
+        if di > 0:
+            rows = [0] * min(di, n_rows) + rows[: max(n_rows - di, 0)]
+        elif di < 0:
+            rows = rows[-di:] + [0] * min(-di, n_rows)
+        return self._like(rows)
+
+    def neighbor_mask(self, connectivity=4):
+        """Returns the cells that have at least one set neighbour.
+
+        Args:
+            connectivity (int, optional): 4 or 8 neighbours. Defaults to 4.
+
+        Returns:
+            BitGrid: The OR of the grid shifted in every direction.
+        """
+        if connectivity not in DIRECTIONS:
+            raise ValueError(f"connectivity must be 4 or 8, got {connectivity}.")
+        rows = [0] * len(self.rows)
+        for di, dj in DIRECTIONS[connectivity]:
+            shifted = self.shift(di, dj).rows
+            rows = [a | b for a, b in zip(rows, shifted)]
+        return self._like(rows)
+
+    def count(self):
+        """Returns the number of set cells."""
+        return sum(_popcount(row) for row in self.rows)
+
+    def row_counts(self):
+        """Returns the number of set cells in each row."""
+        return [_popcount(row) for row in self.rows]
+
+    def col_counts(self):
+        """Returns the number of set cells in each column."""
+        counts = [0] * self.n_columns
+        for row in self.rows:
+            # visit the set bits only
+            while row:
+                low_bit = row & -row
+                counts[low_bit.bit_length() - 1] += 1
+                row ^= low_bit
+        return counts
+
+    def __str__(self):
+        return "\n".join(
+            "".join("#" if row >> j & 1 else "." for j in range(self.n_columns))
+            for row in self.rows
+        )
@@ -0,0 +1,159 @@
+import hashlib
+import inspect
+import os
+import pickle
+from functools import lru_cache, wraps
+
+DEFAULT_CACHE_DIR = os.path.join("~", ".cache", "aocutils")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _file_digest(path, chunk_size=1 << 20):
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _source_digest(func):
+    # the source changes when the parser is edited, the bytecode is a fallback for
+    # functions without source (e.g. defined in a REPL)
+    try:
+        source = inspect.getsource(func).encode()
+    except (OSError, TypeError):
+        source = func.__code__.co_code
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _package_digest():
+    # results often hold aocutils objects (e.g. Grid), whose pickled attributes
+    # change with the package
+    h = hashlib.blake2b(digest_size=16)
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    for name in sorted(os.listdir(package_dir)):
+        if name.endswith(".py"):
+            with open(os.path.join(package_dir, name), "rb") as f:
+                h.update(name.encode() + f.read())
+    return h.hexdigest()
+
+
+def _depends_digest(depends):
+    # whole modules, so that editing a method or a helper of a class in the result
+    # invalidates it too
+    h = hashlib.blake2b(digest_size=16)
+    for obj in depends:
+        module = obj if inspect.ismodule(obj) else inspect.getmodule(obj)
+        h.update(inspect.getsource(module).encode())
+    return h.hexdigest()
+
+
+def _evict(cache_dir, max_bytes):
+    # least recently used first, cache hits refresh the modification time
+    entry_list = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(".pkl"):
+            stat = entry.stat()
+            entry_list.append((stat.st_mtime, stat.st_size, entry.path))
+    total_size = sum(size for _, size, _ in entry_list)
+    for _, size, path in sorted(entry_list):
+        if total_size <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total_size -= size
+
+
+def cached_parse(
+    f_py=None, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES, depends=()
+):
+    """Decorator caching the result of an input parsing function on disk.
+
+    The decorated function must take the input file name as its first argument. The
+    result is pickled in the cache directory, keyed on the content of the input file,
+    the source of the function, the source of aocutils and the other arguments, so
+    editing either the input or the parser invalidates it. Modules that the result
+    depends on (e.g. where the classes it holds are defined) can be added to the key
+    with `depends`. When the directory grows over `max_bytes`, the least recently
+    used results are removed.
+
+    Args:
+    - f_py (callable, optional): Function to be cached.
+    If provided, the decorator is used without parentheses.
+    - cache_dir (str, optional): Directory of the cache. Defaults to the
+    `AOCUTILS_CACHE_DIR` environment variable, or "~/.cache/aocutils".
+    - max_bytes (int, optional): Size limit of the cache directory.
+    Defaults to 256 MiB.
+    - depends (Iterable[module | class | function], optional): Modules whose source
+    is part of the key, or objects standing for the module defining them.
+    Defaults to ().
+
+    Returns:
+    - the decorated function with caching functionality.
+
+    Example usage:
+    ```python
+    @cached_parse
+    def parse_input(file_name):
+        # Slow parsing
+        pass
+
+    # or
+
+    @cached_parse(cache_dir=".aoc_cache", max_bytes=10**8, depends=[Pipe])
+    def parse_input(file_name):
+        return [Pipe(line) for line in Parser(file_name).get_lines()]
+    ```
+
+    Note: A result that cannot be pickled is returned without being cached. The
+    result must not be modified by the caller if it is shared with other objects.
+    """
+    assert callable(f_py) or f_py is None
+
+    def _decorator(func):
+        digests = _source_digest(func) + _package_digest() + _depends_digest(depends)
+        code_digest = hashlib.blake2b(digests.encode(), digest_size=16).hexdigest()
+
+        @wraps(func)
+        def cached_parse_wrapper(file_name, *args, **kwargs):
+            directory = os.path.expanduser(
+                cache_dir or os.environ.get("AOCUTILS_CACHE_DIR", DEFAULT_CACHE_DIR)
+            )
+            args_digest = hashlib.blake2b(
+                repr((args, sorted(kwargs.items()))).encode(), digest_size=8
+            ).hexdigest()
+            key = f"{func.__name__}-{_file_digest(file_name)}-{code_digest}"
+            path = os.path.join(directory, f"{key}-{args_digest}.pkl")
+            try:
+                with open(path, "rb") as f:
+                    result = pickle.load(f)
+                os.utime(path)
+                return result
+            except Exception:
+                # a missing, corrupt or stale entry (e.g. a class that was renamed
+                # since) is a cache miss
+                pass
+            result = func(file_name, *args, **kwargs)
+            # written under a temporary name, so a concurrent run never reads a
+            # partial file
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(directory, exist_ok=True)
+                with open(temp_path, "wb") as f:
+                    pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, path)
+                _evict(directory, max_bytes)
+            except Exception:
+                # an unpicklable result or a full disk only means it is not cached
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            return result
+
+        return cached_parse_wrapper
+
+    return _decorator(f_py) if callable(f_py) else _decorator
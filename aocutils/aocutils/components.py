@@ -0,0 +1,124 @@
+from array import array
+from typing import List, NamedTuple, Tuple
+
+
+class UnionFind:
+    """Disjoint sets over the integers 0..n-1, with path compression and union by
+    rank.
+
+    Example usage:
+    ```python
+    sets = UnionFind(4)
+    sets.union(0, 1)
+    sets.union(2, 3)
+    print(sets.find(1) == sets.find(0))  # True
+    print(sets.find(1) == sets.find(2))  # False
+    ```
+    """
+
+    def __init__(self, n: int):
+        """Initializes n singletons.
+
+        Args:
+            n (int): Number of elements.
+        """
+        self.parent = array("q", range(n))
+        self.rank = bytearray(n)
+
+    def find(self, x: int) -> int:
+        """Returns the representative of the set containing x."""
+        parent = self.parent
+        while parent[x] != x:
+            # path halving: point every other node on the path to its grandparent
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> int:
+        """Merges the sets containing x and y, and returns the new representative."""
+        x, y = self.find(x), self.find(y)
+        if x == y:
+            return x
+        if self.rank[x] < self.rank[y]:
+            x, y = y, x
+        self.parent[y] = x
+        if self.rank[x] == self.rank[y]:
+            self.rank[x] += 1
+        return x
+
+
+class Components(NamedTuple):
+    """Result of a connected-component labelling.
+
+    Attributes:
+        labels (array): Flat array with the label (0, 1, ...) of every cell, in
+            row-major order, and -1 for the cells outside any component.
+        sizes (List[int]): Number of cells of each component.
+        bboxes (List[Tuple[int, int, int, int]]): Bounding box (i_min, i_max, j_min,
+            j_max) of each component, bounds included.
+    """
+
+    labels: array
+    sizes: List[int]
+    bboxes: List[Tuple[int, int, int, int]]
+
+
+def label_components(mask, n_rows: int, n_columns: int, connectivity=4) -> Components:
+    """Labels the connected components of the cells selected by a mask.
+
+    Cells are scanned once in row-major order and merged with their already visited
+    neighbours (up and left, plus the upper diagonals with 8-connectivity). A second
+    pass over the cells gives each component a label, in order of first appearance.
+
+    Args:
+        mask (bytes | bytearray): Flat mask with a non-zero byte for the cells to
+            label (see `Grid.mask`).
+        n_rows (int): Number of rows of the grid.
+        n_columns (int): Number of columns of the grid.
+        connectivity (int, optional): 4 or 8 neighbours. Defaults to 4.
+
+    Returns:
+        Components: Labels, sizes and bounding boxes of the components.
+    """
+    if connectivity not in (4, 8):
+        raise ValueError(f"connectivity must be 4 or 8, got {connectivity}.")
+    size = n_rows * n_columns
+    sets = UnionFind(size)
+    union = sets.union
+    for idx in range(size):
+        if not mask[idx]:
+            continue
+        j = idx % n_columns
+        up = idx - n_columns
+        if j and mask[idx - 1]:
+            union(idx, idx - 1)
+        if up >= 0:
+            if mask[up]:
+                union(idx, up)
+            if connectivity == 8:
+                if j and mask[up - 1]:
+                    union(idx, up - 1)
+                if j < n_columns - 1 and mask[up + 1]:
+                    union(idx, up + 1)
+
+    labels = array("q", [-1]) * size
+    root_labels = {}
+    sizes = []
+    bboxes = []
+    find = sets.find
+    for idx in range(size):
+        if not mask[idx]:
+            continue
+        root = find(idx)
+        i, j = divmod(idx, n_columns)
+        label = root_labels.get(root)
+        if label is None:
+            label = root_labels[root] = len(sizes)
+            sizes.append(0)
+            bboxes.append((i, i, j, j))
+        labels[idx] = label
+        sizes[label] += 1
+        i_min, i_max, j_min, j_max = bboxes[label]
+        if i > i_max or j < j_min or j > j_max:
+            bboxes[label] = (i_min, i, min(j_min, j), max(j_max, j))
+    return Components(labels, sizes, bboxes)
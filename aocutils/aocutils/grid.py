@@ -1,18 +1,133 @@
+from array import array
 from copy import deepcopy
+import io
+from functools import lru_cache
+from itertools import accumulate, chain
+from numbers import Integral
 from typing import List
 
+from .components import label_components
+from .utils import require_numpy
+
+BACKENDS = ("list", "numpy", "bytes")
+# (di, dj) steps from a cell to its neighbours, in row-major order
+DIRECTIONS = {
+    4: ((-1, 0), (0, -1), (0, 1), (1, 0)),
+    8: ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)),
+}
+
+
+def byte_table(mapping):
+    """Builds a translation table for byte-encoded grids.
+
+    Args:
+        mapping (Dict[str | int, int]): Maps symbols (characters or byte values) to
+        small integers. Other bytes are left unchanged.
+
+    Returns:
+        bytes: A table to use with `bytes.translate`.
+
+    Example usage:
+    ```python
+    table = byte_table({".": 0, "#": 1})
+    print(b"#..#".translate(table))  # b"\x01\x00\x00\x01"
+    ```
+    """
+    table = bytearray(range(256))
+    for symbol, value in mapping.items():
+        table[ord(symbol) if isinstance(symbol, str) else symbol] = value
+    return bytes(table)
+
+
+_MASK_64 = (1 << 64) - 1
+
+
+def _mix_64(x):
+    # splitmix64 finalizer, spreads the bits of x over the 64-bit output
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return x ^ (x >> 31)
+
+
+def _to_byte(value):
+    # byte-encoded grids hold integers, accept the characters they encode as well
+    return ord(value) if isinstance(value, str) else value
+
+
+def _is_cell(coords):
+    # a single (i, j) cell, as opposed to slices or arrays of the "numpy" backend
+    return (
+        isinstance(coords, tuple)
+        and len(coords) == 2
+        and isinstance(coords[0], Integral)
+        and isinstance(coords[1], Integral)
+    )
+
+
+def _row_to_bytes(row):
+    if isinstance(row, str):
+        return row.encode("latin-1")
+    if isinstance(row, (bytes, bytearray, memoryview)):
+        return bytes(row)
+    return bytes(_to_byte(elem) for elem in row)
+
+
+def _write_lines(fp, lines, encoding="latin-1"):
+    # writes one line at a time so that the whole text is never built in memory;
+    # latin-1 maps the characters of byte-encoded grids back to the same bytes
+    binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase))
+    newline = b"\n" if binary else "\n"
+    for k, line in enumerate(lines):
+        if k:
+            fp.write(newline)
+        fp.write(line.encode(encoding) if binary else line)
+
+
+@lru_cache(maxsize=None)
+def flat_offsets(n_columns, connectivity=4):
+    """Returns the flat index offsets to the neighbours of a cell.
+
+    The offsets follow the order of `DIRECTIONS[connectivity]`.
+
+    Args:
+        n_columns (int): Width of the grid.
+        connectivity (int, optional): 4 or 8 neighbours. Defaults to 4.
+
+    Returns:
+        Tuple[int]: Offsets to add to a cell id to get its neighbours' ids.
+    """
+    if connectivity not in DIRECTIONS:
+        raise ValueError(f"connectivity must be 4 or 8, got {connectivity}.")
+    return tuple(di * n_columns + dj for di, dj in DIRECTIONS[connectivity])
+
 
 class Grid:
     """Represents a 2D grid with customizable content and padding.
 
     Attributes:
-        content (List[List]]): grid represented as a list of lists.
+        content (List[List]] | numpy.ndarray): grid represented as a list of lists,
+            or as a 2D array when using the "numpy" backend. With the "bytes"
+            backend, it is a list of memoryviews on the rows of `buffer`.
         sep (str): Separator used to join elements when converting the grid to a string.
+        backend (str): Storage used for the content: "list", "numpy" or "bytes".
+        buffer (bytearray): With the "bytes" backend, all the cells with one byte per
+            cell, row after row. None for the other backends.
+        table (bytes): Translation table applied to the bytes, if any.
+        border (Any): Value read outside the grid, or None to raise an error instead.
 
     Methods:
-        __init__(self, content: List[List]] = None, sep: str = ""):
+        __init__(self, content: List[List]] = None, sep: str = "", backend="list"):
             Initializes a Grid object with optional content and separator.
 
+        from_array(cls, array: numpy.ndarray, sep: str = "") -> Grid:
+            Wraps a 2D array in a Grid without copying it.
+
+        from_rows(cls, rows: List[List], copy: bool = False) -> Grid:
+            Builds a Grid that takes ownership of its rows, without copying them.
+
+        from_bytes(cls, data: bytes | bytearray, n_columns: int) -> Grid:
+            Builds a byte-encoded Grid, one byte per cell.
+
         append_row(self, row: List):
             Appends a row to the grid.
 
@@ -22,17 +137,81 @@ class Grid:
         __str__(self) -> str:
             Returns a string representation of the grid.
 
+        iter_render(self, sep: str = None) -> Iterator[str]:
+            Yields the string representation one row at a time.
+
+        write_to(self, fp, sep: str = None):
+            Writes the string representation to a file-like object, row by row.
+
         __getitem__(self, coords: Tuple[int, int]) -> Any:
             Returns the element at the specified coordinates.
 
+        get(self, i: int, j: int, default: Any = None) -> Any:
+            Returns the element at (i, j), or default if it is outside the grid.
+
+        take(self, rows, cols) -> List | numpy.ndarray:
+            Returns the elements at many coordinates in one call.
+
+        put(self, rows, cols, values):
+            Sets the elements at many coordinates in one call.
+
+        where(self, mask) -> Tuple[array, array]:
+            Returns the coordinates of the cells selected by a mask.
+
         __setitem__(self, coords: Tuple[int, int], elem: Any):
             Sets the element at the specified coordinates.
 
         shape(self) -> Tuple[int, int]:
             Returns the shape of the grid as a tuple (n_rows, n_columns).
 
-        get_subset(self, i_min: int, i_max: int, j_min: int, j_max: int) -> Grid:
-            Returns a subset of the grid defined by the given specified range.
+        get_subset(self, i_min: int, i_max: int, j_min: int, j_max: int,
+                   view: bool = False) -> Grid | GridView:
+            Returns a subset (or a view on it) of the grid defined by the given range.
+
+        T(self) -> Grid | GridView / rotate(self, k: int = 1) / flip(self, axis=0):
+            Returns a transposed, rotated or flipped view without copying.
+
+        iter_rows(self) / iter_cols(self) -> Iterator:
+            Yields the rows or the columns without building intermediate lists.
+
+        state_hash(self) -> int:
+            Returns a 64-bit hash of the cells, updated in O(1) on each write.
+
+        step(self, rule, neighborhood: int = 8, alive: Any = "#") -> int:
+            Updates every cell from its neighbours at once (cellular automaton).
+
+        array(self) -> numpy.ndarray:
+            Returns the grid as a 2D array, for vectorized operations.
+
+        count(self, value: Any) -> int:
+            Returns the number of cells equal to value.
+
+        find_all(self, value: Any) -> List[int]:
+            Returns the flat ids of the cells equal to value.
+
+        line_counts(self, predicate) -> LineCounts:
+            Returns cached per-row and per-column counts of matching cells.
+
+        mask(self, predicate) -> bytearray:
+            Returns a flat 0/1 mask of the matching cells.
+
+        label_components(self, predicate, connectivity: int = 4) -> Components:
+            Labels the connected regions of matching cells.
+
+        index(self, i: int, j: int) -> int:
+            Returns the flat cell id `i * n_columns + j`.
+
+        coords(self, idx: int) -> Tuple[int, int]:
+            Returns the coordinates of a flat cell id.
+
+        get_flat(self, idx: int) -> Any / set_flat(self, idx: int, elem: Any):
+            Reads or writes a cell by its flat id.
+
+        neighbors(self, idx: int, connectivity: int = 4) -> List[int]:
+            Returns the flat ids of the neighbours of a cell inside the grid.
+
+        neighbors_many(self, idx_array, connectivity: int = 4) -> numpy.ndarray:
+            Returns the neighbours' flat ids of many cells at once.
 
     Example usage:
     ```python
@@ -43,20 +222,229 @@ class Grid:
     grid.pad()
     print(grid)  # "., 0, 0, .\n., 1, 1, .\n1, 2, 3, 4\n5, 6, 7, 8\n., 3, 2, .\n., 4, 3, ."  # noqa: E501
     ```
+
+    Character grids can be stored with one byte per cell, cells are then integers:
+    ```python
+    grid = Grid.from_bytes(b"#..#", n_columns=2)
+    print(grid[0, 0] == ord("#"), grid.count("#"))  # True 2
+    grid = Grid.from_bytes(b"#..#", n_columns=2, table=byte_table({".": 0, "#": 1}))
+    print(grid[1, 1])  # 1
+    ```
+
+    Cells can also be addressed by a flat id `i * n_columns + j`, which lets hot loops
+    move around with integer additions:
+    ```python
+    grid = Grid([[1, 2, 3], [4, 5, 6]])
+    idx = grid.index(0, 1)  # 1
+    print(grid.neighbors(idx))  # [0, 2, 4]
+    print([grid.get_flat(n) for n in grid.neighbors(idx)])  # [1, 3, 5]
+    ```
+
+    Padding can also be virtual, which copies nothing:
+    ```python
+    grid = Grid([[1, 2], [3, 4]], border=".")
+    print(grid[-1, 0], grid[1, 2])  # ". ."
+    ```
+
+    With the "numpy" backend, the same API is available and whole-grid work runs
+    vectorized on `grid.array`:
+    ```python
+    grid = Grid([list("#.#"), list("..#")], backend="numpy")
+    print((grid.array == "#").sum())  # 3
+    ```
     """
 
-    def __init__(self, content: List[List] = None, sep: str = ""):
+    def __init__(
+        self,
+        content: List[List] = None,
+        sep: str = "",
+        backend="list",
+        border=None,
+    ):
         """Initializes a Grid object.
 
         Args:
             content (List[List], optional): Initial grid content. Defaults to None.
             sep (str, optional): Separator for joining elements in the string
             representation. Defaults to "".
+            backend (str, optional): "list" to store the content as a list of lists,
+            "numpy" to store it as a 2D array, or "bytes" to store it in a bytearray
+            with one byte per cell. Defaults to "list".
+            border (Any, optional): If not None, reading outside the grid returns
+            this value instead of raising, as if the grid was padded with it.
+            Defaults to None.
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got '{backend}'.")
+        self.backend = backend
+        self.sep = sep
+        self.border = border
+        # derived data (e.g. line counts), valid while `_version` is `_cache_version`;
+        # writes only bump `_version`, so they don't pay for clearing the cache
+        self._cache = {}
+        self._version = 0
+        self._cache_version = 0
+        self.buffer = None
+        self.table = None
+        # Zobrist hashing is off until `state_hash` is first read
+        self._hashing = False
+        self._hash = None
+        self._hash_seed = 0
+        # second buffer of `step`, allocated on the first step
+        self._back = None
+        if backend == "bytes":
+            rows = [_row_to_bytes(row) for row in content] if content else []
+            n_columns = len(rows[0]) if rows else 0
+            assert all(len(row) == n_columns for row in rows)
+            self._set_buffer(bytearray(b"".join(rows)), n_columns)
+            return
+        if backend == "numpy":
+            np = require_numpy("The numpy backend")
+            if content is None or len(content) == 0:
+                self.content = np.empty((0, 0))
+            else:
+                self.content = np.array(content)
+                assert self.content.ndim == 2
+            return
         self.content = deepcopy(content) if content else []
         for row in self.content:
             assert len(row) == self.shape[1]
-        self.sep = sep
+
+    @classmethod
+    def from_array(cls, array, sep: str = "", border=None):
+        """Wraps a 2D array in a Grid that uses the "numpy" backend.
+
+        The array is not copied, so changes to the grid are visible in the array and
+        vice versa.
+
+        Args:
+            array (numpy.ndarray): 2D array holding the cells.
+            sep (str, optional): Separator for joining elements in the string
+            representation. Defaults to "".
+            border (Any, optional): Value read outside the grid. Defaults to None.
+
+        Returns:
+            Grid: A grid backed by `array`.
+        """
+        if array.ndim != 2:
+            raise ValueError(f"Expected a 2D array, got {array.ndim} dimensions.")
+        grid = cls(sep=sep, backend="numpy", border=border)
+        grid.content = array
+        return grid
+
+    @classmethod
+    def from_rows(cls, rows, copy: bool = False, sep: str = "", border=None):
+        """Builds a Grid that uses the "list" backend from a list of rows.
+
+        The widths are checked once for the whole grid. Unlike the constructor and
+        `append_row`, the rows are not deep-copied by default: the grid takes
+        ownership of them, so they must not be modified elsewhere afterwards.
+
+        Args:
+            rows (List[List] | Iterable[List]): Rows of the grid, all of the same
+            length. A list is used as is.
+            copy (bool, optional): If True, deep-copies the rows like the
+            constructor does. Defaults to False.
+            sep (str, optional): Separator for joining elements in the string
+            representation. Defaults to "".
+            border (Any, optional): Value read outside the grid. Defaults to None.
+
+        Returns:
+            Grid: A grid holding `rows`.
+        """
+        content = rows if isinstance(rows, list) else list(rows)
+        if content:
+            n_columns = len(content[0])
+            for row in content:
+                if len(row) != n_columns:
+                    raise ValueError(
+                        f"All rows must have {n_columns} cells, got {len(row)}."
+                    )
+        grid = cls(sep=sep, border=border)
+        grid.content = deepcopy(content) if copy else content
+        return grid
+
+    @classmethod
+    def from_bytes(cls, data, n_columns, sep: str = "", border=None, table=None):
+        """Builds a Grid that stores one byte per cell in a single buffer.
+
+        Cells are read and written as integers (0-255). The rows are memoryviews on
+        the buffer, so bulk searches can run on `grid.buffer` with `find`/`count`.
+
+        Args:
+            data (bytes | bytearray): Cells, row after row, without separators. A
+            bytearray is used as is (no copy) unless a table is given.
+            n_columns (int): Number of cells per row.
+            sep (str, optional): Separator for joining elements in the string
+            representation. Defaults to "".
+            border (Any, optional): Value read outside the grid. Defaults to None.
+            table (bytes, optional): Translation table (see `byte_table`) applied
+            to the data, e.g. to map symbols to small integers. Defaults to None.
+
+        Returns:
+            Grid: A grid using the "bytes" backend.
+        """
+        if n_columns <= 0 or len(data) % n_columns:
+            raise ValueError(
+                f"Cannot split {len(data)} bytes into rows of {n_columns} cells."
+            )
+        if table is not None:
+            buffer = bytearray(data).translate(table)
+        elif isinstance(data, bytearray):
+            buffer = data
+        else:
+            buffer = bytearray(data)
+        grid = cls(sep=sep, backend="bytes", border=border)
+        grid.table = table
+        grid._set_buffer(buffer, n_columns)
+        return grid
+
+    def _release_rows(self):
+        # the row views must be released before the buffer can be resized
+        if self.buffer is not None:
+            for row in self.content:
+                row.release()
+
+    def _set_buffer(self, buffer, n_columns):
+        self._release_rows()
+        self.buffer = buffer
+        view = memoryview(buffer)
+        self.content = [
+            view[start: start + n_columns]
+            for start in range(0, len(buffer), n_columns or 1)
+        ]
+
+    def __getstate__(self):
+        # memoryviews can't be pickled, the rows of the "bytes" backend are rebuilt
+        # from the buffer, and the scratch buffer of `step` is dropped
+        state = self.__dict__.copy()
+        state["_back"] = None
+        if self.backend == "bytes":
+            state["content"] = None
+            state["_n_columns"] = len(self.content[0]) if self.content else 0
+        return state
+
+    def __setstate__(self, state):
+        n_columns = state.pop("_n_columns", None)
+        self.__dict__.update(state)
+        if n_columns is not None:
+            self.content = []
+            self._set_buffer(self.buffer, n_columns)
+
+    @property
+    def array(self):
+        """The grid as a 2D array.
+
+        With the "numpy" backend this is the storage itself (no copy), and with the
+        "bytes" backend it is a uint8 array on the buffer (no copy either).
+        Otherwise a new array is built from the content.
+        """
+        if self.backend == "numpy":
+            return self.content
+        np = require_numpy("Grid.array")
+        if self.backend == "bytes":
+            return np.frombuffer(self.buffer, dtype=np.uint8).reshape(self.shape)
+        return np.array(self.content)
 
     def append_row(self, row: list):
         """Appends a row to the grid.
@@ -64,6 +452,24 @@ class Grid:
         Args:
             row (List): Row to be appended to the grid.
         """
+        self._version += 1
+        self._hash = None
+        if self.backend == "numpy":
+            np = require_numpy("The numpy backend")
+            if self.content.size:
+                assert len(row) == self.shape[1]
+                self.content = np.vstack([self.content, [row]])
+            else:
+                self.content = np.array([row])
+            return
+        if self.backend == "bytes":
+            row = _row_to_bytes(row)
+            if self.content:
+                assert len(row) == self.shape[1]
+            self._release_rows()
+            self.buffer.extend(row)
+            self._set_buffer(self.buffer, len(row))
+            return
         if self.content:
             assert len(row) == self.shape[1]
         self.content.append(deepcopy(row))
@@ -75,6 +481,19 @@ class Grid:
             fill_value (Union[int, str], optional): Fill value for padding.
             Defaults to ".".
         """
+        self._version += 1
+        self._hash = None
+        if self.backend == "numpy":
+            np = require_numpy("The numpy backend")
+            self.content = np.pad(self.content, 1, constant_values=fill_value)
+            return
+        if self.backend == "bytes":
+            fill_byte = bytes([_to_byte(fill_value)])
+            n_columns = self.shape[1] + 2
+            rows = [fill_byte + bytes(row) + fill_byte for row in self.content]
+            edge = fill_byte * n_columns
+            self._set_buffer(bytearray(b"".join([edge, *rows, edge])), n_columns)
+            return
         # pad two columns, then two rows
         for i, row in enumerate(self.content):
             self.content[i] = [fill_value] + row + [fill_value]
@@ -83,24 +502,758 @@ class Grid:
         self.content = [first_row] + self.content + [last_row]
 
     def __str__(self):
-        rows_string = "\n".join(
-            self.sep.join(str(elem) for elem in line_list) for line_list in self.content
-        )
+        rows_string = "\n".join(self.iter_render())
         return rows_string
 
+    def iter_render(self, sep=None):
+        """Yields the rows of the string representation one at a time.
+
+        Args:
+            sep (str, optional): Separator between the elements of a row. Defaults to
+            None, i.e. `self.sep`.
+
+        Yields:
+            str: A row of the grid, without the trailing newline.
+        """
+        sep = self.sep if sep is None else sep
+        if self.backend == "bytes" and self.table is None:
+            # the bytes are the characters themselves
+            for row in self.content:
+                line = row.tobytes().decode("latin-1")
+                yield sep.join(line) if sep else line
+            return
+        for line_list in self.content:
+            yield sep.join(str(elem) for elem in line_list)
+
+    def write_to(self, fp, sep=None):
+        """Writes the grid to a file-like object, one row at a time.
+
+        The output is the same as `str(grid)`, but only one row is held in memory at
+        a time. Byte-encoded grids write their row buffers directly to binary files,
+        and encode their text in latin-1 otherwise so that each cell is written back
+        as its byte (other grids use UTF-8).
+
+        Args:
+            fp (IO): Text or binary file-like object.
+            sep (str, optional): Separator between the elements of a row. Defaults to
+            None, i.e. `self.sep`.
+        """
+        sep = self.sep if sep is None else sep
+        binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase))
+        if binary and self.backend == "bytes" and self.table is None and not sep:
+            for k, row in enumerate(self.content):
+                if k:
+                    fp.write(b"\n")
+                fp.write(row)
+            return
+        encoding = "latin-1" if self.backend == "bytes" else "utf-8"
+        _write_lines(fp, self.iter_render(sep), encoding)
+
     def __getitem__(self, coords):
+        if self.border is not None and _is_cell(coords):
+            i, j = coords
+            return self.get(i, j, self.border)
+        if self.backend == "numpy":
+            return self.content[coords]
         i, j = coords
         return self.content[i][j]
 
+    def get(self, i, j, default=None):
+        """Returns the element at (i, j), or `default` if it is outside the grid.
+
+        Unlike indexing, negative indices are treated as outside the grid.
+
+        Args:
+            i (int): Row index.
+            j (int): Column index.
+            default (Any, optional): Value returned outside the grid. Defaults to None.
+
+        Returns:
+            Any: The element at (i, j) or `default`.
+        """
+        n_rows, n_columns = self.shape
+        if 0 <= i < n_rows and 0 <= j < n_columns:
+            if self.backend == "numpy":
+                return self.content[i, j]
+            return self.content[i][j]
+        return default
+
     def __setitem__(self, coords, elem):
-        i, j = coords
-        self.content[i][j] = elem
+        if self.border is not None and _is_cell(coords):
+            # reads outside the grid give the border, so writes there can't wrap
+            # around like negative indices do (slices and masks of the "numpy"
+            # backend are left to numpy)
+            i, j = coords
+            n_rows, n_columns = self.shape
+            if not (0 <= i < n_rows and 0 <= j < n_columns):
+                raise IndexError(
+                    f"({i}, {j}) is out of the grid of shape {self.shape}."
+                )
+        self._version += 1
+        if self.backend == "bytes":
+            elem = _to_byte(elem)
+        hash_idx = None
+        if self._hash is not None and _is_cell(coords):
+            i, j = coords
+            n_rows, n_columns = self.shape
+            hash_idx = (i % n_rows) * n_columns + j % n_columns
+            old = self.get_flat(hash_idx)
+        if self.backend == "numpy":
+            self.content[coords] = elem
+        else:
+            i, j = coords
+            self.content[i][j] = elem
+        # the hash is only updated once the write succeeded
+        if self._hash is not None:
+            if hash_idx is None:
+                # slices or masks with the "numpy" backend, rehash on the next read
+                self._hash = None
+            else:
+                new = self.get_flat(hash_idx)
+                self._hash ^= self._zobrist(hash_idx, old)
+                self._hash ^= self._zobrist(hash_idx, new)
+
+    def take(self, rows, cols):
+        """Returns the elements at many coordinates in one call.
+
+        Args:
+            rows (Sequence[int]): Row indices.
+            cols (Sequence[int]): Column indices, same length as `rows`.
+
+        Returns:
+            List | numpy.ndarray: Elements at (rows[k], cols[k]), as an array with the
+            "numpy" backend.
+        """
+        if self.backend == "numpy":
+            return self.content[rows, cols]
+        # the rows of the "bytes" backend are memoryviews, indexed like lists
+        content = self.content
+        return [content[i][j] for i, j in zip(rows, cols)]
+
+    def put(self, rows, cols, values):
+        """Sets the elements at many coordinates in one call.
+
+        Args:
+            rows (Sequence[int]): Row indices.
+            cols (Sequence[int]): Column indices, same length as `rows`.
+            values (Any | Sequence): A single value for all the cells, or one value
+            per cell. Strings are single values.
+        """
+        self._version += 1
+        if isinstance(values, str) or not hasattr(values, "__len__"):
+            values = [values] * len(rows)
+        if self._hash is not None or self.border is not None:
+            # keep the hash up to date and reject cells outside a bordered grid,
+            # cell by cell
+            for i, j, elem in zip(rows, cols, values):
+                self[i, j] = elem
+            return
+        if self.backend == "numpy":
+            self.content[rows, cols] = values
+            return
+        content = self.content
+        if self.backend == "bytes":
+            for i, j, elem in zip(rows, cols, values):
+                content[i][j] = _to_byte(elem)
+            return
+        for i, j, elem in zip(rows, cols, values):
+            content[i][j] = elem
+
+    def where(self, mask):
+        """Returns the coordinates of the cells selected by a mask.
+
+        The result can be passed to `take` and `put`, e.g.
+        `grid.put(*grid.where("O"), ".")`.
+
+        Args:
+            mask (Callable[[Any], bool] | Any | bytes | numpy.ndarray): A predicate
+            or a value (see `mask`), a flat 0/1 mask as returned by `mask` or
+            `flood_fill`, or a 2D boolean array of the grid's shape (any backend).
+
+        Returns:
+            Tuple[array, array]: Row and column indices of the selected cells, in
+            row-major order (numpy arrays with the "numpy" backend).
+        """
+        n_columns = self.shape[1]
+        if self.backend == "numpy":
+            np = require_numpy("The numpy backend")
+            if callable(mask) or not isinstance(mask, (np.ndarray, bytes, bytearray)):
+                mask = self.mask(mask)
+            if isinstance(mask, (bytes, bytearray)):
+                mask = np.frombuffer(mask, dtype=np.uint8).reshape(self.shape)
+            return np.nonzero(mask)
+        if getattr(mask, "ndim", None) == 2:
+            # a 2D boolean array, e.g. a comparison on `grid.array`
+            if mask.shape != self.shape:
+                raise ValueError(
+                    f"Expected a mask of shape {self.shape}, got {mask.shape}."
+                )
+            mask = mask.astype("uint8").tobytes()
+        elif not isinstance(mask, (bytes, bytearray)):
+            mask = self.mask(mask)
+        rows, cols = array("q"), array("q")
+        idx = mask.find(1)
+        while idx != -1:
+            i, j = divmod(idx, n_columns)
+            rows.append(i)
+            cols.append(j)
+            idx = mask.find(1, idx + 1)
+        return rows, cols
+
+    def enable_hash(self, seed=0):
+        """Starts keeping a Zobrist hash of the cells, see `state_hash`.
+
+        Args:
+            seed (int, optional): Seed of the keys, grids hashed with different
+            seeds have unrelated hashes. Defaults to 0.
+        """
+        self._hashing = True
+        self._hash_seed = seed
+        self._hash = None
+
+    @property
+    def state_hash(self):
+        """A 64-bit hash of the cells, e.g. to detect repeated states.
+
+        Each (cell, value) pair has a pseudo-random 64-bit key and the hash is the XOR
+        of the keys of all cells, so writing a cell updates it in O(1). The first read
+        hashes the whole grid and turns on the updates (see `enable_hash`). Only
+        writes through the Grid's methods are tracked.
+
+        The keys are derived from Python's `hash` of the values, so hashes of string
+        cells differ between runs unless PYTHONHASHSEED is set.
+        """
+        if not self._hashing:
+            self.enable_hash()
+        if self._hash is None:
+            state_hash = 0
+            for idx, elem in enumerate(self._iter_cells()):
+                state_hash ^= self._zobrist(idx, elem)
+            self._hash = state_hash
+        return self._hash
+
+    def _zobrist(self, idx, elem):
+        value_key = _mix_64((hash(elem) ^ self._hash_seed) & _MASK_64)
+        return _mix_64((idx * 0x9E3779B97F4A7C15 + value_key) & _MASK_64)
+
+    def step(self, rule, neighborhood=8, alive="#"):
+        """Updates every cell at once from the number of its live neighbours.
+
+        The new generation is written into a second buffer, allocated on the first
+        step, and the two buffers are swapped, so no grid is allocated per step.
+        Cells outside the grid are live if the grid has a live border.
+
+        With the "numpy" backend, neighbour counts are sums of shifted arrays and
+        `rule` is called once with whole arrays, so it must be vectorized, e.g.
+        `lambda cells, n: np.where((n == 3) | ((cells == "#") & (n == 2)), "#", ".")`.
+
+        Args:
+            rule (Callable[[Any, int], Any]): Gives the new value of a cell from its
+            current value and its number of live neighbours.
+            neighborhood (int, optional): 4 or 8 neighbours. Defaults to 8.
+            alive (Callable[[Any], bool] | Any, optional): Function telling whether
+            a cell is live, or the value of live cells. Defaults to "#".
+
+        Returns:
+            int: Number of cells that changed, 0 once a fixed point is reached.
+
+        Example usage:
+        ```python
+        def life(cell, n_alive):
+            return "#" if n_alive == 3 or (cell == "#" and n_alive == 2) else "."
+
+        while grid.step(life):
+            pass
+        ```
+        """
+        if neighborhood not in DIRECTIONS:
+            raise ValueError(f"neighborhood must be 4 or 8, got {neighborhood}.")
+        self._version += 1
+        if self.backend == "numpy":
+            return self._step_numpy(rule, neighborhood, alive)
+        n_rows, n_columns = self.shape
+        back_rows, live = self._get_back_buffers(n_rows, n_columns)
+        self._fill_live(live, alive)
+        if self.border is None:
+            live_border = 0
+        elif callable(alive):
+            live_border = int(bool(alive(self.border)))
+        else:
+            live_border = int(self.border == alive)
+        directions = DIRECTIONS[neighborhood]
+        offsets = flat_offsets(n_columns, neighborhood)
+        steps = tuple(zip(directions, offsets))
+
+        # rules may return characters for byte-encoded grids
+        to_byte = _to_byte if self.backend == "bytes" else None
+        hashing = self._hash is not None
+        # XOR of the hash updates, applied once the whole generation is written
+        hash_delta = 0
+        n_changed = 0
+        for i, (row, back_row) in enumerate(zip(self.content, back_rows)):
+            inner_row = 0 < i < n_rows - 1
+            for j, elem in enumerate(row):
+                idx = i * n_columns + j
+                if inner_row and 0 < j < n_columns - 1:
+                    n_alive = sum([live[idx + offset] for offset in offsets])
+                else:
+                    n_alive = sum(
+                        [
+                            live[idx + offset]
+                            if 0 <= i + di < n_rows and 0 <= j + dj < n_columns
+                            else live_border
+                            for (di, dj), offset in steps
+                        ]
+                    )
+                new_elem = rule(elem, n_alive)
+                if to_byte is not None:
+                    new_elem = to_byte(new_elem)
+                back_row[j] = new_elem
+                if new_elem != elem:
+                    n_changed += 1
+                    if hashing:
+                        hash_delta ^= self._zobrist(idx, elem)
+                        hash_delta ^= self._zobrist(idx, new_elem)
+
+        self._swap_buffers()
+        if hashing:
+            self._hash ^= hash_delta
+        return n_changed
+
+    def _get_back_buffers(self, n_rows, n_columns):
+        # the back rows and the live mask of `step`, allocated for the first step
+        # and reused as long as the shape is the same
+        n_cells = n_rows * n_columns
+        if self.backend == "bytes":
+            if (
+                self._back is None
+                or len(self._back[0]) != n_cells
+                or len(self._back[1][0]) != n_columns
+            ):
+                back_buffer = bytearray(n_cells)
+                view = memoryview(back_buffer)
+                back_rows = [
+                    view[start: start + n_columns]
+                    for start in range(0, n_cells, n_columns)
+                ]
+                self._back = (back_buffer, back_rows, bytearray(n_cells))
+            return self._back[1], self._back[2]
+        if (
+            self._back is None
+            or len(self._back[0]) != n_rows
+            or len(self._back[0][0]) != n_columns
+        ):
+            back_rows = [[None] * n_columns for _ in range(n_rows)]
+            self._back = (back_rows, bytearray(n_cells))
+        return self._back
+
+    def _fill_live(self, live, alive):
+        # writes the 0/1 mask of the live cells into `live`, in place
+        if self.backend == "bytes" and not callable(alive):
+            table = bytearray(256)
+            table[_to_byte(alive)] = 1
+            live[:] = self.buffer.translate(table)
+            return
+        if not callable(alive):
+            value = alive
+
+            def alive(elem):
+                return elem == value
+
+        for idx, elem in enumerate(self._iter_cells()):
+            live[idx] = bool(alive(elem))
+
+    def _swap_buffers(self):
+        if self.backend == "bytes":
+            back_buffer, back_rows, live = self._back
+            self._back = (self.buffer, self.content, live)
+            self.buffer, self.content = back_buffer, back_rows
+        else:
+            back_rows, live = self._back
+            self._back = (self.content, live)
+            self.content = back_rows
+
+    def _step_numpy(self, rule, neighborhood, alive):
+        np = require_numpy("The numpy backend")
+        n_rows, n_columns = self.shape
+        content = self.content
+        if (
+            self._back is None
+            or self._back[0].shape != content.shape
+            or self._back[0].dtype != content.dtype
+        ):
+            self._back = (
+                np.empty_like(content),
+                np.zeros((n_rows + 2, n_columns + 2), dtype=np.int8),
+                np.zeros(content.shape, dtype=np.int8),
+            )
+        back, live, n_alive = self._back
+        # live cells with a one-cell frame for the border, then shifted sums
+        if self.border is None:
+            live_border = 0
+        elif callable(alive):
+            live_border = int(bool(alive(self.border)))
+        else:
+            live_border = int(self.border == alive)
+        live.fill(live_border)
+        if callable(alive):
+            live[1:-1, 1:-1] = np.vectorize(alive, otypes=[bool])(content)
+        else:
+            live[1:-1, 1:-1] = content == alive
+        n_alive.fill(0)
+        for di, dj in DIRECTIONS[neighborhood]:
+            n_alive += live[1 + di: 1 + di + n_rows, 1 + dj: 1 + dj + n_columns]
+        back[...] = rule(content, n_alive)
+
+        changed = back != content
+        n_changed = int(np.count_nonzero(changed))
+        if self._hash is not None:
+            for idx in np.flatnonzero(changed).tolist():
+                self._hash ^= self._zobrist(idx, content.flat[idx])
+                self._hash ^= self._zobrist(idx, back.flat[idx])
+        self._back = (content, live, n_alive)
+        self.content = back
+        return n_changed
+
+    def _iter_cells(self):
+        # all the cells in row-major order, as plain Python objects
+        if self.backend == "bytes":
+            return iter(self.buffer)
+        if self.backend == "numpy":
+            return chain.from_iterable(self.content.tolist())
+        return chain.from_iterable(self.content)
 
     @property
     def shape(self):
+        if self.backend == "numpy":
+            return self.content.shape
         return len(self.content), len(self.content[0])
 
-    def get_subset(self, i_min, i_max, j_min, j_max):
+    def count(self, value):
+        """Counts the cells equal to the given value.
+
+        Args:
+            value (Any): Value to look for.
+
+        Returns:
+            int: Number of cells equal to `value`.
+        """
+        if self.backend == "numpy":
+            return int((self.content == value).sum())
+        if self.backend == "bytes":
+            return self.buffer.count(_to_byte(value))
+        return sum(row.count(value) for row in self.content)
+
+    def find_all(self, value):
+        """Finds the cells equal to the given value.
+
+        Args:
+            value (Any): Value to look for.
+
+        Returns:
+            List[int]: Flat ids of the matching cells, in row-major order.
+        """
+        if self.backend == "numpy":
+            return (self.content == value).ravel().nonzero()[0].tolist()
+        if self.backend == "bytes":
+            # bytearray.find runs in C, much faster than a loop over the cells
+            byte, buffer = _to_byte(value), self.buffer
+            idx_list = []
+            idx = buffer.find(byte)
+            while idx != -1:
+                idx_list.append(idx)
+                idx = buffer.find(byte, idx + 1)
+            return idx_list
+        n_columns = self.shape[1]
+        return [
+            i * n_columns + j
+            for i, row in enumerate(self.content)
+            for j, elem in enumerate(row)
+            if elem == value
+        ]
+
+    def line_counts(self, predicate):
+        """Counts the cells matching a predicate in every row and column.
+
+        The result is cached until the grid is modified through its methods, so
+        repeated queries with the same predicate don't rescan the grid. Modifying
+        `content` directly requires calling `clear_cache`.
+
+        Args:
+            predicate (Callable[[Any], bool] | Any): Function telling whether a cell
+            matches, or a value that matching cells are equal to. Values are
+            faster, especially with the "numpy" backend.
+
+        Returns:
+            LineCounts: Per-row and per-column counts with their prefix sums.
+        """
+        if self._cache_version != self._version:
+            self._cache.clear()
+            self._cache_version = self._version
+        key = ("line_counts", predicate)
+        if key not in self._cache:
+            self._cache[key] = LineCounts(*self._count_lines(predicate))
+        return self._cache[key]
+
+    def _count_lines(self, predicate):
+        n_columns = self.shape[1]
+        if self.backend == "numpy":
+            np = require_numpy("The numpy backend")
+            if callable(predicate):
+                hits = np.vectorize(predicate, otypes=[bool])(self.content)
+            else:
+                hits = self.content == predicate
+            return hits.sum(axis=1).tolist(), hits.sum(axis=0).tolist()
+        if self.backend == "bytes" and not callable(predicate):
+            predicate = _to_byte(predicate)
+        row_counts = []
+        col_counts = [0] * n_columns
+        for row in self.content:
+            if callable(predicate):
+                hits = [j for j, elem in enumerate(row) if predicate(elem)]
+            else:
+                hits = [j for j, elem in enumerate(row) if elem == predicate]
+            row_counts.append(len(hits))
+            for j in hits:
+                col_counts[j] += 1
+        return row_counts, col_counts
+
+    def mask(self, predicate):
+        """Computes a flat mask of the cells matching a predicate.
+
+        Args:
+            predicate (Callable[[Any], bool] | Any): Function telling whether a cell
+            matches, or a value that matching cells are equal to.
+
+        Returns:
+            bytearray: 1 for the matching cells and 0 elsewhere, in row-major order.
+        """
+        if self.backend == "numpy":
+            np = require_numpy("The numpy backend")
+            if callable(predicate):
+                hits = np.vectorize(predicate, otypes=[bool])(self.content)
+            else:
+                hits = self.content == predicate
+            return bytearray(hits.astype(np.uint8).tobytes())
+        if self.backend == "bytes" and not callable(predicate):
+            table = bytearray(256)
+            table[_to_byte(predicate)] = 1
+            return self.buffer.translate(table)
+        if not callable(predicate):
+            value = predicate
+
+            def predicate(elem):
+                return elem == value
+
+        return bytearray(predicate(elem) for row in self.content for elem in row)
+
+    def label_components(self, predicate, connectivity=4):
+        """Labels the connected regions of the cells matching a predicate.
+
+        This is a single union-find pass over the flat cell ids, instead of one
+        flood fill per region.
+
+        Args:
+            predicate (Callable[[Any], bool] | Any): Function telling whether a cell
+            belongs to a region, or a value that such cells are equal to.
+            connectivity (int, optional): 4 or 8 neighbours. Defaults to 4.
+
+        Returns:
+            Components: `labels` (flat array, -1 outside the regions), `sizes` and
+            `bboxes` (i_min, i_max, j_min, j_max) of the regions.
+
+        Example usage:
+        ```python
+        grid = Grid([list("#.#"), list("#.."), list("..#")])
+        labels, sizes, bboxes = grid.label_components("#")
+        print(sizes)  # [2, 1, 1]
+        print(bboxes[0])  # (0, 1, 0, 0)
+        ```
+        """
+        return label_components(self.mask(predicate), *self.shape, connectivity)
+
+    def clear_cache(self):
+        """Drops the cached data derived from the cells, e.g. `line_counts`."""
+        self._version += 1
+
+    def index(self, i, j):
+        """Returns the flat id of the cell at (i, j), i.e. `i * n_columns + j`."""
+        return i * self.shape[1] + j
+
+    def coords(self, idx):
+        """Returns the coordinates (i, j) of the cell with the given flat id."""
+        return divmod(idx, self.shape[1])
+
+    def get_flat(self, idx):
+        """Returns the element of the cell with the given flat id."""
+        if self.backend == "bytes":
+            return self.buffer[idx]
+        if self.backend == "numpy":
+            return self.content.flat[idx]
+        i, j = divmod(idx, len(self.content[0]))
+        return self.content[i][j]
+
+    def set_flat(self, idx, elem):
+        """Sets the element of the cell with the given flat id."""
+        self._version += 1
+        if self.backend == "bytes":
+            elem = _to_byte(elem)
+        if self._hash is not None:
+            old = self.get_flat(idx)
+        if self.backend == "bytes":
+            self.buffer[idx] = elem
+        elif self.backend == "numpy":
+            self.content.flat[idx] = elem
+        else:
+            i, j = divmod(idx, len(self.content[0]))
+            self.content[i][j] = elem
+        # the hash is only updated once the write succeeded
+        if self._hash is not None:
+            new = self.get_flat(idx)
+            self._hash ^= self._zobrist(idx, old) ^ self._zobrist(idx, new)
+
+    def neighbor_offsets(self, connectivity=4):
+        """Returns the precomputed flat offsets to the neighbours of a cell.
+
+        Only valid for cells away from the edges, see `neighbors` otherwise.
+
+        Args:
+            connectivity (int, optional): 4 or 8 neighbours. Defaults to 4.
+
+        Returns:
+            Tuple[int]: Offsets in the order of `DIRECTIONS[connectivity]`.
+        """
+        return flat_offsets(self.shape[1], connectivity)
+
+    def neighbors(self, idx, connectivity=4):
+        """Returns the flat ids of the neighbours of a cell that are inside the grid.
+
+        Args:
+            idx (int): Flat id of the cell.
+            connectivity (int, optional): 4 or 8 neighbours. Defaults to 4.
+
+        Returns:
+            List[int]: Flat ids of the neighbours, in the order of
+            `DIRECTIONS[connectivity]`.
+        """
+        n_rows, n_columns = self.shape
+        offsets = flat_offsets(n_columns, connectivity)
+        i, j = divmod(idx, n_columns)
+        if 0 < i < n_rows - 1 and 0 < j < n_columns - 1:
+            return [idx + offset for offset in offsets]
+        return [
+            idx + offset
+            for (di, dj), offset in zip(DIRECTIONS[connectivity], offsets)
+            if 0 <= i + di < n_rows and 0 <= j + dj < n_columns
+        ]
+
+    def neighbors_many(self, idx_array, connectivity=4):
+        """Returns the flat ids of the neighbours of many cells at once.
+
+        Args:
+            idx_array (Sequence[int] | numpy.ndarray): Flat ids of the cells.
+            connectivity (int, optional): 4 or 8 neighbours. Defaults to 4.
+
+        Returns:
+            numpy.ndarray: Array of shape (len(idx_array), connectivity) with the
+            neighbours in the order of `DIRECTIONS[connectivity]`, and -1 for the
+            neighbours that are outside the grid.
+        """
+        np = require_numpy("Grid.neighbors_many")
+        n_rows, n_columns = self.shape
+        idx_array = np.asarray(idx_array, dtype=np.int64)
+        i, j = np.divmod(idx_array, n_columns)
+        steps = np.array(DIRECTIONS[connectivity])
+        neighbor_i = i[:, None] + steps[:, 0]
+        neighbor_j = j[:, None] + steps[:, 1]
+        inside = (
+            (neighbor_i >= 0)
+            & (neighbor_i < n_rows)
+            & (neighbor_j >= 0)
+            & (neighbor_j < n_columns)
+        )
+        offsets = np.array(flat_offsets(n_columns, connectivity))
+        return np.where(inside, idx_array[:, None] + offsets, -1)
+
+    def _full_view(self):
+        n_rows, n_columns = self.shape
+        return GridView(self, 0, n_rows - 1, 0, n_columns - 1)
+
+    @property
+    def T(self):
+        """The transposed grid as a view, i.e. `grid.T[i, j] == grid[j, i]`.
+
+        With the "numpy" backend this is an array view wrapped in a Grid.
+        """
+        if self.backend == "numpy":
+            return Grid.from_array(self.content.T, sep=self.sep, border=self.border)
+        return self._full_view().T
+
+    def flip(self, axis=0):
+        """Returns a view of the grid flipped upside down (axis 0) or left to right
+        (axis 1).
+
+        Args:
+            axis (int, optional): 0 to reverse the rows, 1 to reverse the columns.
+            Defaults to 0.
+
+        Returns:
+            Grid | GridView: The flipped view, an array view wrapped in a Grid with
+            the "numpy" backend.
+        """
+        if self.backend == "numpy":
+            np = require_numpy("The numpy backend")
+            array = np.flip(self.content, axis)
+            return Grid.from_array(array, sep=self.sep, border=self.border)
+        return self._full_view().flip(axis)
+
+    def rotate(self, k=1):
+        """Returns a view of the grid rotated by 90 degrees counterclockwise k times.
+
+        This follows `numpy.rot90`.
+
+        Args:
+            k (int, optional): Number of quarter turns, negative for clockwise.
+            Defaults to 1.
+
+        Returns:
+            Grid | GridView: The rotated view, an array view wrapped in a Grid with
+            the "numpy" backend.
+        """
+        if self.backend == "numpy":
+            np = require_numpy("The numpy backend")
+            array = np.rot90(self.content, k)
+            return Grid.from_array(array, sep=self.sep, border=self.border)
+        return self._full_view().rotate(k)
+
+    def iter_rows(self):
+        """Yields the rows of the grid without copying them.
+
+        Yields:
+            Sequence: The row itself (a list, a memoryview or an array view).
+        """
+        yield from self.content
+
+    def iter_cols(self):
+        """Yields the columns of the grid without building intermediate lists.
+
+        Yields:
+            Iterable: A strided memoryview on the buffer with the "bytes" backend, an
+            array view with the "numpy" backend, and an iterator over the cells of
+            the column otherwise.
+        """
+        n_columns = self.shape[1]
+        if self.backend == "numpy":
+            yield from self.content.T
+        elif self.backend == "bytes":
+            view = memoryview(self.buffer)
+            for j in range(n_columns):
+                yield view[j::n_columns]
+        else:
+            for j in range(n_columns):
+                yield (row[j] for row in self.content)
+
+    def get_subset(self, i_min, i_max, j_min, j_max, view=False):
         """Returns a subset of the grid defined by the specified range.
 
         Args:
@@ -108,11 +1261,379 @@ class Grid:
             i_max (int): Maximum row index.
             j_min (int): Minimum column index.
             j_max (int): Maximum column index.
+            view (bool, optional): If True, returns a view that shares storage with
+            this grid instead of a copy. Defaults to False.
 
         Returns:
-            Grid: Subset of the grid.
+            Grid | GridView: Subset of the grid.
         """
+        if self.backend == "numpy":
+            window = self.content[i_min: i_max + 1, j_min: j_max + 1]
+            # slicing an array already gives a view
+            window = window if view else window.copy()
+            return Grid.from_array(window, sep=self.sep, border=self.border)
+        if view:
+            return GridView(self, i_min, i_max, j_min, j_max)
+        if self.backend == "bytes":
+            rows = [self.content[i][j_min: j_max + 1] for i in range(i_min, i_max + 1)]
+            subset = Grid.from_bytes(
+                b"".join(rows), j_max - j_min + 1, sep=self.sep, border=self.border
+            )
+            subset.table = self.table
+            return subset
         subset = Grid(
-            [self.content[i][j_min: j_max + 1] for i in range(i_min, i_max + 1)]
+            [self.content[i][j_min: j_max + 1] for i in range(i_min, i_max + 1)],
+            border=self.border,
         )
         return subset
+
+
+class GridView:
+    """A rectangular window on a Grid that shares the grid's storage.
+
+    Indices are relative to the window and are translated into parent coordinates on
+    each access, so nothing is copied when the view is created. Writes go through to
+    the parent grid. Reading outside the window returns the parent's border if it has
+    one, otherwise it raises an IndexError.
+
+    The translation is `parent_i = origin[0] + a * i + b * j` and
+    `parent_j = origin[1] + c * i + d * j` with `steps = ((a, b), (c, d))`, so views
+    can also be transposed, rotated or flipped without copying.
+
+    Attributes:
+        parent (Grid): The grid that owns the cells.
+        origin (Tuple[int, int]): Parent coordinates of the view's cell (0, 0).
+        steps (Tuple[Tuple[int, int], Tuple[int, int]]): How the parent coordinates
+            change with the view's coordinates (see above).
+        shape (Tuple[int, int]): Shape of the view (n_rows, n_columns).
+        sep (str): Separator used to join elements when converting to a string.
+
+    Example usage:
+    ```python
+    grid = Grid([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    view = grid.get_subset(1, 2, 1, 2, view=True)
+    print(view[0, 0])  # 5
+    view[0, 0] = 0
+    print(grid[1, 1])  # 0
+    subset = view.copy()  # independent Grid
+    print(view.T[0, 1])  # 8
+    ```
+    """
+
+    def __init__(self, parent, i_min, i_max, j_min, j_max):
+        """Initializes a view on the given range of a grid (inclusive bounds).
+
+        Args:
+            parent (Grid | GridView): Grid to look into. Views of views are
+            flattened so that they always point at the grid that owns the cells.
+            i_min (int): Minimum row index.
+            i_max (int): Maximum row index.
+            j_min (int): Minimum column index.
+            j_max (int): Maximum column index.
+        """
+        n_rows, n_columns = parent.shape
+        if not (0 <= i_min <= i_max < n_rows and 0 <= j_min <= j_max < n_columns):
+            raise IndexError(
+                f"Range [{i_min}, {i_max}] x [{j_min}, {j_max}] is out of the "
+                f"grid of shape {parent.shape}."
+            )
+        self.shape = (i_max - i_min + 1, j_max - j_min + 1)
+        if isinstance(parent, GridView):
+            self.origin = parent._to_parent(i_min, j_min)
+            self.steps = parent.steps
+            parent = parent.parent
+        else:
+            self.origin = (i_min, j_min)
+            self.steps = ((1, 0), (0, 1))
+        self.parent = parent
+        self.sep = parent.sep
+
+    def _transformed(self, origin, steps, shape):
+        view = GridView.__new__(GridView)
+        view.parent, view.sep = self.parent, self.sep
+        view.origin, view.steps, view.shape = origin, steps, shape
+        return view
+
+    def _to_parent(self, i, j):
+        if not (0 <= i < self.shape[0] and 0 <= j < self.shape[1]):
+            raise IndexError(f"({i}, {j}) is out of the view of shape {self.shape}.")
+        (a, b), (c, d) = self.steps
+        return self.origin[0] + a * i + b * j, self.origin[1] + c * i + d * j
+
+    @property
+    def T(self):
+        """The transposed view, i.e. `view.T[i, j] == view[j, i]`."""
+        (a, b), (c, d) = self.steps
+        return self._transformed(self.origin, ((b, a), (d, c)), self.shape[::-1])
+
+    def flip(self, axis=0):
+        """Returns the view flipped upside down (axis 0) or left to right (axis 1).
+
+        Args:
+            axis (int, optional): 0 to reverse the rows, 1 to reverse the columns.
+            Defaults to 0.
+
+        Returns:
+            GridView: The flipped view.
+        """
+        (a, b), (c, d) = self.steps
+        n_rows, n_columns = self.shape
+        if axis == 0:
+            origin, steps = self._to_parent(n_rows - 1, 0), ((-a, b), (-c, d))
+        elif axis == 1:
+            origin, steps = self._to_parent(0, n_columns - 1), ((a, -b), (c, -d))
+        else:
+            raise ValueError(f"axis must be 0 or 1, got {axis}.")
+        return self._transformed(origin, steps, self.shape)
+
+    def rotate(self, k=1):
+        """Returns the view rotated by 90 degrees counterclockwise k times.
+
+        This follows `numpy.rot90`, i.e. `view.rotate()[i, j] == view[j, m - 1 - i]`
+        where m is the number of columns.
+
+        Args:
+            k (int, optional): Number of quarter turns, negative for clockwise.
+            Defaults to 1.
+
+        Returns:
+            GridView: The rotated view.
+        """
+        view = self
+        for _ in range(k % 4):
+            view = view.flip(axis=1).T
+        return view
+
+    def iter_rows(self):
+        """Yields the rows of the view, each as an iterator over its cells."""
+        n_rows, n_columns = self.shape
+        for i in range(n_rows):
+            yield (self[i, j] for j in range(n_columns))
+
+    def iter_cols(self):
+        """Yields the columns of the view, each as an iterator over its cells."""
+        n_rows, n_columns = self.shape
+        for j in range(n_columns):
+            yield (self[i, j] for i in range(n_rows))
+
+    def __getitem__(self, coords):
+        if self.parent.border is not None:
+            i, j = coords
+            if not (0 <= i < self.shape[0] and 0 <= j < self.shape[1]):
+                return self.parent.border
+        return self.parent[self._to_parent(*coords)]
+
+    def __setitem__(self, coords, elem):
+        if self.parent.border is not None:
+            i, j = coords
+            if not (0 <= i < self.shape[0] and 0 <= j < self.shape[1]):
+                raise IndexError(
+                    f"({i}, {j}) is out of the view of shape {self.shape}."
+                )
+        self.parent[self._to_parent(*coords)] = elem
+
+    def __str__(self):
+        return "\n".join(self.iter_render())
+
+    def iter_render(self, sep=None):
+        """Yields the rows of the string representation one at a time.
+
+        Args:
+            sep (str, optional): Separator between the elements of a row. Defaults to
+            None, i.e. `self.sep`.
+
+        Yields:
+            str: A row of the view, without the trailing newline.
+        """
+        sep = self.sep if sep is None else sep
+        n_rows, n_columns = self.shape
+        parent = self.parent
+        # the cells of byte-encoded grids are the characters' codes
+        to_str = chr if parent.backend == "bytes" and parent.table is None else str
+        for i in range(n_rows):
+            yield sep.join(to_str(self[i, j]) for j in range(n_columns))
+
+    def write_to(self, fp, sep=None):
+        """Writes the view to a text or binary file-like object, one row at a time.
+
+        Args:
+            fp (IO): Text or binary file-like object.
+            sep (str, optional): Separator between the elements of a row. Defaults to
+            None, i.e. `self.sep`.
+        """
+        encoding = "latin-1" if self.parent.backend == "bytes" else "utf-8"
+        _write_lines(fp, self.iter_render(sep), encoding)
+
+    def get_subset(self, i_min, i_max, j_min, j_max, view=False):
+        """Returns a subset of the view defined by the specified range.
+
+        Args:
+            i_min (int): Minimum row index.
+            i_max (int): Maximum row index.
+            j_min (int): Minimum column index.
+            j_max (int): Maximum column index.
+            view (bool, optional): If True, returns another view on the parent grid
+            instead of a copy. Defaults to False.
+
+        Returns:
+            Grid | GridView: Subset of the view.
+        """
+        subset = GridView(self, i_min, i_max, j_min, j_max)
+        return subset if view else subset.copy()
+
+    def copy(self):
+        """Copies the cells of the view into a new Grid.
+
+        Returns:
+            Grid: A grid that does not share storage with the parent.
+        """
+        (i_min, j_min), (n_rows, n_columns) = self.origin, self.shape
+        if self.steps == ((1, 0), (0, 1)):
+            return self.parent.get_subset(
+                i_min, i_min + n_rows - 1, j_min, j_min + n_columns - 1
+            )
+        subset = Grid(
+            [list(row) for row in self.iter_rows()],
+            sep=self.sep,
+            backend=self.parent.backend,
+            border=self.parent.border,
+        )
+        subset.table = self.parent.table
+        return subset
+
+
+class LineCounts:
+    """Counts of matching cells per row and per column of a grid, with prefix sums.
+
+    The prefix sums make range queries O(1), e.g. the number of empty rows between
+    two rows.
+
+    Attributes:
+        row_counts (array): Number of matching cells in each row.
+        col_counts (array): Number of matching cells in each column.
+        row_prefix (array): `row_prefix[i]` is the number of matching cells in the
+            rows before row i (length n_rows + 1).
+        col_prefix (array): Same as `row_prefix` for the columns.
+        empty_row_prefix (array): `empty_row_prefix[i]` is the number of rows
+            without matching cells before row i (length n_rows + 1).
+        empty_col_prefix (array): Same as `empty_row_prefix` for the columns.
+
+    Example usage:
+    ```python
+    grid = Grid([list("#.."), list("..."), list("..#")])
+    counts = grid.line_counts("#")
+    print(counts.empty_rows_between(0, 2))  # 1
+    print(counts.empty_cols_between(0, 2))  # 1
+    print(counts.cells_in_rows(1, 2))  # 1
+    ```
+    """
+
+    def __init__(self, row_counts, col_counts):
+        """Initializes the counts and computes their prefix sums.
+
+        Args:
+            row_counts (Iterable[int]): Number of matching cells in each row.
+            col_counts (Iterable[int]): Number of matching cells in each column.
+        """
+        self.row_counts = array("q", row_counts)
+        self.col_counts = array("q", col_counts)
+        self.row_prefix = array("q", accumulate(self.row_counts, initial=0))
+        self.col_prefix = array("q", accumulate(self.col_counts, initial=0))
+        self.empty_row_prefix = array(
+            "q", accumulate((count == 0 for count in self.row_counts), initial=0)
+        )
+        self.empty_col_prefix = array(
+            "q", accumulate((count == 0 for count in self.col_counts), initial=0)
+        )
+
+    @staticmethod
+    def _between(prefix, a, b):
+        lo, hi = (a, b) if a <= b else (b, a)
+        return prefix[hi + 1] - prefix[lo]
+
+    def empty_rows(self):
+        """Returns the indices of the rows without matching cells."""
+        return [i for i, count in enumerate(self.row_counts) if count == 0]
+
+    def empty_cols(self):
+        """Returns the indices of the columns without matching cells."""
+        return [j for j, count in enumerate(self.col_counts) if count == 0]
+
+    def empty_rows_between(self, i1, i2):
+        """Returns the number of empty rows between rows i1 and i2 (inclusive)."""
+        return self._between(self.empty_row_prefix, i1, i2)
+
+    def empty_cols_between(self, j1, j2):
+        """Returns the number of empty columns between columns j1 and j2 (inclusive)."""
+        return self._between(self.empty_col_prefix, j1, j2)
+
+    def cells_in_rows(self, i1, i2):
+        """Returns the number of matching cells between rows i1 and i2 (inclusive)."""
+        return self._between(self.row_prefix, i1, i2)
+
+    def cells_in_cols(self, j1, j2):
+        """Returns the number of matching cells in columns j1 to j2 (inclusive)."""
+        return self._between(self.col_prefix, j1, j2)
+
+
+class GridHistory:
+    """Remembers the first step at which each grid state was seen, to find cycles.
+
+    Attributes:
+        first_seen (Dict[int, int]): First step of each state hash.
+        cycle (Tuple[int, int] | None): (start, length) of the cycle once a state
+            repeats, None before.
+
+    Example usage:
+    ```python
+    history = GridHistory()
+    step = 0
+    while history.record(grid.state_hash, step) is None:
+        simulate(grid)  # some update of the grid
+        step += 1
+    start, length = history.cycle
+    # the state after 10**9 steps is the one after this many steps
+    print(history.equivalent_step(10**9))
+    ```
+    """
+
+    def __init__(self):
+        self.first_seen = {}
+        self.cycle = None
+
+    def record(self, state_hash, step):
+        """Records the state reached at a step.
+
+        Args:
+            state_hash (int): Hash of the state, e.g. `grid.state_hash`.
+            step (int): Step at which the state was reached.
+
+        Returns:
+            int | None: The step at which the state was first seen, or None if the
+            state is new.
+        """
+        first_step = self.first_seen.get(state_hash)
+        if first_step is None:
+            self.first_seen[state_hash] = step
+        elif self.cycle is None:
+            self.cycle = (first_step, step - first_step)
+        return first_step
+
+    def equivalent_step(self, step):
+        """Maps any step to an already recorded step with the same state.
+
+        Args:
+            step (int): Any step, possibly far in the future.
+
+        Returns:
+            int: A recorded step with the same state as `step`.
+
+        Raises:
+            ValueError: If no cycle has been found yet.
+        """
+        if self.cycle is None:
+            raise ValueError("No cycle has been found yet.")
+        start, length = self.cycle
+        if step < start:
+            return step
+        return start + (step - start) % length
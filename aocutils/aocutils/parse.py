@@ -1,8 +1,51 @@
 from __future__ import annotations
-from typing import List, Callable, Match
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate, repeat
+from typing import Any, Iterator, List, Callable, Match, NamedTuple
+import mmap as mmap_module
+import os
 import re
+import tempfile
 
 from .grid import Grid
+from .template import compile_template
+from .tiled import TiledGrid
+from .utils import require_numpy
+
+
+class RegexMatches(NamedTuple):
+    """Matches of `Parser.apply_regex(..., whole_buffer=True, flat=True)`.
+
+    Attributes:
+    - lines (array): Line index of each match.
+    - cols (array): Column of the start of each match in its line.
+    - values (List[Any]): Matched substrings (or groups, like `re.findall`), or the
+      match objects with `return_loc=True`.
+    """
+
+    lines: array
+    cols: array
+    values: List[Any]
+
+
+class IntegerRows(NamedTuple):
+    """Integers of `Parser.get_integers(as_array=True)`, stored flat.
+
+    Attributes:
+    - values (array): All the values (typecode "q"), row after row.
+    - offsets (array): Start of each row in `values`, plus `len(values)`, so that
+      row k is `values[offsets[k]: offsets[k + 1]]`.
+    """
+
+    values: array
+    offsets: array
+
+    def row(self, k: int):
+        """Returns the values of row k."""
+        return self.values[self.offsets[k]: self.offsets[k + 1]]
 
 
 class Parser:
@@ -10,22 +53,50 @@ class Parser:
 
     Attributes:
     - data (str): The input text data.
-    - lines (List[str]): individual lines of the input data.
-    - sections (List[str]): sections separated by double newline characters.
+    - lines (List[str] | None): individual lines of the input data, cached by
+      `get_lines()`.
+    - sections (List[str] | None): sections separated by double newline characters,
+      cached by `get_sections()`.
+    - line_offsets (array | None): start offset of each line in `data`, cached by
+      `get_line_offsets()`.
     - grid (Grid): An instance of the Grid class for handling tabular data.
 
     Methods:
-    - __init__(self, file_name: str | None = None, text: str | None = None):
+    - __init__(self, file_name: str | None = None, text: str | None = None,
+      mmap=False):
       Initializes the Parser object with either a file name or direct text input.
+      With `mmap=True`, the file is mapped instead of read.
+
+    - get_line(self, k: int) -> str / get_line_view(self, k: int) -> memoryview:
+      Returns one line, decoded or as raw bytes.
+
+    - parse_template(self, template: str, columns=False, strict=True):
+      Parses every line with a template compiled into a single regex.
+
+    - map_sections(self, fn, workers=None) / map_lines(self, fn, workers=None):
+      Applies a function to every section or line in a pool of processes.
+
+    - iter_lines(self) / iter_sections(self) / iter_integers(self, sep=None) /
+      iter_regex(self, pattern, return_loc=False):
+      Streaming versions of the getters, reading the file in chunks.
 
     - get_lines(self) -> List[str]:
       Returns a list containing individual lines of the input data.
 
+    - get_line_offsets(self) -> array:
+      Returns the start offset of each line in `data`.
+
+    - clear_cache(self):
+      Drops the cached lines, sections and offsets.
+
     - get_sections(self) -> List[str]:
       Returns a list containing sections separated by double newline characters.
 
-    - get_grid(self, sep="", dtype: Callable = str) -> Grid:
-      Parses the input data into a Grid object.
+    - get_grid(self, sep="", dtype: Callable = str, encoding="str", table=None) -> Grid:
+      Parses the input data into a Grid object, optionally with one byte per cell.
+
+    - get_tiled_grid(self, path=None, tile_size=64) -> TiledGrid:
+      Builds a memory-mapped, byte-encoded grid, streaming the input file.
 
     - apply_regex(self, pattern: str, return_loc=False) -> Iterator[Match[str]]:
       Applies a regular expression pattern against each line of the input data.
@@ -38,21 +109,28 @@ class Parser:
     - Iterator[Match[str]]: An iterator containing match groups for each line.
     """
 
-    data: str
-    lines: List[str]
-    sections: List[str]
+    lines: List[str] | None
+    sections: List[str] | None
+    line_offsets: array | None
     grid: Grid
 
     def __init__(
         self,
         file_name: str | None = None,
         text: str | None = None,
+        mmap: bool = False,
+        lazy: bool = False,
     ):
         """Initializes the Parser object with either a file name or direct text input.
 
         Args:
         - file_name (str | None): The name of the file to read data from. Default None.
         - text (str | None): The direct input text. Default is None.
+        - mmap (bool): If True, the file is mapped read-only instead of read, and
+            lines and sections are decoded on demand from the mapped bytes. The file
+            must be UTF-8 with "\n" line endings. Default is False.
+        - lazy (bool): If True, the file is only read when `data` or a getter needs
+            it, so the `iter_*` methods can stream it. Default is False.
 
         Raises:
         - ValueError: If both file_name and text are provided.
@@ -61,31 +139,191 @@ class Parser:
             raise ValueError("Only one of file_name or text must be provided.")
         elif file_name is None and text is None:
             raise ValueError("One of file_name or text must not be None.")
-        if file_name:
-            with open(file_name, "r") as f:
-                self.data = f.read()
+        if mmap and not file_name:
+            raise ValueError("mmap=True needs a file_name.")
+        self.file_name = file_name
+        self.lines = None
+        self.sections = None
+        self.line_offsets = None
+        self._lazy = lazy
+        self._data = None
+        self._mmap = None
+        # start offsets of the lines in the mapped file, plus a sentinel
+        self._line_starts = None
+        # (start, end) offsets of the sections in the mapped file
+        self._section_bounds = None
+        if mmap:
+            self._map_file(file_name)
+        elif file_name:
+            if not lazy:
+                self._data = self._read_file()
         else:
-            self.data = text
+            self._data = text.strip()
+
+    def _map_file(self, file_name: str):
+        with open(file_name, "rb") as f:
+            # an empty file cannot be mapped
+            if f.seek(0, 2):
+                self._mmap = mmap_module.mmap(
+                    f.fileno(), 0, access=mmap_module.ACCESS_READ
+                )
+            else:
+                self._mmap = b""
+        # same bounds as `str.strip()` for ASCII whitespace, without copying
+        mm = self._mmap
+        start, end = 0, len(mm)
+        while start < end and mm[start] in b" \t\n\r\x0b\x0c":
+            start += 1
+        while end > start and mm[end - 1] in b" \t\n\r\x0b\x0c":
+            end -= 1
+        self._start, self._end = start, end
+
+    def _read_file(self) -> str:
+        with open(self.file_name, "r") as f:
+            return f.read().strip()
+
+    @property
+    def data(self) -> str:
+        """The input text, stripped. Decoded (or read in lazy mode) on first access."""
+        if self._data is None:
+            if self._mmap is None:
+                self._data = self._read_file()
+            else:
+                self._data = self._mmap[self._start: self._end].decode()
+        return self._data
+
+    @data.setter
+    def data(self, value: str):
+        self._data = value
+
+    def _get_line_starts(self) -> array:
+        if self._line_starts is None:
+            self._line_starts = _scan_line_starts(self._mmap, self._start, self._end)
+        return self._line_starts
 
-        self.data = self.data.strip()
+    def _get_section_bounds(self) -> List[tuple]:
+        if self._section_bounds is None:
+            self._section_bounds = _scan_section_bounds(
+                self._mmap, self._start, self._end
+            )
+        return self._section_bounds
+
+    def get_line_view(self, k: int) -> memoryview:
+        """Returns the raw bytes of line k without copying them in mmap mode.
+
+        The views must be released before `close()` is called.
+
+        Args:
+        - k (int): Index of the line.
+
+        Returns:
+        - memoryview: The bytes of the line, without the newline.
+        """
+        if self._mmap is None:
+            return memoryview(self.get_lines()[k].encode())
+        starts = self._get_line_starts()
+        return memoryview(self._mmap)[starts[k]: starts[k + 1] - 1]
+
+    def get_line(self, k: int) -> str:
+        """Returns line k, decoded on demand in mmap mode.
+
+        Args:
+        - k (int): Index of the line.
+
+        Returns:
+        - str: The line, without the newline.
+        """
+        if self._mmap is None:
+            return self.get_lines()[k]
+        starts = self._get_line_starts()
+        return self._mmap[starts[k]: starts[k + 1] - 1].decode()
+
+    def close(self):
+        """Unmaps the file in mmap mode. The decoded data stays available."""
+        if self._mmap is not None and not isinstance(self._mmap, bytes):
+            self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def get_lines(self) -> List[str]:
         """Returns a list containing individual lines of the input data.
 
+        The list is computed once and cached in `lines`, so it is shared between the
+        calls and must not be modified.
+
         Returns:
         - List[str]: A list of strings representing individual lines.
         """
-        return self.data.split("\n")
+        if self.lines is None:
+            if self._mmap is not None and self._data is None:
+                mm, starts = self._mmap, self._get_line_starts()
+                self.lines = [
+                    mm[starts[k]: starts[k + 1] - 1].decode()
+                    for k in range(len(starts) - 1)
+                ]
+            else:
+                self.lines = self.data.split("\n")
+        return self.lines
 
     def get_sections(self) -> List[str]:
         """Returns a list containing sections separated by double newline characters.
 
+        The list is computed once and cached in `sections`, so it is shared between
+        the calls and must not be modified.
+
         Returns:
         - List[str]: A list of strings representing sections.
         """
-        return self.data.split("\n\n")
+        if self.sections is None:
+            if self._mmap is not None and self._data is None:
+                mm = self._mmap
+                self.sections = [
+                    mm[start:end].decode() for start, end in self._get_section_bounds()
+                ]
+            else:
+                self.sections = self.data.split("\n\n")
+        return self.sections
+
+    def get_line_offsets(self) -> array:
+        """Returns the start offset of each line in `data`.
 
-    def get_grid(self, sep="", dtype: Callable = str) -> Grid:
+        The array has one more item, `len(data) + 1`, so that line k is
+        `data[offsets[k]: offsets[k + 1] - 1]`. It is cached in `line_offsets`.
+
+        Returns:
+        - array: Offsets (typecode "q"), in characters.
+        """
+        if self.line_offsets is None:
+            offsets = array("q", [0])
+            offsets.extend(accumulate(len(line) + 1 for line in self.get_lines()))
+            self.line_offsets = offsets
+        return self.line_offsets
+
+    def clear_cache(self):
+        """Drops the cached lines, sections and offsets to free memory.
+
+        In mmap and lazy modes, the decoded `data` is dropped too, it is decoded or
+        read again when needed.
+        """
+        self.lines = None
+        self.sections = None
+        self.line_offsets = None
+        self._line_starts = None
+        self._section_bounds = None
+        if self._mmap is not None or self._lazy:
+            self._data = None
+
+    def get_grid(
+        self,
+        sep="",
+        dtype: Callable = str,
+        encoding: str = "str",
+        table: bytes | None = None,
+    ) -> Grid:
         """Parses the input data into a Grid object with an optional separator and
         data type for each cell.
 
@@ -93,55 +331,468 @@ class Parser:
         - sep (str): The separator to use. Default is an empty string.
         - dtype (Callable): The data type conversion function for each cell.
             Default is str.
+        - encoding (str): "str" to split the lines into cells, or "bytes" to make
+            each byte of the UTF-8 encoded lines a cell of a byte-encoded Grid, i.e.
+            one cell per ASCII character (`sep` and `dtype` are then ignored).
+            Default is "str".
+        - table (bytes | None): With `encoding="bytes"`, a translation table mapping
+            symbols to small ints (see `byte_table`). Default is None.
 
         Returns:
         - Grid: An instance of the Grid class containing the parsed data.
         """
+        if encoding == "bytes":
+            return self._get_byte_grid(table)
+        if encoding != "str":
+            raise ValueError(f"encoding must be 'str' or 'bytes', got '{encoding}'.")
         line_list = self.get_lines()
-        grid = Grid()
+        row_list = []
         for line in line_list:
             if line.strip():
                 line_as_list = line.split(sep) if sep else line.split()
-                line_as_list = list(map(dtype, line_as_list))
-                grid.append_row(line_as_list)
-        return grid
+                if dtype is not str:
+                    line_as_list = list(map(dtype, line_as_list))
+                row_list.append(line_as_list)
+        # the rows are new lists, so the grid can own them without copying
+        return Grid.from_rows(row_list)
+
+    def _get_byte_grid(self, table: bytes | None = None) -> Grid:
+        # the cells are the UTF-8 bytes of the lines, as they are in the file
+        if self._mmap is not None:
+            # copied straight from the mapped bytes
+            mm, starts = self._mmap, self._get_line_starts()
+            line_list = [
+                mm[starts[k]: starts[k + 1] - 1] for k in range(len(starts) - 1)
+            ]
+            line_list = [line for line in line_list if line.strip()]
+        else:
+            line_list = [line.encode() for line in self.get_lines() if line.strip()]
+        if not line_list:
+            raise ValueError("The input has no lines.")
+        n_columns = len(line_list[0])
+        for line in line_list:
+            if len(line) != n_columns:
+                raise ValueError(
+                    f"All lines must have {n_columns} bytes, got {bytes(line)!r}."
+                )
+        return Grid.from_bytes(b"".join(line_list), n_columns, table=table)
+
+    def get_tiled_grid(self, path: str | None = None, tile_size: int = 64) -> TiledGrid:
+        """Builds a memory-mapped grid with one byte per cell.
+
+        With a file input, the file is read again line by line and the cells are
+        written straight to the tiles, so the grid is never held in memory.
+
+        Args:
+        - path (str | None): Where to create the grid file. Default is None, i.e. an
+            anonymous temporary file.
+        - tile_size (int): Side of the square tiles, a power of two. Default is 64.
 
-    def get_integers(self, sep: str | None = None) -> List[List[int]]:
+        Returns:
+        - TiledGrid: The grid, open for reading and writing. Close it when done.
+        """
+        if self.file_name:
+            return TiledGrid.from_text_file(self.file_name, path, tile_size)
+        line_list = [line for line in self.get_lines() if line.strip()]
+        return TiledGrid.from_lines(line_list, path, tile_size)
+
+    def get_integers(
+        self, sep: str | None = None, as_array: bool | str = False
+    ) -> List[List[int]] | IntegerRows | Any:
         """Extracts numeric values from the lines.
 
         Args:
             separator (str): Separator used to split values within each line.
             Defaults to ",".
+            as_array (bool | str): If True, returns the values in a flat
+            `array("q")` with the row offsets, instead of nested lists. With
+            "numpy", returns a 2-D int64 array if all rows have the same length,
+            and int64 arrays with the row offsets otherwise. With a separator, the
+            numbers (optionally signed) are found in a single pass over `data`, so
+            the separator itself is not checked. Defaults to False.
 
         Returns:
             list: A list of lists containing numeric values extracted from the lines.
+            IntegerRows | numpy.ndarray: With `as_array`.
         """
-        line_list = self.get_lines()
+        if as_array not in (False, True, "numpy"):
+            raise ValueError(f"as_array must be a bool or 'numpy', got {as_array!r}.")
+        if not as_array:
+            line_list = self.get_lines()
+            return [_line_integers(line, sep) for line in line_list]
         if sep is None:
-            return [list(map(int, [ch for ch in line.strip()])) for line in line_list]
-        sep = r"\s*"+sep+r"\s*"
-        return [list(map(int, re.split(sep, line.strip()))) for line in line_list]
+            rows = self._get_digit_array()
+        else:
+            rows = self._get_number_array()
+        if as_array != "numpy":
+            return rows
+        np = require_numpy("get_integers(as_array='numpy')")
+        values = np.frombuffer(rows.values, dtype=np.int64)
+        offsets = np.frombuffer(rows.offsets, dtype=np.int64)
+        n_rows = len(offsets) - 1
+        lengths = np.diff(offsets)
+        if n_rows and (lengths == lengths[0]).all():
+            return values.reshape(n_rows, lengths[0])
+        return IntegerRows(values, offsets)
+
+    def _get_digit_array(self) -> IntegerRows:
+        # one digit per character, like `_line_integers` without a separator
+        line_list = [line.strip() for line in self.get_lines()]
+        digits = "".join(line_list).encode()
+        if digits and not digits.isdigit():
+            raise ValueError("All characters must be digits when sep is None.")
+        offsets = array("q", [0])
+        offsets.extend(accumulate(map(len, line_list)))
+        values = array("q", array("b", digits.translate(_DIGIT_TABLE)))
+        return IntegerRows(values, offsets)
+
+    def _get_number_array(self) -> IntegerRows:
+        # the newlines are matched as empty tokens, which mark the end of the rows
+        token_list = _NUMBER_OR_NEWLINE.findall(self.data)
+        values = array("q", map(int, filter(None, token_list)))
+        offsets = array("q", [0])
+        pos = 0
+        for n_ends in range(1, token_list.count("") + 1):
+            pos = token_list.index("", pos) + 1
+            offsets.append(pos - n_ends)
+        offsets.append(len(values))
+        return IntegerRows(values, offsets)
 
     def apply_regex(
-        self, pattern: str, return_loc=False
-    ) -> List[str] | List[Match[str]]:
+        self, pattern: str, return_loc=False, whole_buffer=False, flat=False
+    ) -> List[str] | List[Match[str]] | RegexMatches:
         """Applies a regex pattern against each line of the input data.
 
         Args:
         - pattern (str): The regular expression pattern to apply.
         - return_loc (bool): If True, returns match groups along with their locations.
+        - whole_buffer (bool): If True, runs a single search over `data` (with
+            `re.MULTILINE`, so `^` and `$` still work per line) and maps each match
+            to its line with `get_line_offsets()`. This avoids the per-line overhead
+            on inputs with many short lines. A match is given to the line where it
+            starts, so patterns that can match a newline (e.g. `\\s`) may behave
+            differently. Match objects are then located in `data`, not in the line.
+            Default is False.
+        - flat (bool): With `whole_buffer=True`, returns the matches as flat arrays
+            instead of grouping them by line. Default is False.
 
         Returns:
         - List[List[str]] | List[List[Match[str]]]: if `return_loc=True`, an iterator
         containing match groups for each line. Otherwise, a list of matched substrings.
+        - RegexMatches: if `flat=True`, the line, column and value of each match.
         """
+        if whole_buffer:
+            return self._apply_regex_buffer(pattern, return_loc, flat)
+        if flat:
+            raise ValueError("flat=True needs whole_buffer=True.")
         # I think some regex patters don't behave the same with findall and finditer !
         line_list = self.get_lines()
-        match_grp_list = []
-        for line in line_list:
-            if return_loc:
-                match_grp = list(re.finditer(pattern, line))
+        return [_line_matches(pattern, line, return_loc) for line in line_list]
+
+    def _apply_regex_buffer(self, pattern, return_loc, flat):
+        regex = _compile_multiline(pattern)
+        offsets = self.get_line_offsets()
+        n_lines = len(offsets) - 1
+        # same values as `re.findall`
+        if return_loc:
+            value = None
+        elif regex.groups == 0:
+            value = re.Match.group
+        elif regex.groups == 1:
+            def value(match):
+                return match.group(1) or ""
+        else:
+            def value(match):
+                return match.groups("")
+        k = 0
+        if flat:
+            line_array, col_array, value_list = array("q"), array("q"), []
+        else:
+            match_grp_list = [[] for _ in range(n_lines)]
+        for match in regex.finditer(self.data):
+            start = match.start()
+            # matches come in order, so the search starts from the previous line
+            if start >= offsets[k + 1]:
+                k = bisect_right(offsets, start, k) - 1
+            elem = match if value is None else value(match)
+            if flat:
+                line_array.append(k)
+                col_array.append(start - offsets[k])
+                value_list.append(elem)
             else:
-                match_grp = re.findall(pattern, line)
-            match_grp_list.append(match_grp)
+                match_grp_list[k].append(elem)
+        if flat:
+            return RegexMatches(line_array, col_array, value_list)
         return match_grp_list
+
+    def parse_template(
+        self, template: str, columns: bool = False, strict: bool = True
+    ) -> List[NamedTuple] | dict:
+        """Parses every line with a template such as "Card {id:d}: {win:ints}".
+
+        The template is compiled once (and cached) into a single regex, which is run
+        over the whole input. See `Template` for the field types.
+
+        Args:
+        - template (str): Template of a line, with `{name:type}` fields.
+        - columns (bool): If True, returns a dict of columns instead of records.
+            Default is False.
+        - strict (bool): If True, a non-empty line that does not match raises a
+            ValueError. Otherwise it is skipped. Default is True.
+
+        Returns:
+        - List[NamedTuple] | dict: The records, or the columns keyed on field name.
+        """
+        return compile_template(template).parse(
+            self.data, columns=columns, strict=strict
+        )
+
+    def map_sections(
+        self, fn: Callable, workers: int | None = None, chunksize: int | None = None
+    ) -> list:
+        """Applies a function to every section, in a pool of processes.
+
+        The workers get contiguous byte ranges of the input and read them
+        themselves: from the file in mmap mode, or from a temporary copy of `data`
+        otherwise. Only the results are pickled.
+
+        Args:
+        - fn (Callable): Function taking a section (str). It must be picklable,
+            i.e. defined at the top level of a module.
+        - workers (int | None): Number of processes. 1 runs `fn` in this process.
+            Default is None, i.e. the number of CPUs.
+        - chunksize (int | None): Number of sections sent to a worker at once.
+            Default is None, i.e. about 4 batches per worker.
+
+        Returns:
+        - list: The results, in the order of the sections.
+        """
+        return self._map_parts(fn, "\n\n", workers, chunksize)
+
+    def map_lines(
+        self, fn: Callable, workers: int | None = None, chunksize: int | None = None
+    ) -> list:
+        """Applies a function to every line, in a pool of processes.
+
+        See `map_sections`, lines are shipped to the workers in the same way.
+
+        Args:
+        - fn (Callable): Function taking a line (str), picklable.
+        - workers (int | None): Number of processes. Default is the number of CPUs.
+        - chunksize (int | None): Number of lines sent to a worker at once.
+            Default is None, i.e. about 4 batches per worker.
+
+        Returns:
+        - list: The results, in the order of the lines.
+        """
+        return self._map_parts(fn, "\n", workers, chunksize)
+
+    def _map_parts(self, fn, sep, workers, chunksize):
+        if workers == 1:
+            part_list = self.get_lines() if sep == "\n" else self.get_sections()
+            return [fn(part) for part in part_list]
+        temp_path = None
+        try:
+            if self._mmap is not None:
+                path, buf = self.file_name, self._mmap
+                start, end = self._start, self._end
+            else:
+                buf = self.data.encode()
+                with tempfile.NamedTemporaryFile(delete=False) as f:
+                    f.write(buf)
+                path = temp_path = f.name
+                start, end = 0, len(buf)
+            if sep == "\n":
+                starts = _scan_line_starts(buf, start, end)
+                bounds = [
+                    (starts[k], starts[k + 1] - 1) for k in range(len(starts) - 1)
+                ]
+            else:
+                bounds = _scan_section_bounds(buf, start, end)
+            n_workers = workers or os.cpu_count() or 1
+            if chunksize is None:
+                chunksize = -(-len(bounds) // (4 * n_workers))
+            batch_list = [
+                (bounds[k][0], bounds[min(k + chunksize, len(bounds)) - 1][1])
+                for k in range(0, len(bounds), chunksize)
+            ]
+            with ProcessPoolExecutor(n_workers) as pool:
+                result_list = pool.map(
+                    _map_range,
+                    repeat(fn),
+                    repeat(path),
+                    [batch_start for batch_start, _ in batch_list],
+                    [batch_end for _, batch_end in batch_list],
+                    repeat(sep),
+                )
+                return [result for results in result_list for result in results]
+        finally:
+            if temp_path is not None:
+                os.remove(temp_path)
+
+    def _iter_chunks(self, chunk_size: int) -> Iterator[str]:
+        if self._data is not None or not self.file_name:
+            yield self.data
+            return
+        with open(self.file_name, "r") as f:
+            chunk = f.read(chunk_size)
+            while chunk:
+                yield chunk
+                chunk = f.read(chunk_size)
+
+    def _iter_split(self, sep: str, chunk_size: int) -> Iterator[str]:
+        """Yields the parts of `data.split(sep)`, reading the input in chunks.
+
+        A part is only yielded once some non-whitespace text follows it, since the
+        whitespace at the end of the input is stripped, like in `__init__`.
+        """
+        # pieces of the part being read, joined once it is complete so that a part
+        # longer than a chunk is not copied again for every chunk
+        carry_pieces = []
+        # a separator can straddle two chunks by up to len(sep) - 1 characters
+        overlap = len(sep) - 1
+        started = False
+        pending = []
+        yielded = False
+        for chunk in self._iter_chunks(chunk_size):
+            if not started:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                started = True
+            if overlap and carry_pieces:
+                last_piece = carry_pieces.pop()
+                carry_pieces.append(last_piece[:-overlap])
+                chunk = last_piece[-overlap:] + chunk
+            part_list = chunk.split(sep)
+            if len(part_list) == 1:
+                carry_pieces.append(chunk)
+                continue
+            carry_pieces.append(part_list[0])
+            part_list[0] = "".join(carry_pieces)
+            # the last part may continue in the next chunk
+            carry_pieces = [part_list.pop()]
+            for part in part_list:
+                if part.strip():
+                    yield from pending
+                    yielded = yielded or bool(pending)
+                    pending = [part]
+                else:
+                    pending.append(part)
+        tail = sep.join(pending + ["".join(carry_pieces)]).rstrip()
+        if tail or not yielded:
+            yield from tail.split(sep)
+
+    def iter_lines(self, chunk_size: int = 1 << 16) -> Iterator[str]:
+        """Yields the lines of the input data one at a time.
+
+        With a file input (in lazy or mmap mode), the file is read in chunks, so
+        only about one chunk and one line are held in memory.
+
+        Args:
+        - chunk_size (int): Number of characters read at once. Default is 65536.
+
+        Returns:
+        - Iterator[str]: The lines, like `get_lines()`.
+        """
+        return self._iter_split("\n", chunk_size)
+
+    def iter_sections(self, chunk_size: int = 1 << 16) -> Iterator[str]:
+        """Yields the sections of the input data one at a time.
+
+        Args:
+        - chunk_size (int): Number of characters read at once. Default is 65536.
+
+        Returns:
+        - Iterator[str]: The sections, like `get_sections()`.
+        """
+        return self._iter_split("\n\n", chunk_size)
+
+    def iter_integers(
+        self, sep: str | None = None, chunk_size: int = 1 << 16
+    ) -> Iterator[List[int]]:
+        """Yields the numeric values of each line, like `get_integers()`.
+
+        Args:
+        - sep (str | None): Separator used to split values within each line.
+        - chunk_size (int): Number of characters read at once. Default is 65536.
+
+        Returns:
+        - Iterator[List[int]]: The values of each line.
+        """
+        for line in self.iter_lines(chunk_size):
+            yield _line_integers(line, sep)
+
+    def iter_regex(
+        self, pattern: str, return_loc=False, chunk_size: int = 1 << 16
+    ) -> Iterator[List[str] | List[Match[str]]]:
+        """Yields the matches of a regex pattern in each line, like `apply_regex()`.
+
+        Args:
+        - pattern (str): The regular expression pattern to apply.
+        - return_loc (bool): If True, yields match objects instead of substrings.
+        - chunk_size (int): Number of characters read at once. Default is 65536.
+
+        Returns:
+        - Iterator[List[str] | List[Match[str]]]: The matches of each line.
+        """
+        for line in self.iter_lines(chunk_size):
+            yield _line_matches(pattern, line, return_loc)
+
+
+def _scan_line_starts(buf, start: int, end: int) -> array:
+    # one scan of the bytes for the newlines, with a sentinel at `end + 1`
+    starts = array("q", [start])
+    find = buf.find
+    pos = find(b"\n", start, end)
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = find(b"\n", pos + 1, end)
+    starts.append(end + 1)
+    return starts
+
+
+def _scan_section_bounds(buf, start: int, end: int) -> List[tuple]:
+    # one scan of the bytes for the blank lines, like `str.split("\n\n")`
+    bounds = []
+    pos = buf.find(b"\n\n", start, end)
+    while pos != -1:
+        bounds.append((start, pos))
+        start = pos + 2
+        pos = buf.find(b"\n\n", start, end)
+    bounds.append((start, end))
+    return bounds
+
+
+def _map_range(fn: Callable, path: str, start: int, end: int, sep: str) -> list:
+    # runs in a worker: reads a byte range made of whole parts and maps `fn` on them
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode()
+    return [fn(part) for part in text.split(sep)]
+
+
+# maps the digit characters to their values
+_DIGIT_TABLE = bytes.maketrans(b"0123456789", bytes(range(10)))
+# a signed number, or an empty match for a newline
+_NUMBER_OR_NEWLINE = re.compile(r"(-?\d+)|\n")
+
+
+@lru_cache(maxsize=128)
+def _compile_multiline(pattern: str | re.Pattern) -> re.Pattern:
+    if isinstance(pattern, re.Pattern):
+        return re.compile(pattern.pattern, pattern.flags | re.MULTILINE)
+    return re.compile(pattern, re.MULTILINE)
+
+
+def _line_integers(line: str, sep: str | None) -> List[int]:
+    if sep is None:
+        return list(map(int, [ch for ch in line.strip()]))
+    sep = r"\s*"+sep+r"\s*"
+    return list(map(int, re.split(sep, line.strip())))
+
+
+def _line_matches(pattern: str, line: str, return_loc: bool):
+    if return_loc:
+        return list(re.finditer(pattern, line))
+    return re.findall(pattern, line)
@@ -0,0 +1,243 @@
+from typing import Any, Dict, Iterator, Tuple
+
+from .grid import DIRECTIONS, Grid, flat_offsets
+
+# cells are packed as (i + OFFSET) * STRIDE + (j + OFFSET), so that moving to a
+# neighbour is an integer addition, like with the flat ids of a dense Grid. Rows are
+# unbounded, but columns must stay in [-OFFSET, OFFSET) so that they don't spill
+# into the next row
+STRIDE = 1 << 32
+OFFSET = 1 << 31
+
+
+class SparseGrid:
+    """Represents a 2D grid where only the non-default cells are stored.
+
+    Memory and time scale with the number of occupied cells instead of the area,
+    which suits maps that are mostly empty or whose coordinates are huge. Rows are
+    unbounded, columns must be in [-2**31, 2**31), otherwise an IndexError is raised.
+
+    Attributes:
+        cells (Dict[int, Any]): Values of the occupied cells, keyed on packed
+            coordinates (see `index`).
+        default (Any): Value of the cells that are not stored.
+        sep (str): Separator used to join elements when converting the grid to a string.
+
+    Methods:
+        __getitem__(self, coords: Tuple[int, int]) -> Any:
+            Returns the element at the specified coordinates, or the default value.
+
+        __setitem__(self, coords: Tuple[int, int], elem: Any):
+            Sets the element at the specified coordinates. Setting the default value
+            removes the cell.
+
+        bounds(self) -> Tuple[int, int, int, int] | None:
+            Returns the bounding box (i_min, i_max, j_min, j_max) of occupied cells.
+
+        neighbors(self, idx: int, connectivity: int = 4) -> List[int]:
+            Returns the packed coordinates of the neighbours of a cell.
+
+        from_grid(cls, grid: Grid, default: Any = ".") -> SparseGrid:
+            Builds a sparse grid from the non-default cells of a dense grid.
+
+        to_grid(self) -> Grid:
+            Builds a dense grid covering the bounding box.
+
+    Example usage:
+    ```python
+    grid = SparseGrid(default=".")
+    grid[0, 0] = "#"
+    grid[10**6, -5] = "#"
+    print(len(grid), grid[3, 3])  # "2 ."
+    print(grid.bounds)  # (0, 1000000, -5, 0)
+    ```
+    """
+
+    def __init__(self, cells: Dict[Tuple[int, int], Any] = None, default=".", sep=""):
+        """Initializes a SparseGrid object.
+
+        Args:
+            cells (Dict[Tuple[int, int], Any], optional): Initial cells keyed on
+            their coordinates. Defaults to None.
+            default (Any, optional): Value of the cells that are not stored.
+            Defaults to ".".
+            sep (str, optional): Separator for joining elements in the string
+            representation. Defaults to "".
+        """
+        self.cells = {}
+        self.default = default
+        self.sep = sep
+        self._bounds = None
+        # set when a cell on the bounding box is removed, the box is then recomputed
+        self._bounds_stale = False
+        for coords, elem in (cells or {}).items():
+            self[coords] = elem
+
+    @staticmethod
+    def index(i, j):
+        """Returns the packed coordinates of the cell at (i, j)."""
+        if not -OFFSET <= j < OFFSET:
+            raise IndexError(f"Column {j} is out of [-2**31, 2**31).")
+        return (i + OFFSET) * STRIDE + j + OFFSET
+
+    @staticmethod
+    def coords(idx):
+        """Returns the coordinates (i, j) of the cell with the given packed id."""
+        i, j = divmod(idx, STRIDE)
+        return i - OFFSET, j - OFFSET
+
+    def __getitem__(self, coords):
+        i, j = coords
+        if not -OFFSET <= j < OFFSET:
+            raise IndexError(f"Column {j} is out of [-2**31, 2**31).")
+        return self.cells.get((i + OFFSET) * STRIDE + j + OFFSET, self.default)
+
+    def __setitem__(self, coords, elem):
+        self.set_flat(self.index(*coords), elem)
+
+    def __delitem__(self, coords):
+        self.set_flat(self.index(*coords), self.default)
+
+    def __contains__(self, coords):
+        return self.index(*coords) in self.cells
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return (self.coords(idx) for idx in self.cells)
+
+    def items(self) -> Iterator[Tuple[Tuple[int, int], Any]]:
+        """Yields the coordinates and values of the occupied cells."""
+        return ((self.coords(idx), elem) for idx, elem in self.cells.items())
+
+    def get_flat(self, idx):
+        """Returns the element of the cell with the given packed id."""
+        return self.cells.get(idx, self.default)
+
+    def set_flat(self, idx, elem):
+        """Sets the element of the cell with the given packed id."""
+        if elem == self.default:
+            if idx not in self.cells:
+                return
+            del self.cells[idx]
+            if self._bounds is None or self._bounds_stale:
+                return
+            # only the removal of a cell on the bounding box can shrink it
+            i, j = self.coords(idx)
+            i_min, i_max, j_min, j_max = self._bounds
+            if i in (i_min, i_max) or j in (j_min, j_max):
+                self._bounds_stale = True
+            return
+        self.cells[idx] = elem
+        if self._bounds is None or self._bounds_stale:
+            self._bounds_stale = True
+            return
+        i, j = self.coords(idx)
+        i_min, i_max, j_min, j_max = self._bounds
+        self._bounds = (min(i_min, i), max(i_max, i), min(j_min, j), max(j_max, j))
+
+    @property
+    def bounds(self):
+        """The bounding box (i_min, i_max, j_min, j_max) of the occupied cells
+        (inclusive), or None if the grid is empty."""
+        if self._bounds_stale or (self._bounds is None and self.cells):
+            coords_list = list(self)
+            if coords_list:
+                i_list = [i for i, _ in coords_list]
+                j_list = [j for _, j in coords_list]
+                self._bounds = (min(i_list), max(i_list), min(j_list), max(j_list))
+            else:
+                self._bounds = None
+            self._bounds_stale = False
+        return self._bounds
+
+    @property
+    def shape(self):
+        """Shape (n_rows, n_columns) of the bounding box."""
+        if self.bounds is None:
+            return 0, 0
+        i_min, i_max, j_min, j_max = self.bounds
+        return i_max - i_min + 1, j_max - j_min + 1
+
+    def neighbor_offsets(self, connectivity=4):
+        """Returns the packed id offsets to the neighbours of a cell.
+
+        Args:
+            connectivity (int, optional): 4 or 8 neighbours. Defaults to 4.
+
+        Returns:
+            Tuple[int]: Offsets in the order of `DIRECTIONS[connectivity]`.
+        """
+        return flat_offsets(STRIDE, connectivity)
+
+    def neighbors(self, idx, connectivity=4):
+        """Returns the packed ids of the neighbours of a cell.
+
+        Every cell has all its neighbours, except in the first and last allowed
+        columns, whose neighbours across the column limit are left out.
+
+        Args:
+            idx (int): Packed id of the cell.
+            connectivity (int, optional): 4 or 8 neighbours. Defaults to 4.
+
+        Returns:
+            List[int]: Packed ids of the neighbours, in the order of
+            `DIRECTIONS[connectivity]`.
+        """
+        offsets = flat_offsets(STRIDE, connectivity)
+        col = idx % STRIDE
+        if 0 < col < STRIDE - 1:
+            return [idx + offset for offset in offsets]
+        return [
+            idx + offset
+            for (_, dj), offset in zip(DIRECTIONS[connectivity], offsets)
+            if 0 <= col + dj < STRIDE
+        ]
+
+    @classmethod
+    def from_grid(cls, grid: Grid, default=".", origin=(0, 0)):
+        """Builds a sparse grid from the cells of a dense grid.
+
+        Args:
+            grid (Grid): Dense grid to convert.
+            default (Any, optional): Cells equal to this value are not stored.
+            Defaults to ".".
+            origin (Tuple[int, int], optional): Coordinates given to the cell (0, 0)
+            of the dense grid. Defaults to (0, 0).
+
+        Returns:
+            SparseGrid: The sparse grid.
+        """
+        sparse = cls(default=default, sep=grid.sep)
+        n_rows, n_columns = grid.shape
+        i0, j0 = origin
+        for i in range(n_rows):
+            for j in range(n_columns):
+                elem = grid[i, j]
+                if elem != default:
+                    sparse[i0 + i, j0 + j] = elem
+        return sparse
+
+    def to_grid(self, **kwargs) -> Grid:
+        """Builds a dense grid covering the bounding box of the occupied cells.
+
+        The cell (i_min, j_min) of the sparse grid becomes the cell (0, 0).
+
+        Args:
+            **kwargs: Passed to the Grid constructor, e.g. `backend`.
+
+        Returns:
+            Grid: The dense grid.
+        """
+        if self.bounds is None:
+            return Grid(sep=self.sep, **kwargs)
+        i_min, _, j_min, _ = self.bounds
+        n_rows, n_columns = self.shape
+        content = [[self.default] * n_columns for _ in range(n_rows)]
+        for (i, j), elem in self.items():
+            content[i - i_min][j - j_min] = elem
+        return Grid(content, sep=self.sep, **kwargs)
+
+    def __str__(self):
+        return str(self.to_grid())
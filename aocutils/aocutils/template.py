@@ -0,0 +1,153 @@
+from __future__ import annotations
+import re
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, List, NamedTuple
+
+
+_INT = re.compile(r"-?\d+")
+
+
+def _to_ints(value: str) -> List[int]:
+    return list(map(int, _INT.findall(value)))
+
+
+# regex and converter of each field type
+FIELD_TYPES = {
+    "d": (r"-?\d+", int),
+    "f": (r"-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?", float),
+    "w": (r"\w+", str),
+    "s": (r".*?", str),
+    "ints": (r"-?\d+(?:[ \t,]+-?\d+)*", _to_ints),
+}
+# typed columns for `Template.parse(..., columns=True)`
+_COLUMN_TYPECODES = {"d": "q", "f": "d"}
+
+# escaped braces, a field "{name}" or "{name:type}", or a run of blanks
+_TOKEN = re.compile(r"\{\{|\}\}|\{(\w+)(?::(\w+))?\}|[ \t]+")
+
+
+class Template:
+    """A line template compiled into a single regex with typed fields.
+
+    Fields are written `{name:type}`, where the type is one of:
+    - d: a signed integer, converted with `int`.
+    - f: a decimal number, converted with `float`.
+    - w: a word (`\\w+`).
+    - s: any text, the shortest possible (the default type).
+    - ints: integers separated by blanks or commas, converted to a list of ints.
+    A run of blanks in the template matches any run of blanks, and `{{`/`}}` match
+    literal braces.
+
+    Attributes:
+        template (str): The template.
+        fields (Tuple[str]): Names of the fields.
+        types (Tuple[str]): Types of the fields.
+        regex (re.Pattern): Compiled regex matching a whole line.
+        record (type): Named tuple of the records.
+
+    Example usage:
+    ```python
+    template = Template("Card {id:d}: {win:ints} | {have:ints}")
+    records = template.parse("Card 1: 41 48 | 83  6 48\\nCard 2: 13 | 61 30")
+    print(records[0])  # Record(id=1, win=[41, 48], have=[83, 6, 48])
+    print(template.parse("...", columns=True)["id"])  # array('q', [1, 2])
+    ```
+    """
+
+    def __init__(self, template: str):
+        """Compiles a template.
+
+        Args:
+            template (str): Template of a line.
+
+        Raises:
+            ValueError: If a field type is unknown or a field name is repeated.
+        """
+        self.template = template
+        pattern_list = []
+        field_list = []
+        type_list = []
+        pos = 0
+        for token in _TOKEN.finditer(template):
+            pattern_list.append(re.escape(template[pos: token.start()]))
+            pos = token.end()
+            name, field_type = token.groups()
+            if token.group() in ("{{", "}}"):
+                pattern_list.append(re.escape(token.group()[0]))
+            elif name is None:
+                pattern_list.append(r"[ \t]+")
+            else:
+                field_type = field_type or "s"
+                if field_type not in FIELD_TYPES:
+                    raise ValueError(
+                        f"Unknown type '{field_type}' for field '{name}', expected "
+                        f"one of {list(FIELD_TYPES)}."
+                    )
+                if name in field_list:
+                    raise ValueError(f"Field '{name}' appears twice.")
+                field_list.append(name)
+                type_list.append(field_type)
+                pattern_list.append(f"(?P<{name}>{FIELD_TYPES[field_type][0]})")
+        pattern_list.append(re.escape(template[pos:]))
+        self.fields = tuple(field_list)
+        self.types = tuple(type_list)
+        self.regex = re.compile("^" + "".join(pattern_list) + "$", re.MULTILINE)
+        self.record = namedtuple("Record", self.fields)
+        self._converters = tuple(FIELD_TYPES[t][1] for t in self.types)
+
+    def parse(
+        self, text: str, columns: bool = False, strict: bool = True
+    ) -> List[NamedTuple] | Dict[str, list]:
+        """Parses all the lines of a text with one search over the whole text.
+
+        Args:
+            text (str): Text to parse, one record per line.
+            columns (bool, optional): If True, returns the values field by field,
+            in `array("q")` for "d" fields, `array("d")` for "f" fields and in lists
+            otherwise. Defaults to False.
+            strict (bool, optional): If True, raises an error for a non-empty line
+            that does not match the template. Otherwise such lines are skipped.
+            Defaults to True.
+
+        Returns:
+            List[NamedTuple] | Dict[str, list]: The records, or the columns.
+
+        Raises:
+            ValueError: If `strict` and a line does not match.
+        """
+        converters = self._converters
+        value_list = []
+        pos = 0
+        for match in self.regex.finditer(text):
+            if strict:
+                self._check_gap(text, pos, match.start())
+            pos = match.end()
+            value_list.append(
+                [convert(value) for convert, value in zip(converters, match.groups())]
+            )
+        if strict:
+            self._check_gap(text, pos, len(text))
+        if not columns:
+            record = self.record
+            return [record(*values) for values in value_list]
+        column_list = list(zip(*value_list)) or [()] * len(self.fields)
+        column_dict = {}
+        for name, field_type, column in zip(self.fields, self.types, column_list):
+            typecode = _COLUMN_TYPECODES.get(field_type)
+            column_dict[name] = array(typecode, column) if typecode else list(column)
+        return column_dict
+
+    def _check_gap(self, text, start, end):
+        # only blank lines can separate two matching lines
+        gap = text[start:end]
+        if gap.strip():
+            line = next(line for line in gap.split("\n") if line.strip())
+            raise ValueError(f"Line {line!r} does not match the template.")
+
+
+@lru_cache(maxsize=128)
+def compile_template(template: str) -> Template:
+    """Returns the compiled template, cached so that it is compiled only once."""
+    return Template(template)
@@ -0,0 +1,322 @@
+import mmap
+import struct
+import tempfile
+from typing import Iterator, Sequence, Tuple
+
+from .grid import _to_byte, _write_lines
+
+# magic, n_rows, n_columns, tile_size, data_offset
+HEADER = struct.Struct("<8sqqqq")
+MAGIC = b"AOCTILE2"
+
+
+class TiledGrid:
+    """Represents a byte-encoded 2D grid stored in a memory-mapped file.
+
+    The cells are stored in square tiles of `tile_size` x `tile_size` bytes (4 KiB,
+    i.e. one page, for the default size), so the cells around a position are close in
+    the file whatever the direction. Only the tiles in use are paged in, which keeps
+    the memory bounded for grids larger than the RAM.
+
+    The header is padded to a page so that the tiles start on page boundaries.
+
+    Cells are read as integers (0-255) and written as integers or characters, like a
+    Grid with the "bytes" backend.
+
+    Attributes:
+        shape (Tuple[int, int]): Shape of the grid (n_rows, n_columns).
+        tile_size (int): Side of the tiles, a power of two.
+        sep (str): Separator used to join elements when converting to a string.
+        border (Any): Value read outside the grid, or None to raise an error instead.
+
+    Methods:
+        create(cls, shape, path=None, tile_size=64, fill=0) -> TiledGrid:
+            Creates a new grid file.
+
+        open(cls, path, mode="r") -> TiledGrid:
+            Opens an existing grid file.
+
+        from_text_file(cls, input_path, path=None, tile_size=64) -> TiledGrid:
+            Converts a text input with one cell per character, line by line.
+
+        from_lines(cls, lines, path=None, tile_size=64) -> TiledGrid:
+            Builds a grid file from text lines.
+
+        iter_rows(self) -> Iterator[bytes]:
+            Yields the rows one at a time.
+
+    Example usage:
+    ```python
+    with TiledGrid.from_text_file("huge_input.txt") as grid:
+        print(grid.shape, chr(grid[0, 0]))
+        n_walls = sum(row.count(b"#") for row in grid.iter_rows())
+    ```
+    """
+
+    def __init__(self, file, writable=False, sep="", border=None):
+        """Maps a grid file, see `create`, `open` and `from_text_file`.
+
+        Args:
+            file (BinaryIO): Open grid file, closed with the grid.
+            writable (bool, optional): Whether cells can be written. Defaults to
+            False.
+            sep (str, optional): Separator for joining elements in the string
+            representation. Defaults to "".
+            border (Any, optional): Value read outside the grid. Defaults to None.
+        """
+        self._file = file
+        self._mmap = mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+        )
+        magic = self._mmap[: len(MAGIC)]
+        if magic != MAGIC:
+            raise ValueError("Not a tiled grid file.")
+        _, n_rows, n_columns, tile_size, data_offset = HEADER.unpack_from(self._mmap)
+        self.shape = (n_rows, n_columns)
+        self.tile_size = tile_size
+        self.sep = sep
+        self.border = border
+        self._data_offset = data_offset
+        self._shift = tile_size.bit_length() - 1
+        self._n_tile_columns = -(-n_columns // tile_size)
+
+    @staticmethod
+    def _data_size(shape, tile_size):
+        n_rows, n_columns = shape
+        n_tiles = -(-n_rows // tile_size) * -(-n_columns // tile_size)
+        return n_tiles * tile_size * tile_size
+
+    @classmethod
+    def create(cls, shape: Tuple[int, int], path=None, tile_size=64, fill=0, **kwargs):
+        """Creates a new grid file with all cells set to `fill`.
+
+        Args:
+            shape (Tuple[int, int]): Shape of the grid (n_rows, n_columns).
+            path (str, optional): Where to create the file. Defaults to None, i.e.
+            an anonymous temporary file deleted when the grid is closed.
+            tile_size (int, optional): Side of the tiles, a power of two.
+            Defaults to 64.
+            fill (int | str, optional): Initial value of the cells, a byte value or
+            its character. Defaults to 0.
+            **kwargs: Passed to the constructor, e.g. `sep` or `border`.
+
+        Returns:
+            TiledGrid: The grid, open for reading and writing.
+        """
+        if tile_size <= 0 or tile_size & (tile_size - 1):
+            raise ValueError(f"tile_size must be a power of two, got {tile_size}.")
+        if shape[0] <= 0 or shape[1] <= 0:
+            raise ValueError(f"Cannot create an empty grid of shape {shape}.")
+        file = tempfile.TemporaryFile() if path is None else open(path, "w+b")
+        # the data starts on a page boundary, so each 4 KiB tile is a single page
+        data_offset = -(-HEADER.size // mmap.PAGESIZE) * mmap.PAGESIZE
+        file.write(HEADER.pack(MAGIC, shape[0], shape[1], tile_size, data_offset))
+        file.write(bytes(data_offset - HEADER.size))
+        data_size = cls._data_size(shape, tile_size)
+        fill = _to_byte(fill)
+        if fill:
+            chunk = bytes([fill]) * (1 << 20)
+            for _ in range(data_size // len(chunk)):
+                file.write(chunk)
+            file.write(chunk[: data_size % len(chunk)])
+        else:
+            # the file system gives zeros without writing them
+            file.truncate(data_offset + data_size)
+        file.flush()
+        return cls(file, writable=True, **kwargs)
+
+    @classmethod
+    def open(cls, path, mode="r", **kwargs):
+        """Opens an existing grid file.
+
+        Args:
+            path (str): Path of the grid file.
+            mode (str, optional): "r" for read-only or "r+" to write cells too.
+            Defaults to "r".
+            **kwargs: Passed to the constructor, e.g. `sep` or `border`.
+
+        Returns:
+            TiledGrid: The grid.
+        """
+        if mode not in ("r", "r+"):
+            raise ValueError(f"mode must be 'r' or 'r+', got '{mode}'.")
+        return cls(open(path, mode + "b"), writable=mode == "r+", **kwargs)
+
+    @classmethod
+    def from_text_file(cls, input_path, path=None, tile_size=64, **kwargs):
+        """Converts a text input with one cell per character into a grid file.
+
+        The input is read line by line twice (once for the shape, once for the
+        cells), so it is never fully loaded in memory. Blank lines at the start and
+        the end are ignored, like `Parser` does.
+
+        Args:
+            input_path (str): Path of the text input.
+            path (str, optional): Where to create the grid file. Defaults to None,
+            i.e. an anonymous temporary file.
+            tile_size (int, optional): Side of the tiles, a power of two.
+            Defaults to 64.
+            **kwargs: Passed to the constructor, e.g. `sep` or `border`.
+
+        Returns:
+            TiledGrid: The grid, open for reading and writing.
+        """
+        return cls._from_row_source(
+            lambda: _iter_input_rows(input_path), path, tile_size, **kwargs
+        )
+
+    @classmethod
+    def from_lines(cls, lines: Sequence[str], path=None, tile_size=64, **kwargs):
+        """Builds a grid file from text lines, one cell per character.
+
+        Args:
+            lines (Sequence[str]): Lines of the grid, all of the same length.
+            path (str, optional): Where to create the grid file. Defaults to None,
+            i.e. an anonymous temporary file.
+            tile_size (int, optional): Side of the tiles, a power of two.
+            Defaults to 64.
+            **kwargs: Passed to the constructor, e.g. `sep` or `border`.
+
+        Returns:
+            TiledGrid: The grid, open for reading and writing.
+        """
+        def iter_rows():
+            return (line.encode("latin-1") for line in lines)
+
+        return cls._from_row_source(iter_rows, path, tile_size, **kwargs)
+
+    @classmethod
+    def _from_row_source(cls, iter_rows, path, tile_size, **kwargs):
+        # `iter_rows` is called twice: once for the shape, once to fill the tiles
+        n_rows, n_columns = 0, None
+        for row in iter_rows():
+            if n_columns is None:
+                n_columns = len(row)
+            elif len(row) != n_columns:
+                raise ValueError(
+                    f"All lines must have {n_columns} characters, got {row!r}."
+                )
+            n_rows += 1
+        if not n_rows:
+            raise ValueError("The input has no lines.")
+        grid = cls.create((n_rows, n_columns), path, tile_size, **kwargs)
+        for i, row in enumerate(iter_rows()):
+            grid.set_row(i, row)
+        return grid
+
+    def _offset(self, i, j):
+        shift, mask = self._shift, self.tile_size - 1
+        tile = (i >> shift) * self._n_tile_columns + (j >> shift)
+        in_tile = ((i & mask) << shift) + (j & mask)
+        return self._data_offset + (tile << 2 * shift) + in_tile
+
+    def _check(self, i, j):
+        n_rows, n_columns = self.shape
+        if not (0 <= i < n_rows and 0 <= j < n_columns):
+            raise IndexError(f"({i}, {j}) is out of the grid of shape {self.shape}.")
+
+    def __getitem__(self, coords):
+        i, j = coords
+        if self.border is not None:
+            return self.get(i, j, self.border)
+        self._check(i, j)
+        return self._mmap[self._offset(i, j)]
+
+    def get(self, i, j, default=None):
+        """Returns the element at (i, j), or `default` if it is outside the grid."""
+        n_rows, n_columns = self.shape
+        if 0 <= i < n_rows and 0 <= j < n_columns:
+            return self._mmap[self._offset(i, j)]
+        return default
+
+    def __setitem__(self, coords, elem):
+        i, j = coords
+        self._check(i, j)
+        self._mmap[self._offset(i, j)] = _to_byte(elem)
+
+    def get_row(self, i) -> bytes:
+        """Returns the cells of row i, assembled from the tiles it crosses."""
+        self._check(i, 0)
+        tile_size = self.tile_size
+        start = self._offset(i, 0)
+        step = tile_size * tile_size
+        row = b"".join(
+            self._mmap[start + k * step: start + k * step + tile_size]
+            for k in range(self._n_tile_columns)
+        )
+        return row[: self.shape[1]]
+
+    def set_row(self, i, row):
+        """Writes the cells of row i.
+
+        Args:
+            i (int): Row index.
+            row (bytes | bytearray): One byte per cell.
+        """
+        self._check(i, 0)
+        if len(row) != self.shape[1]:
+            raise ValueError(f"Expected {self.shape[1]} cells, got {len(row)}.")
+        tile_size = self.tile_size
+        start = self._offset(i, 0)
+        step = tile_size * tile_size
+        for k, j in enumerate(range(0, len(row), tile_size)):
+            segment = row[j: j + tile_size]
+            offset = start + k * step
+            self._mmap[offset: offset + len(segment)] = segment
+
+    def iter_rows(self) -> Iterator[bytes]:
+        """Yields the rows one at a time, so only one row is held in memory."""
+        for i in range(self.shape[0]):
+            yield self.get_row(i)
+
+    def count(self, value):
+        """Counts the cells equal to a byte value (or its character)."""
+        byte = bytes([ord(value) if isinstance(value, str) else value])
+        return sum(row.count(byte) for row in self.iter_rows())
+
+    def iter_render(self, sep=None):
+        """Yields the rows of the string representation one at a time."""
+        sep = self.sep if sep is None else sep
+        for row in self.iter_rows():
+            line = row.decode("latin-1")
+            yield sep.join(line) if sep else line
+
+    def write_to(self, fp, sep=None):
+        """Writes the grid to a text or binary file-like object, one row at a time."""
+        _write_lines(fp, self.iter_render(sep))
+
+    def __str__(self):
+        return "\n".join(self.iter_render())
+
+    def flush(self):
+        """Writes the changes to the file."""
+        self._mmap.flush()
+
+    def close(self):
+        """Unmaps and closes the grid file."""
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _iter_input_rows(input_path):
+    # yields the lines of a text file without their line endings, skipping the blank
+    # lines at the start and at the end
+    with open(input_path, "rb") as f:
+        blank_lines = []
+        started = False
+        for line in f:
+            line = line.rstrip(b"\r\n")
+            if not line.strip():
+                if started:
+                    blank_lines.append(line)
+                continue
+            started = True
+            yield from blank_lines
+            blank_lines = []
+            yield line
@@ -0,0 +1,172 @@
+from array import array
+from collections import deque
+from typing import Any, Callable, Iterable, Optional
+
+from .grid import DIRECTIONS, flat_offsets
+
+# marks cells that were looked at but could not be entered
+_BLOCKED = 2
+# maps the internal marks of `flood_fill` to a 0/1 mask
+_MASK_TABLE = bytes([0, 1, 0]) + bytes(253)
+
+
+def _neighbors_function(grid, connectivity):
+    """Returns a function giving the flat ids of the neighbours of a cell.
+
+    Interior cells only need integer additions with the precomputed offsets, the
+    bounds are checked for the cells on the edges only.
+    """
+    n_rows, n_columns = grid.shape
+    offsets = flat_offsets(n_columns, connectivity)
+    steps = tuple(zip(DIRECTIONS[connectivity], offsets))
+    last_i, last_j = n_rows - 1, n_columns - 1
+
+    def neighbors(idx):
+        i, j = divmod(idx, n_columns)
+        if 0 < i < last_i and 0 < j < last_j:
+            return [idx + offset for offset in offsets]
+        return [
+            idx + offset
+            for (di, dj), offset in steps
+            if 0 <= i + di <= last_i and 0 <= j + dj <= last_j
+        ]
+
+    return neighbors
+
+
+def bfs(
+    grid,
+    sources: Iterable[int],
+    passable: Optional[Callable[[Any], bool]] = None,
+    connectivity: int = 4,
+    neighbors: Optional[Callable[[int], Iterable[int]]] = None,
+) -> array:
+    """Computes the BFS distance from the closest source to every cell of a grid.
+
+    Args:
+        grid (Grid): Grid to walk on.
+        sources (Iterable[int]): Flat ids of the starting cells (see `Grid.index`).
+        passable (Callable[[Any], bool], optional): Whether a cell can be entered,
+            given its value. Defaults to None, i.e. every cell can be entered.
+        connectivity (int, optional): 4 or 8 neighbours. Defaults to 4.
+        neighbors (Callable[[int], Iterable[int]], optional): Transition function
+            giving the flat ids reachable from a cell, for moves that depend on the
+            cell itself (e.g. pipes). Defaults to the grid neighbours.
+
+    Returns:
+        array: Flat array of distances (typecode "i"), -1 for unreachable cells.
+
+    Example usage:
+    ```python
+    grid = Grid([list("..#"), list("#.."), list("...")])
+    dist = bfs(grid, [grid.index(0, 0)], passable=lambda ch: ch != "#")
+    print(dist[grid.index(0, 2)])  # -1
+    print(dist[grid.index(2, 0)])  # 3
+    ```
+    """
+    n_rows, n_columns = grid.shape
+    size = n_rows * n_columns
+    distances = array("i", [-1]) * size
+    seen = bytearray(size)
+    if neighbors is None:
+        neighbors = _neighbors_function(grid, connectivity)
+    get = grid.get_flat
+
+    queue = deque()
+    for idx in sources:
+        if not seen[idx]:
+            seen[idx] = 1
+            distances[idx] = 0
+            queue.append(idx)
+    while queue:
+        idx = queue.popleft()
+        next_distance = distances[idx] + 1
+        for next_idx in neighbors(idx):
+            if seen[next_idx]:
+                continue
+            seen[next_idx] = 1
+            if passable is None or passable(get(next_idx)):
+                distances[next_idx] = next_distance
+                queue.append(next_idx)
+    return distances
+
+
+def flood_fill(
+    grid,
+    seeds: Iterable[int],
+    passable: Optional[Callable[[Any], bool]] = None,
+    connectivity: int = 4,
+    neighbors: Optional[Callable[[int], Iterable[int]]] = None,
+) -> bytearray:
+    """Finds all the cells reachable from the seeds.
+
+    Args:
+        grid (Grid): Grid to fill.
+        seeds (Iterable[int]): Flat ids of the starting cells (see `Grid.index`).
+        passable (Callable[[Any], bool], optional): Whether a cell can be entered,
+            given its value. Defaults to None, i.e. every cell can be entered.
+        connectivity (int, optional): 4 or 8 neighbours. Defaults to 4.
+        neighbors (Callable[[int], Iterable[int]], optional): Transition function
+            giving the flat ids reachable from a cell. Defaults to the grid
+            neighbours.
+
+    Returns:
+        bytearray: Flat mask with 1 for the filled cells and 0 elsewhere. The number
+        of filled cells is `mask.count(1)`.
+    """
+    n_rows, n_columns = grid.shape
+    mask = bytearray(n_rows * n_columns)
+    if neighbors is None:
+        neighbors = _neighbors_function(grid, connectivity)
+    get = grid.get_flat
+
+    stack = []
+    for idx in seeds:
+        if not mask[idx]:
+            mask[idx] = 1
+            stack.append(idx)
+    while stack:
+        idx = stack.pop()
+        for next_idx in neighbors(idx):
+            if mask[next_idx]:
+                continue
+            if passable is None or passable(get(next_idx)):
+                mask[next_idx] = 1
+                stack.append(next_idx)
+            else:
+                mask[next_idx] = _BLOCKED
+    return mask.translate(_MASK_TABLE)
+
+
+def follow_path(
+    start: int,
+    next_cell: Callable[[Optional[int], int], Optional[int]],
+    first: Optional[int] = None,
+    max_steps: Optional[int] = None,
+) -> array:
+    """Follows a path cell by cell until it returns to its start or stops.
+
+    Args:
+        start (int): Flat id of the first cell of the path.
+        next_cell (Callable[[Optional[int], int], Optional[int]]): Given the previous
+            and the current cell, returns the next cell or None when the path ends.
+            The previous cell is None on the first step.
+        first (int, optional): Flat id of the second cell of the path, for starts
+            that can go in several directions. Defaults to None, i.e.
+            `next_cell(None, start)`.
+        max_steps (int, optional): Stops after this many steps. Defaults to None.
+
+    Returns:
+        array: Flat ids of the path (typecode "q"), starting with `start`. If the
+        path is a loop, `start` is not repeated at the end.
+    """
+    path = array("q", [start])
+    prev, cur = start, next_cell(None, start) if first is None else first
+    n_steps = 1
+    while cur is not None and cur != start:
+        if max_steps is not None and n_steps > max_steps:
+            break
+        path.append(cur)
+        prev, cur = cur, next_cell(prev, cur)
+        n_steps += 1
+    return path
@@ -49,3 +49,23 @@ def timeit(f_py=None, unit="ms"):
         return timeit_wrapper
 
     return _decorator(f_py) if callable(f_py) else _decorator
+
+
+def require_numpy(feature: str = "This feature"):
+    """Imports numpy on demand since it is an optional dependency.
+
+    Args:
+    - feature (str, optional): Name of the feature that needs numpy, used in the
+    error message.
+
+    Returns:
+    - the numpy module.
+
+    Raises:
+    - ImportError: If numpy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(f"{feature} requires numpy to be installed.") from e
+    return numpy
@@ -0,0 +1,70 @@
+import pytest
+from aocutils import BitGrid, Grid, Parser
+
+
+@pytest.fixture
+def sample_grid():
+    return BitGrid.from_lines(["#..", "..#", ".#."])
+
+
+def test_from_lines(sample_grid):
+    assert sample_grid.shape == (3, 3)
+    assert sample_grid.rows == [0b001, 0b100, 0b010]
+    assert sample_grid[0, 0]
+    assert not sample_grid[0, 1]
+    assert str(sample_grid) == "#..\n..#\n.#."
+
+
+def test_from_grid():
+    grid = Grid([[1, 0, 3], [0, 5, 0]])
+    bits = BitGrid.from_grid(grid, lambda x: x > 0)
+    assert str(bits) == "#.#\n.#."
+    grid = Parser(text="#..\n..#\n.#.").get_grid(encoding="bytes")
+    assert BitGrid.from_grid(grid, "#") == BitGrid.from_lines(["#..", "..#", ".#."])
+
+
+def test_setitem(sample_grid):
+    sample_grid[0, 1] = True
+    sample_grid[0, 0] = False
+    assert str(sample_grid).split("\n")[0] == ".#."
+    sample_grid[1, -1] = False
+    assert not sample_grid[1, 2]
+    assert sample_grid[0, -2]
+    for j in (3, 5, -4):
+        with pytest.raises(IndexError):
+            sample_grid[0, j] = True
+        with pytest.raises(IndexError):
+            sample_grid[0, j]
+    assert sample_grid.count() == 2
+
+
+def test_operators(sample_grid):
+    other = BitGrid.from_lines(["##.", "...", ".##"])
+    assert str(sample_grid & other) == "#..\n...\n.#."
+    assert str(sample_grid | other) == "##.\n..#\n.##"
+    assert str(sample_grid ^ other) == ".#.\n..#\n..#"
+    assert str(~sample_grid) == ".##\n##.\n#.#"
+    with pytest.raises(ValueError):
+        sample_grid & BitGrid.from_lines(["#"])
+
+
+def test_shift(sample_grid):
+    assert str(sample_grid.shift(1, 0)) == "...\n#..\n..#"
+    assert str(sample_grid.shift(-1, 0)) == "..#\n.#.\n..."
+    assert str(sample_grid.shift(0, 1)) == ".#.\n...\n..#"
+    assert str(sample_grid.shift(0, -1)) == "...\n.#.\n#.."
+    assert sample_grid.shift(5, 0).count() == 0
+
+
+def test_neighbor_mask():
+    grid = BitGrid.from_lines(["...", ".#.", "..."])
+    assert str(grid.neighbor_mask()) == ".#.\n#.#\n.#."
+    assert str(grid.neighbor_mask(8)) == "###\n#.#\n###"
+
+
+def test_counts(sample_grid):
+    assert sample_grid.count() == 3
+    assert sample_grid.row_counts() == [1, 1, 1]
+    grid = BitGrid.from_lines(["#.#", "#..", "..."])
+    assert grid.col_counts() == [2, 0, 1]
+    assert grid.to_grid(on=1, off=0).content == [[1, 0, 1], [1, 0, 0], [0, 0, 0]]
@@ -0,0 +1,120 @@
+import importlib
+import linecache
+import os
+
+from aocutils import Grid, Parser, cached_parse
+
+
+def test_cached_parse(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("1,2\n3,4")
+    cache_dir = tmp_path / "cache"
+    n_calls = []
+
+    @cached_parse(cache_dir=str(cache_dir))
+    def parse_input(file_name, sep=","):
+        n_calls.append(file_name)
+        return Parser(file_name).get_integers(sep)
+
+    assert parse_input(str(input_path)) == [[1, 2], [3, 4]]
+    assert parse_input(str(input_path)) == [[1, 2], [3, 4]]
+    assert len(n_calls) == 1
+    # other arguments are part of the key
+    assert parse_input(str(input_path), sep=r"\s?,") == [[1, 2], [3, 4]]
+    assert len(n_calls) == 2
+    # so is the content of the input
+    input_path.write_text("5,6")
+    assert parse_input(str(input_path)) == [[5, 6]]
+    assert len(n_calls) == 3
+    assert len(os.listdir(cache_dir)) == 3
+
+
+def test_cached_parse_eviction(tmp_path):
+    cache_dir = tmp_path / "cache"
+
+    @cached_parse(cache_dir=str(cache_dir), max_bytes=1500)
+    def read_input(file_name):
+        return Parser(file_name).data
+
+    for k in range(4):
+        input_path = tmp_path / f"input{k}.txt"
+        input_path.write_text(str(k) * 1000)
+        read_input(str(input_path))
+    # only the most recent result fits in the limit
+    assert len(os.listdir(cache_dir)) == 1
+    assert read_input(str(input_path)) == "3" * 1000
+
+
+def test_cached_parse_unpicklable(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("1")
+    cache_dir = tmp_path / "cache"
+
+    @cached_parse(cache_dir=str(cache_dir))
+    def parse_input(file_name):
+        return lambda: Parser(file_name).data
+
+    assert parse_input(str(input_path))() == "1"
+    # nothing is cached, not even a temporary file
+    assert os.listdir(cache_dir) == []
+
+
+def test_cached_parse_stale_entry(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("1")
+    cache_dir = tmp_path / "cache"
+    n_calls = []
+
+    @cached_parse(cache_dir=str(cache_dir))
+    def parse_input(file_name):
+        n_calls.append(file_name)
+        return Parser(file_name).data
+
+    parse_input(str(input_path))
+    (path,) = cache_dir.iterdir()
+    # a pickle of a class that no longer exists
+    path.write_bytes(b"cremoved_module\nRemovedClass\n.")
+    assert parse_input(str(input_path)) == "1"
+    assert len(n_calls) == 2
+    # the entry was replaced by a valid one
+    assert parse_input(str(input_path)) == "1"
+    assert len(n_calls) == 2
+
+
+def test_cached_parse_bytes_grid(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("#.\n.#")
+    cache_dir = tmp_path / "cache"
+
+    @cached_parse(cache_dir=str(cache_dir))
+    def parse_input(file_name):
+        return Grid.from_bytes(Parser(file_name).data.replace("\n", "").encode(), 2)
+
+    assert str(parse_input(str(input_path))) == "#.\n.#"
+    grid = parse_input(str(input_path))
+    assert str(grid) == "#.\n.#"
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_cached_parse_depends(tmp_path, monkeypatch):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("1")
+    module_path = tmp_path / "helper_module.py"
+    module_path.write_text("def convert(data):\n    return int(data)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    import helper_module
+
+    def make_parser():
+        @cached_parse(cache_dir=str(tmp_path / "cache"), depends=[helper_module])
+        def parse_input(file_name):
+            return helper_module.convert(Parser(file_name).data)
+
+        return parse_input
+
+    assert make_parser()(str(input_path)) == 1
+    # editing a module the result depends on invalidates it
+    module_path.write_text("def convert(data):\n    return float(data)\n")
+    linecache.checkcache(str(module_path))
+    importlib.reload(helper_module)
+    assert make_parser()(str(input_path)) == 1.0
+    assert isinstance(make_parser()(str(input_path)), float)
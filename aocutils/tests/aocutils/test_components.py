@@ -0,0 +1,48 @@
+import pytest
+from aocutils import Grid, UnionFind
+
+
+def test_union_find():
+    sets = UnionFind(5)
+    sets.union(0, 1)
+    sets.union(3, 4)
+    sets.union(1, 4)
+    assert sets.find(0) == sets.find(3)
+    assert sets.find(2) == 2
+    assert sets.find(2) != sets.find(0)
+
+
+def test_label_components():
+    grid = Grid([list("#.#"), list("#.."), list("..#")])
+    labels, sizes, bboxes = grid.label_components("#")
+    assert list(labels) == [0, -1, 1, 0, -1, -1, -1, -1, 2]
+    assert sizes == [2, 1, 1]
+    assert bboxes == [(0, 1, 0, 0), (0, 0, 2, 2), (2, 2, 2, 2)]
+
+
+def test_label_components_connectivity_8():
+    grid = Grid([list("#.#"), list(".#."), list("#..")])
+    components = grid.label_components("#", connectivity=8)
+    assert components.sizes == [4]
+    assert components.bboxes == [(0, 2, 0, 2)]
+    assert grid.label_components("#").sizes == [1, 1, 1, 1]
+    with pytest.raises(ValueError):
+        grid.label_components("#", connectivity=6)
+
+
+def test_label_components_u_shape():
+    # the two arms only meet at the bottom, after both got their own set
+    grid = Grid([list("#.#"), list("#.#"), list("###")])
+    labels, sizes, _ = grid.label_components(lambda ch: ch == "#")
+    assert sizes == [7]
+    assert set(labels) == {0, -1}
+
+
+def test_label_components_backends():
+    rows = [list("#.#"), list("#.."), list("..#")]
+    grid = Grid.from_bytes(b"".join("".join(r).encode() for r in rows), 3)
+    assert grid.label_components("#").sizes == [2, 1, 1]
+    assert grid.mask("#") == bytearray([1, 0, 1, 1, 0, 0, 0, 0, 1])
+    pytest.importorskip("numpy")
+    grid = Grid(rows, backend="numpy")
+    assert grid.label_components(".").sizes == [5]
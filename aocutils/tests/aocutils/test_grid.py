@@ -1,5 +1,8 @@
+import io
+import pickle
 import pytest
-from aocutils import Grid
+from aocutils import Grid, GridHistory, GridView, byte_table
+from aocutils.grid import BACKENDS
 
 
 @pytest.fixture
@@ -58,3 +61,570 @@ def test_get_subset():
     grid = Grid([[1, 2, 3], [4, 5, 6], [7, 8, 9]], sep=", ")
     subset = grid.get_subset(0, 1, 1, 2)
     assert subset.content == [[2, 3], [5, 6]]
+
+
+def test_numpy_backend():
+    np = pytest.importorskip("numpy")
+    grid = Grid([[1, 2, 3], [4, 5, 6]], sep=", ", backend="numpy")
+    assert isinstance(grid.content, np.ndarray)
+    assert grid.shape == (2, 3)
+    assert grid[1, 2] == 6
+    grid[0, 0] = 0
+    assert grid.array[0, 0] == 0
+    grid.append_row([7, 8, 9])
+    assert grid.shape == (3, 3)
+    assert str(grid) == "0, 2, 3\n4, 5, 6\n7, 8, 9"
+    assert grid.get_subset(0, 1, 1, 2).array.tolist() == [[2, 3], [5, 6]]
+    grid.pad(0)
+    assert grid.shape == (5, 5)
+    assert grid.count(0) == 17
+
+
+def test_from_array():
+    np = pytest.importorskip("numpy")
+    array = np.array([list("#.#"), list("..#")])
+    grid = Grid.from_array(array)
+    assert grid.array is array
+    assert grid.count("#") == 3
+    assert str(grid) == "#.#\n..#"
+    with pytest.raises(ValueError):
+        Grid.from_array(np.zeros(3))
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError, match="backend must be one of"):
+        Grid([[1]], backend="dict")
+
+
+def test_count():
+    grid = Grid([list("#.#"), list("..#")])
+    assert grid.count("#") == 3
+    assert grid.count(".") == 3
+
+
+def test_get_subset_view():
+    grid = Grid([[1, 2, 3], [4, 5, 6], [7, 8, 9]], sep=", ")
+    view = grid.get_subset(1, 2, 1, 2, view=True)
+    assert isinstance(view, GridView)
+    assert view.shape == (2, 2)
+    assert view[0, 0] == 5
+    assert str(view) == "5, 6\n8, 9"
+    # writes go through to the parent
+    view[1, 1] = 0
+    assert grid[2, 2] == 0
+    with pytest.raises(IndexError):
+        view[2, 0]
+    # views of views point at the parent grid
+    inner = view.get_subset(1, 1, 0, 1, view=True)
+    assert inner.parent is grid
+    assert inner.origin == (2, 1)
+    # copies are independent
+    subset = view.copy()
+    assert subset.content == [[5, 6], [8, 0]]
+    subset[0, 0] = -1
+    assert grid[1, 1] == 5
+
+
+def test_get_subset_view_numpy():
+    pytest.importorskip("numpy")
+    grid = Grid([[1, 2, 3], [4, 5, 6]], backend="numpy")
+    view = grid.get_subset(0, 1, 1, 2, view=True)
+    view[0, 0] = 0
+    assert grid[0, 1] == 0
+    assert grid.get_subset(0, 1, 1, 2)[0, 0] == 0
+
+
+def test_border():
+    grid = Grid([[1, 2], [3, 4]], border=".")
+    assert grid[0, 0] == 1
+    assert grid[-1, 0] == "."
+    assert grid[1, 2] == "."
+    assert grid.shape == (2, 2)
+    # writing outside the grid doesn't wrap around to the last row
+    with pytest.raises(IndexError):
+        grid[-1, 0] = 9
+    assert grid.content == [[1, 2], [3, 4]]
+    # no border keeps the usual indexing
+    grid = Grid([[1, 2], [3, 4]])
+    assert grid[-1, 0] == 3
+    with pytest.raises(IndexError):
+        grid[2, 0]
+
+
+def test_border_numpy_mask():
+    pytest.importorskip("numpy")
+    grid = Grid([list("#.."), list(".#."), list("..#")], backend="numpy", border=".")
+    assert grid[grid.array == "#"].tolist() == ["#"] * 3
+    grid[grid.array == "."] = "O"
+    assert str(grid) == "#OO\nO#O\nOO#"
+    assert grid[-1, 0] == "."
+
+
+def test_get():
+    grid = Grid([[1, 2], [3, 4]])
+    assert grid.get(1, 0) == 3
+    assert grid.get(-1, 0) is None
+    assert grid.get(0, 5, default=0) == 0
+
+
+def test_border_view():
+    grid = Grid([[1, 2, 3], [4, 5, 6]], border=0)
+    view = grid.get_subset(0, 1, 1, 1, view=True)
+    assert view[0, 1] == 0
+    with pytest.raises(IndexError):
+        view[0, 1] = 9
+    assert grid.get_subset(0, 0, 0, 1)[5, 5] == 0
+
+
+def test_flat_index():
+    grid = Grid([[1, 2, 3], [4, 5, 6]])
+    assert grid.index(1, 2) == 5
+    assert grid.coords(4) == (1, 1)
+    assert grid.get_flat(4) == 5
+    grid.set_flat(0, 0)
+    assert grid[0, 0] == 0
+    assert grid.neighbor_offsets() == (-3, -1, 1, 3)
+    assert grid.neighbor_offsets(8) == (-4, -3, -2, -1, 1, 2, 3, 4)
+    with pytest.raises(ValueError):
+        grid.neighbor_offsets(6)
+
+
+def test_neighbors():
+    grid = Grid([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    assert grid.neighbors(4) == [1, 3, 5, 7]
+    assert grid.neighbors(0) == [1, 3]
+    assert grid.neighbors(5) == [2, 4, 8]
+    assert grid.neighbors(0, connectivity=8) == [1, 3, 4]
+    assert grid.neighbors(4, connectivity=8) == [0, 1, 2, 3, 5, 6, 7, 8]
+
+
+def test_neighbors_many():
+    pytest.importorskip("numpy")
+    grid = Grid([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    neighbors = grid.neighbors_many([0, 4, 5])
+    assert neighbors.tolist() == [[-1, -1, 1, 3], [1, 3, 5, 7], [2, 4, -1, 8]]
+    assert grid.neighbors_many([0], connectivity=8).shape == (1, 8)
+
+
+def test_line_counts():
+    grid = Grid([list("#.."), list("..."), list("..#"), list("...")])
+    counts = grid.line_counts("#")
+    assert list(counts.row_counts) == [1, 0, 1, 0]
+    assert list(counts.col_counts) == [1, 0, 1]
+    assert list(counts.row_prefix) == [0, 1, 1, 2, 2]
+    assert counts.empty_rows() == [1, 3]
+    assert counts.empty_cols() == [1]
+    assert counts.empty_rows_between(0, 2) == 1
+    assert counts.empty_rows_between(3, 0) == 2
+    assert counts.empty_cols_between(0, 1) == 1
+    assert counts.cells_in_rows(1, 3) == 1
+    assert counts.cells_in_cols(0, 2) == 2
+    # cached until the grid changes
+    assert grid.line_counts("#") is counts
+    grid[1, 1] = "#"
+    counts = grid.line_counts("#")
+    assert counts.empty_rows() == [3]
+    assert counts.empty_cols() == []
+    grid.set_flat(grid.index(3, 0), "#")
+    assert grid.line_counts("#").empty_rows() == []
+
+
+def test_line_counts_predicate():
+    grid = Grid([[1, 2], [3, 4]])
+    counts = grid.line_counts(lambda x: x % 2 == 0)
+    assert list(counts.row_counts) == [1, 1]
+    assert list(counts.col_counts) == [0, 2]
+
+
+def test_line_counts_numpy():
+    pytest.importorskip("numpy")
+    grid = Grid([list("#.."), list("..."), list("..#")], backend="numpy")
+    assert list(grid.line_counts("#").col_counts) == [1, 0, 1]
+    counts = grid.line_counts(lambda ch: ch == ".")
+    assert list(counts.row_counts) == [2, 3, 2]
+
+
+def test_bytes_backend():
+    grid = Grid([list("#.."), list("..#")], backend="bytes")
+    assert grid.shape == (2, 3)
+    assert grid[0, 0] == ord("#")
+    assert grid.count("#") == 2
+    assert grid.find_all("#") == [0, 5]
+    grid[0, 1] = ord("#")
+    assert grid.buffer == bytearray(b"##...#")
+    assert str(grid) == "##.\n..#"
+    grid.append_row("###")
+    assert grid.shape == (3, 3)
+    assert grid.count(ord("#")) == 6
+    subset = grid.get_subset(1, 2, 1, 2)
+    assert subset.backend == "bytes"
+    assert str(subset) == ".#\n##"
+    grid.pad()
+    assert grid.shape == (5, 5)
+    assert str(grid).split("\n")[1] == ".##.."
+
+
+def test_from_rows():
+    rows = [list("#."), list(".#")]
+    grid = Grid.from_rows(rows)
+    # the rows are owned by the grid, not copied
+    assert grid.content is rows
+    grid[0, 1] = "#"
+    assert rows[0] == ["#", "#"]
+    copied = Grid.from_rows(rows, copy=True, border=".")
+    copied[1, 0] = "#"
+    assert rows[1] == [".", "#"]
+    assert copied[2, 0] == "."
+    assert Grid.from_rows(iter(rows)).shape == (2, 2)
+    assert Grid.from_rows([]).content == []
+    with pytest.raises(ValueError):
+        Grid.from_rows([[1, 2], [3]])
+
+
+def test_from_bytes():
+    data = bytearray(b"#..#")
+    grid = Grid.from_bytes(data, n_columns=2)
+    # the bytearray is used without copy
+    grid.set_flat(1, ord("#"))
+    assert data == bytearray(b"##.#")
+    assert grid.get_flat(3) == ord("#")
+    assert grid.neighbors(0) == [1, 2]
+    table = byte_table({".": 0, "#": 1})
+    grid = Grid.from_bytes(b"#..#", n_columns=2, table=table)
+    assert grid.content[1].tolist() == [0, 1]
+    assert str(grid) == "10\n01"
+    assert grid.line_counts(1).empty_rows() == []
+    with pytest.raises(ValueError):
+        Grid.from_bytes(b"#..", n_columns=2)
+
+
+def test_bytes_array():
+    pytest.importorskip("numpy")
+    grid = Grid.from_bytes(b"#..#", n_columns=2)
+    array = grid.array
+    assert array.shape == (2, 2)
+    array[0, 1] = ord("#")
+    assert grid[0, 1] == ord("#")
+
+
+def test_pickle_bytes():
+    grid = Grid.from_bytes(b"#..#", n_columns=2)
+    grid.step(lambda cell, neighbors: cell)
+    copy = pickle.loads(pickle.dumps(grid))
+    assert str(copy) == str(grid)
+    assert copy.state_hash == grid.state_hash
+    # the rows of the copy are views on its own buffer
+    copy[0, 1] = "#"
+    assert copy.buffer == bytearray(b"##.#")
+    assert grid.buffer == bytearray(b"#..#")
+    assert pickle.loads(pickle.dumps(Grid(backend="bytes"))).content == []
+
+
+def test_iter_render():
+    grid = Grid([[1, 2], [3, 4]], sep=", ")
+    assert list(grid.iter_render()) == ["1, 2", "3, 4"]
+    assert list(grid.iter_render(sep="")) == ["12", "34"]
+    grid = Grid.from_bytes(b"#..#", n_columns=2)
+    assert list(grid.iter_render(sep=" ")) == ["# .", ". #"]
+    view = grid.get_subset(0, 1, 1, 1, view=True)
+    assert list(view.iter_render()) == [".", "#"]
+
+
+def test_write_to():
+    grid = Grid([[1, 2], [3, 4]], sep=", ")
+    fp = io.StringIO()
+    grid.write_to(fp)
+    assert fp.getvalue() == str(grid)
+    fp = io.BytesIO()
+    grid.write_to(fp, sep="")
+    assert fp.getvalue() == b"12\n34"
+    # byte grids write their rows directly
+    grid = Grid.from_bytes(b"#..#", n_columns=2)
+    fp = io.BytesIO()
+    grid.write_to(fp)
+    assert fp.getvalue() == b"#.\n.#"
+    fp = io.StringIO()
+    grid.get_subset(0, 1, 0, 0, view=True).write_to(fp)
+    assert fp.getvalue() == "#\n."
+    # the same bytes with or without a separator
+    grid = Grid.from_bytes("\xe9A".encode("latin-1"), n_columns=2)
+    for sep, expected in (("", b"\xe9A"), (",", b"\xe9,A")):
+        fp = io.BytesIO()
+        grid.write_to(fp, sep=sep)
+        assert fp.getvalue() == expected
+
+
+def test_transpose():
+    grid = Grid([[1, 2, 3], [4, 5, 6]], sep=",")
+    transposed = grid.T
+    assert transposed.shape == (3, 2)
+    assert str(transposed) == "1,4\n2,5\n3,6"
+    transposed[2, 0] = 0
+    assert grid[0, 2] == 0
+    assert transposed.T.steps == ((1, 0), (0, 1))
+    assert transposed.copy().content == [[1, 4], [2, 5], [0, 6]]
+
+
+def test_flip():
+    grid = Grid([[1, 2, 3], [4, 5, 6]], sep=",")
+    assert str(grid.flip(0)) == "4,5,6\n1,2,3"
+    assert str(grid.flip(1)) == "3,2,1\n6,5,4"
+    assert str(grid.flip(0).flip(1)) == "6,5,4\n3,2,1"
+    with pytest.raises(ValueError):
+        grid.flip(2)
+
+
+def test_rotate():
+    np = pytest.importorskip("numpy")
+    content = [[1, 2, 3], [4, 5, 6]]
+    grid = Grid(content, sep=",")
+    for k in range(-1, 5):
+        expected = np.rot90(np.array(content), k).tolist()
+        assert grid.rotate(k).copy().content == expected
+    # views of transformed views
+    view = grid.rotate(1).get_subset(0, 1, 0, 1, view=True)
+    assert str(view) == "3,6\n2,5"
+    assert str(view.T) == "3,2\n6,5"
+
+
+def test_transform_numpy():
+    pytest.importorskip("numpy")
+    grid = Grid([[1, 2, 3], [4, 5, 6]], backend="numpy")
+    assert grid.T.array.tolist() == [[1, 4], [2, 5], [3, 6]]
+    assert grid.rotate().array.tolist() == [[3, 6], [2, 5], [1, 4]]
+    assert grid.flip(1).array.tolist() == [[3, 2, 1], [6, 5, 4]]
+    grid.T[0, 1] = 0
+    assert grid[1, 0] == 0
+
+
+def test_iter_rows_cols():
+    grid = Grid([[1, 2, 3], [4, 5, 6]])
+    assert [list(row) for row in grid.iter_rows()] == [[1, 2, 3], [4, 5, 6]]
+    assert [list(col) for col in grid.iter_cols()] == [[1, 4], [2, 5], [3, 6]]
+    view = grid.T
+    assert [list(row) for row in view.iter_rows()] == [[1, 4], [2, 5], [3, 6]]
+    assert [list(col) for col in view.iter_cols()] == [[1, 2, 3], [4, 5, 6]]
+    grid = Grid.from_bytes(b"#..#.#", n_columns=3)
+    assert [bytes(col) for col in grid.iter_cols()] == [b"##", b"..", b".#"]
+    assert str(grid.T) == "##\n..\n.#"
+
+
+def test_state_hash():
+    grid = Grid([list("#.."), list("..#")])
+    other = Grid([list("#.."), list("..#")])
+    assert grid.state_hash == other.state_hash
+    initial = grid.state_hash
+    grid[0, 0] = "."
+    assert grid.state_hash != initial
+    # the incremental update matches a full rehash
+    assert grid.state_hash == Grid([list("..."), list("..#")]).state_hash
+    grid.set_flat(0, "#")
+    assert grid.state_hash == initial
+    # swapping two cells changes the state
+    grid[0, 0], grid[1, 2] = ".", "."
+    grid[0, 1], grid[1, 1] = "#", "#"
+    assert grid.state_hash != initial
+    grid.append_row(list("###"))
+    assert grid.state_hash == Grid([list(".#."), list(".#."), list("###")]).state_hash
+
+
+def test_bytes_writes_accept_characters():
+    grid = Grid.from_bytes(b"#..#", 2)
+    grid[0, 1] = "#"
+    grid.set_flat(2, "#")
+    assert grid.buffer == bytearray(b"####")
+    grid.put([0, 1], [0, 1], ".")
+    assert grid.buffer == bytearray(b".##.")
+    assert grid.count("#") == 2
+    grid.step(lambda cell, n_alive: "#")
+    assert grid.buffer == bytearray(b"####")
+
+
+def test_state_hash_backends():
+    content = [list("#.."), list("..#")]
+    grid = Grid(content, backend="bytes")
+    initial = grid.state_hash
+    grid[1, -1] = ord(".")
+    grid[1, 2] = ord("#")
+    assert grid.state_hash == initial
+    pytest.importorskip("numpy")
+    grid = Grid(content, backend="numpy")
+    assert grid.state_hash == Grid(content).state_hash
+    grid[0, :] = "#"
+    assert grid.state_hash == Grid([list("###"), list("..#")]).state_hash
+
+
+def test_state_hash_failed_write():
+    grid = Grid.from_bytes(b"#..#", 2)
+    initial = grid.state_hash
+    for bad in ("##", 300, None):
+        with pytest.raises((TypeError, ValueError)):
+            grid[0, 1] = bad
+        with pytest.raises((TypeError, ValueError)):
+            grid.set_flat(1, bad)
+    assert grid.state_hash == initial
+    grid = Grid([[1, 2], [3, 4]])
+    initial = grid.state_hash
+    with pytest.raises(IndexError):
+        grid[5, 0] = 9
+    assert grid.state_hash == initial
+
+
+def test_state_hash_numpy_mask_write():
+    pytest.importorskip("numpy")
+    grid = Grid([list("#.."), list(".#."), list("..#")], backend="numpy")
+    grid.state_hash
+    grid[grid.array == "."] = "O"
+    assert str(grid) == "#OO\nO#O\nOO#"
+    assert grid.state_hash == Grid(grid.array.tolist()).state_hash
+
+
+def test_grid_history():
+    history = GridHistory()
+    states = [1, 2, 3, 4, 2, 3, 4]
+    results = [history.record(state, step) for step, state in enumerate(states)]
+    assert results == [None, None, None, None, 1, 2, 3]
+    assert history.cycle == (1, 3)
+    assert history.equivalent_step(0) == 0
+    assert history.equivalent_step(10**9) == 1 + (10**9 - 1) % 3
+    with pytest.raises(ValueError):
+        GridHistory().equivalent_step(5)
+
+
+def life(cell, n_alive):
+    return "#" if n_alive == 3 or (cell == "#" and n_alive == 2) else "."
+
+
+def test_step():
+    rows = [list("....."), list("..#.."), list("..#.."), list("..#.."), list(".....")]
+    grid = Grid(rows)
+    assert grid.step(life) == 4
+    assert str(grid) == ".....\n.....\n.###.\n.....\n....."
+    assert grid.step(life) == 4
+    assert str(grid) == ".....\n..#..\n..#..\n..#..\n....."
+    # a block is a fixed point
+    grid = Grid([list("##."), list("##."), list("...")])
+    assert grid.step(life) == 0
+    with pytest.raises(ValueError):
+        grid.step(life, neighborhood=6)
+
+
+def test_step_border_and_hash():
+    # a live border feeds the edge cells
+    grid = Grid([list("..."), list("..."), list("...")], border="#")
+    initial = grid.state_hash
+    assert grid.step(life, alive="#") == 4
+    assert str(grid) == ".#.\n#.#\n.#."
+    assert grid.state_hash == Grid([list(".#."), list("#.#"), list(".#.")]).state_hash
+    assert grid.state_hash != initial
+
+
+def test_step_bytes():
+    table = byte_table({".": 0, "#": 1})
+    grid = Grid.from_bytes(b".......#....#....#.......", n_columns=5, table=table)
+    changed = grid.step(lambda c, n: int(n == 3 or (c and n == 2)), alive=1)
+    assert changed == 4
+    assert grid.content[2].tolist() == [0, 1, 1, 1, 0]
+
+
+def test_step_reuses_buffers():
+    def life(cell, n_alive):
+        live = cell in ("#", ord("#"))
+        return "#" if n_alive == 3 or (live and n_alive == 2) else "."
+
+    rows = [".....", "..#..", "..#..", "..#..", "....."]
+    for grid in (Grid([list(row) for row in rows]), Grid(rows, backend="bytes")):
+        grid.step(life)
+        buffers = [id(buffer) for buffer in grid._back]
+        assert grid.step(life) == 4
+        # the two generations swap places, the live mask stays
+        assert id(grid._back[-1]) == buffers[-1]
+        grid.step(life)
+        assert [id(buffer) for buffer in grid._back] == buffers
+        assert grid.count("#") == 3
+
+
+def test_step_numpy():
+    np = pytest.importorskip("numpy")
+    rows = [list("....."), list("..#.."), list("..#.."), list("..#.."), list(".....")]
+    grid = Grid(rows, backend="numpy")
+    initial = grid.state_hash
+
+    def vectorized_life(cells, n_alive):
+        return np.where((n_alive == 3) | ((cells == "#") & (n_alive == 2)), "#", ".")
+
+    assert grid.step(vectorized_life) == 4
+    assert str(grid) == ".....\n.....\n.###.\n.....\n....."
+    assert grid.state_hash == Grid(grid.array.tolist()).state_hash
+    assert grid.step(vectorized_life) == 4
+    assert grid.state_hash == initial
+
+
+def test_take_put():
+    grid = Grid([[1, 2, 3], [4, 5, 6]])
+    assert grid.take([0, 1, 1], [0, 0, 2]) == [1, 4, 6]
+    grid.put([0, 1], [1, 1], 0)
+    assert grid.content == [[1, 0, 3], [4, 0, 6]]
+    grid.put([0, 1], [2, 2], [7, 8])
+    assert grid.content == [[1, 0, 7], [4, 0, 8]]
+    grid = Grid([list("#.."), list("..#")], backend="bytes")
+    assert grid.take([0, 1], [0, 2]) == [ord("#"), ord("#")]
+    grid.put([0], [1], ord("#"))
+    assert str(grid) == "##.\n..#"
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_take_put_out_of_range(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    grid = Grid([list("abc"), list("def")], backend=backend)
+    # negative indices wrap within the row, like `grid[i, j]`
+    assert list(grid.take([1], [-1])) == [grid[1, -1]]
+    assert grid[1, -1] in ("f", ord("f"))
+    with pytest.raises(IndexError):
+        grid.take([0], [3])
+    with pytest.raises(IndexError):
+        grid.put([0], [3], "Z")
+    assert str(grid) == "abc\ndef"
+    grid = Grid([list("abc"), list("def")], backend=backend, border=".")
+    with pytest.raises(IndexError):
+        grid.put([0], [-1], "Z")
+    assert str(grid) == "abc\ndef"
+
+
+def test_put_keeps_hash():
+    grid = Grid([list("#.."), list("..#")])
+    grid.state_hash
+    grid.put([0, 1], [0, 0], ".")
+    assert grid.state_hash == Grid([list("..."), list("..#")]).state_hash
+
+
+def test_where():
+    grid = Grid([list("#.."), list("..#")])
+    rows, cols = grid.where("#")
+    assert (list(rows), list(cols)) == ([0, 1], [0, 2])
+    rows, cols = grid.where(lambda ch: ch == ".")
+    assert grid.take(rows, cols) == ["."] * 4
+    grid.put(*grid.where(bytearray([0, 1, 0, 0, 0, 0])), "O")
+    assert str(grid) == "#O.\n..#"
+
+
+def test_take_put_where_numpy():
+    np = pytest.importorskip("numpy")
+    grid = Grid([list("#.."), list("..#")], backend="numpy")
+    rows, cols = grid.where("#")
+    assert rows.tolist() == [0, 1]
+    assert grid.take(rows, cols).tolist() == ["#", "#"]
+    grid.put(*grid.where(grid.array == "."), "O")
+    assert str(grid) == "#OO\nOO#"
+    assert grid.where(np.zeros((2, 3), dtype=bool))[0].size == 0
+
+
+def test_where_array_mask():
+    pytest.importorskip("numpy")
+    for backend in ("list", "bytes"):
+        grid = Grid([list("#.."), list("..#")], backend=backend)
+        rows, cols = grid.where(grid.array == grid[0, 0])
+        assert (list(rows), list(cols)) == ([0, 1], [0, 2])
+        with pytest.raises(ValueError):
+            grid.where(grid.array[:1] == grid[0, 0])
@@ -2,7 +2,7 @@ import pytest
 from unittest.mock import mock_open, patch
 import re
 
-from aocutils import Parser  # TODO: not use relative import
+from aocutils import Parser, byte_table  # TODO: not use relative import
 
 
 @pytest.fixture
@@ -118,3 +118,166 @@ def test_apply_regex_with_location(sample_text):
     assert all(isinstance(m, list) for m in matches)
     for line_matches in matches:
         assert all(isinstance(m, re.Match) for m in line_matches)
+
+
+def test_get_grid_bytes():
+    parser = Parser(text="#..\n.#.\n")
+    grid = parser.get_grid(encoding="bytes")
+    assert grid.backend == "bytes"
+    assert grid.shape == (2, 3)
+    assert grid.buffer == bytearray(b"#...#.")
+    grid = parser.get_grid(encoding="bytes", table=byte_table({".": 0, "#": 1}))
+    assert grid.buffer == bytearray([1, 0, 0, 0, 1, 0])
+    with pytest.raises(ValueError):
+        Parser(text="#..\n.#").get_grid(encoding="bytes")
+    with pytest.raises(ValueError):
+        parser.get_grid(encoding="utf-8")
+    with pytest.raises(ValueError, match="no lines"):
+        Parser(text="\n  \n").get_grid(encoding="bytes")
+
+
+def test_mmap_mode(sample_text, tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("\n  " + sample_text + "\n\n")
+    reference = Parser(text="\n  " + sample_text + "\n\n")
+    with Parser(str(path), mmap=True) as parser:
+        assert parser.get_lines() == reference.get_lines()
+        assert parser.get_sections() == reference.get_sections()
+        assert parser.get_line(3) == "Section 1"
+        view = parser.get_line_view(7)
+        assert view.tobytes() == b"Line 4"
+        view.release()
+        assert parser.data == reference.data
+    with pytest.raises(ValueError, match="mmap=True needs a file_name"):
+        Parser(text="abc", mmap=True)
+
+
+def test_mmap_mode_byte_grid(tmp_path):
+    path = tmp_path / "grid.txt"
+    path.write_text("#.#\n.#.\n")
+    with Parser(str(path), mmap=True) as parser:
+        grid = parser.get_grid(encoding="bytes")
+    assert str(grid.T) == str(Parser(text="#.#\n.#.").get_grid(encoding="bytes").T)
+    assert grid[1, 1] == ord("#")
+    # both modes give the UTF-8 bytes of the file
+    path.write_text("é#\n#..\n", encoding="utf-8")
+    with Parser(str(path), mmap=True) as parser:
+        grid = parser.get_grid(encoding="bytes")
+    assert grid.buffer == Parser(str(path)).get_grid(encoding="bytes").buffer
+    assert grid.buffer == bytearray("é##..".encode())
+
+
+def test_iter_lines_and_sections(sample_text, tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("\n\n" + sample_text + " \n\n")
+    parser = Parser(str(path), lazy=True)
+    # chunks of 5 characters split lines and the blank lines between sections
+    assert list(parser.iter_lines(chunk_size=5)) == Parser(text=sample_text).get_lines()
+    assert list(parser.iter_sections(chunk_size=5)) == [
+        "Line 1\nLine 2",
+        "Section 1\nSection 1continued",
+        "Line 3\nLine 4",
+    ]
+    # the file was streamed, never loaded
+    assert parser._data is None
+    assert parser.data == sample_text.strip()
+
+
+def test_iter_integers_and_regex(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("1, 2,3\n40,5, 6\n")
+    parser = Parser(str(path), lazy=True)
+    assert list(parser.iter_integers(sep=",", chunk_size=4)) == [[1, 2, 3], [40, 5, 6]]
+    assert list(parser.iter_regex(r"\d+", chunk_size=4)) == [
+        ["1", "2", "3"],
+        ["40", "5", "6"],
+    ]
+    matches = next(parser.iter_regex(r"\d+", return_loc=True))
+    assert [m.start() for m in matches] == [0, 3, 5]
+
+
+def test_cached_lines_and_offsets(sample_text):
+    parser = Parser(text=sample_text)
+    assert parser.lines is None
+    lines = parser.get_lines()
+    assert parser.get_lines() is lines
+    assert parser.get_sections() is parser.sections
+    offsets = parser.get_line_offsets()
+    assert len(offsets) == len(lines) + 1
+    assert parser.data[offsets[3]: offsets[4] - 1] == "Section 1"
+    assert offsets[-1] == len(parser.data) + 1
+    parser.clear_cache()
+    assert parser.lines is None and parser.sections is None
+    assert parser.get_lines() == lines
+
+
+def test_apply_regex_whole_buffer():
+    parser = Parser(text="a1b2\n\nc33\nxyz\n4")
+    pattern = re.compile(r"\d+")
+    assert parser.apply_regex(pattern, whole_buffer=True) == parser.apply_regex(
+        pattern
+    )
+    assert parser.apply_regex(r"^(\w)(\d)?", whole_buffer=True) == [
+        [("a", "1")],
+        [],
+        [("c", "3")],
+        [("x", "")],
+        [("4", "")],
+    ]
+    lines, cols, values = parser.apply_regex(r"\d+", whole_buffer=True, flat=True)
+    assert list(lines) == [0, 0, 2, 4]
+    assert list(cols) == [1, 3, 1, 0]
+    assert values == ["1", "2", "33", "4"]
+    with pytest.raises(ValueError):
+        parser.apply_regex(r"\d", flat=True)
+
+
+def test_get_integers_as_array():
+    parser = Parser(text="1 -2 3\n\n40 5\n-6")
+    rows = parser.get_integers(sep=" ", as_array=True)
+    assert list(rows.values) == [1, -2, 3, 40, 5, -6]
+    assert list(rows.offsets) == [0, 3, 3, 5, 6]
+    assert [list(rows.row(k)) for k in range(4)] == [[1, -2, 3], [], [40, 5], [-6]]
+    digits = Parser(text="123\n45").get_integers(as_array=True)
+    assert list(digits.values) == [1, 2, 3, 4, 5]
+    assert list(digits.offsets) == [0, 3, 5]
+    with pytest.raises(ValueError):
+        Parser(text="12a").get_integers(as_array=True)
+
+
+def test_get_integers_numpy():
+    np = pytest.importorskip("numpy")
+    parser = Parser(text="0 3 -6\n1 3 6")
+    array_2d = parser.get_integers(sep=" ", as_array="numpy")
+    assert array_2d.dtype == np.int64
+    assert array_2d.tolist() == parser.get_integers(sep=" ")
+    rows = Parser(text="1 2\n3").get_integers(sep=" ", as_array="numpy")
+    assert rows.values.tolist() == [1, 2, 3]
+    assert rows.offsets.tolist() == [0, 2, 3]
+
+
+def test_map_sections_and_lines(sample_text, tmp_path):
+    parser = Parser(text=sample_text)
+    assert parser.map_sections(str.splitlines, workers=2) == [
+        section.splitlines() for section in parser.get_sections()
+    ]
+    assert parser.map_lines(len, workers=2, chunksize=3) == [
+        len(line) for line in parser.get_lines()
+    ]
+    assert parser.map_lines(len, workers=1) == parser.map_lines(len, workers=2)
+    path = tmp_path / "input.txt"
+    path.write_text("\n" + sample_text)
+    with Parser(str(path), mmap=True) as mapped_parser:
+        assert mapped_parser.map_sections(len, workers=2) == [13, 28, 13]
+
+
+def test_iter_split_long_parts(tmp_path):
+    path = tmp_path / "input.txt"
+    long_line = "x" * 1000
+    # blank lines straddle the chunk boundaries at various offsets
+    text = f"{long_line}\n\n{long_line}\nab\n\n\n{long_line}"
+    path.write_text(text)
+    parser = Parser(str(path), lazy=True)
+    for chunk_size in (7, 64, 999, 1001):
+        assert list(parser.iter_lines(chunk_size)) == text.split("\n")
+        assert list(parser.iter_sections(chunk_size)) == text.split("\n\n")
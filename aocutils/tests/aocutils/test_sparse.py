@@ -0,0 +1,76 @@
+import pytest
+
+from aocutils import Grid, SparseGrid
+
+
+def test_getitem_setitem():
+    grid = SparseGrid(default=".")
+    assert grid[5, -3] == "."
+    grid[5, -3] = "#"
+    assert grid[5, -3] == "#"
+    assert (5, -3) in grid
+    assert len(grid) == 1
+    # setting the default value removes the cell
+    grid[5, -3] = "."
+    assert len(grid) == 0
+    assert (5, -3) not in grid
+
+
+def test_bounds():
+    grid = SparseGrid({(0, 0): "#", (10**6, -5): "#"})
+    assert grid.bounds == (0, 10**6, -5, 0)
+    assert grid.shape == (10**6 + 1, 6)
+    grid[-2, 3] = "#"
+    assert grid.bounds == (-2, 10**6, -5, 3)
+    del grid[10**6, -5]
+    assert grid.bounds == (-2, 0, 0, 3)
+    del grid[0, 0]
+    del grid[-2, 3]
+    assert grid.bounds is None
+    assert grid.shape == (0, 0)
+    # removing an inner cell keeps the bounding box without a rescan
+    grid = SparseGrid({(0, 0): "#", (1, 1): "#", (2, 2): "#"})
+    assert grid.bounds == (0, 2, 0, 2)
+    del grid[1, 1]
+    assert not grid._bounds_stale
+    assert grid.bounds == (0, 2, 0, 2)
+    grid[1, 1] = "."
+    assert len(grid) == 2
+
+
+def test_packed_coordinates():
+    grid = SparseGrid()
+    idx = grid.index(-1, 2)
+    assert grid.coords(idx) == (-1, 2)
+    grid.set_flat(idx, "#")
+    assert grid[-1, 2] == "#"
+    assert grid.get_flat(idx) == "#"
+    neighbors = [grid.coords(n) for n in grid.neighbors(idx)]
+    assert neighbors == [(-2, 2), (-1, 1), (-1, 3), (0, 2)]
+    assert len(grid.neighbors(idx, connectivity=8)) == 8
+
+
+def test_grid_conversion():
+    dense = Grid([list("#.."), list("..#")])
+    grid = SparseGrid.from_grid(dense)
+    assert sorted(grid.items()) == [((0, 0), "#"), ((1, 2), "#")]
+    assert grid.to_grid().content == dense.content
+    assert str(grid) == "#..\n..#"
+    grid = SparseGrid.from_grid(dense, origin=(10, 10))
+    assert sorted(grid) == [(10, 10), (11, 12)]
+    assert SparseGrid().to_grid().content == []
+
+
+def test_column_limit():
+    grid = SparseGrid()
+    grid[0, 2**31 - 1] = "#"
+    grid[10**12, -(2**31)] = "#"
+    assert grid[1, -(2**31)] == "."
+    assert sorted(grid) == [(0, 2**31 - 1), (10**12, -(2**31))]
+    with pytest.raises(IndexError):
+        grid[0, 2**31] = "#"
+    with pytest.raises(IndexError):
+        grid[1, -(2**31) - 1]
+    # no neighbour across the column limit
+    neighbors = [grid.coords(n) for n in grid.neighbors(grid.index(0, 2**31 - 1))]
+    assert neighbors == [(-1, 2**31 - 1), (0, 2**31 - 2), (1, 2**31 - 1)]
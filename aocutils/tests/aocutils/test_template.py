@@ -0,0 +1,38 @@
+import pytest
+
+from aocutils import Parser, Template
+
+CARDS = """Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53
+Card   2: 13 32 | 61 30 -1"""
+
+
+def test_parse_records():
+    records = Template("Card {id:d}: {win:ints} | {have:ints}").parse(CARDS)
+    assert records[0] == (1, [41, 48, 83, 86, 17], [83, 86, 6, 31, 17, 9, 48, 53])
+    assert records[1].id == 2
+    assert records[1].have == [61, 30, -1]
+
+
+def test_parse_columns():
+    columns = Template("{name:w} {{{x:f}, {tag}}}").parse(
+        "a {1.5, red}\nb {-2, dark blue}", columns=True
+    )
+    assert list(columns["x"]) == [1.5, -2.0]
+    assert columns["name"] == ["a", "b"]
+    assert columns["tag"] == ["red", "dark blue"]
+
+
+def test_parse_strict():
+    template = Template("{node:w} = ({left:w}, {right:w})")
+    text = "LR\n\nAAA = (BBB, CCC)\nBBB = (AAA, ZZZ)"
+    with pytest.raises(ValueError, match="'LR' does not match"):
+        template.parse(text)
+    assert [r.node for r in template.parse(text, strict=False)] == ["AAA", "BBB"]
+    with pytest.raises(ValueError, match="Unknown type"):
+        Template("{x:q}")
+
+
+def test_parser_parse_template():
+    parser = Parser(text=CARDS)
+    columns = parser.parse_template("Card {id:d}: {win:ints} | {have:ints}", True)
+    assert list(columns["id"]) == [1, 2]
@@ -0,0 +1,64 @@
+import io
+import mmap
+
+import pytest
+
+from aocutils import Parser, TiledGrid
+
+LINES = ["#..#.", "..#..", ".....", "#...#", "..##."]
+
+
+def test_from_lines_round_trip():
+    # tiles of 2x2 cells, so rows and columns cross several tiles
+    with TiledGrid.from_lines(LINES, tile_size=2) as grid:
+        assert grid.shape == (5, 5)
+        assert str(grid) == "\n".join(LINES)
+        assert grid[3, 4] == ord("#")
+        assert grid.get(5, 0, default=0) == 0
+        with pytest.raises(IndexError):
+            grid[0, 5]
+        assert grid.count("#") == 7
+
+
+def test_setitem_and_reopen(tmp_path):
+    path = tmp_path / "grid.bin"
+    with TiledGrid.create((3, 70), path=path, fill=ord(".")) as grid:
+        grid[2, 69] = ord("#")
+        grid.set_row(1, b"o" * 70)
+    with TiledGrid.open(path) as grid:
+        assert grid.shape == (3, 70)
+        assert grid.get_row(0) == b"." * 70
+        assert grid.get_row(1) == b"o" * 70
+        assert grid.get_row(2) == b"." * 69 + b"#"
+        with pytest.raises(TypeError):
+            grid[0, 0] = ord("#")
+
+
+def test_tiles_on_pages():
+    with TiledGrid.create((64, 64), fill=".") as grid:
+        # the first tile is the first page after the header
+        assert grid._offset(0, 0) % mmap.PAGESIZE == 0
+        assert grid._offset(63, 63) - grid._offset(0, 0) == 64 * 64 - 1
+        grid[1, 2] = "#"
+        assert grid[1, 2] == ord("#")
+        assert grid.count(".") == 64 * 64 - 1
+
+
+def test_from_text_file(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("\n" + "\n".join(LINES) + "\n\n")
+    with Parser(str(input_path)).get_tiled_grid(tile_size=4) as grid:
+        assert list(grid.iter_rows()) == [line.encode() for line in LINES]
+        fp = io.StringIO()
+        grid.write_to(fp, sep=" ")
+        assert fp.getvalue().split("\n")[0] == "# . . # ."
+    with pytest.raises(ValueError):
+        TiledGrid.from_lines(["..", "..."])
+    with pytest.raises(ValueError):
+        TiledGrid.create((2, 2), tile_size=3)
+
+
+def test_border():
+    with TiledGrid.from_lines(LINES, border=ord(".")) as grid:
+        assert grid[-1, 0] == ord(".")
+        assert grid[0, 0] == ord("#")
@@ -0,0 +1,59 @@
+from aocutils import Grid, bfs, flood_fill, follow_path
+
+
+def sample_grid():
+    return Grid([list("..#."), list("#.#."), list("....")])
+
+
+def test_bfs():
+    grid = sample_grid()
+    distances = bfs(grid, [grid.index(0, 0)], passable=lambda ch: ch != "#")
+    assert list(distances) == [0, 1, -1, 7, -1, 2, -1, 6, 4, 3, 4, 5]
+
+
+def test_bfs_multiple_sources():
+    grid = sample_grid()
+    sources = [grid.index(0, 0), grid.index(0, 3)]
+    distances = bfs(grid, sources, passable=lambda ch: ch != "#")
+    assert distances[grid.index(2, 3)] == 2
+    assert distances[grid.index(2, 0)] == 4
+
+
+def test_bfs_connectivity_8():
+    grid = Grid([list("..."), list("..."), list("...")])
+    distances = bfs(grid, [0], connectivity=8)
+    assert distances[grid.index(2, 2)] == 2
+
+
+def test_bfs_custom_neighbors():
+    # one-way moves to the right only
+    grid = Grid([list("....")])
+    distances = bfs(grid, [1], neighbors=lambda idx: [idx + 1] if idx < 3 else [])
+    assert list(distances) == [-1, 0, 1, 2]
+
+
+def test_flood_fill():
+    grid = sample_grid()
+    mask = flood_fill(grid, [grid.index(0, 3)], passable=lambda ch: ch != "#")
+    assert mask.count(1) == 9
+    assert mask[grid.index(0, 2)] == 0
+    mask = flood_fill(grid, [grid.index(0, 2)], passable=lambda ch: ch == "#")
+    assert list(mask) == [0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0]
+
+
+def test_follow_path_loop():
+    # walk clockwise around a 3x3 ring
+    ring = [0, 1, 2, 5, 8, 7, 6, 3]
+
+    def next_cell(prev, cur):
+        return ring[(ring.index(cur) + 1) % len(ring)]
+
+    path = follow_path(0, next_cell)
+    assert list(path) == ring
+    path = follow_path(0, next_cell, max_steps=3)
+    assert list(path) == [0, 1, 2, 5]
+
+
+def test_follow_path_open():
+    path = follow_path(0, lambda prev, cur: cur + 1 if cur < 4 else None, first=2)
+    assert list(path) == [0, 2, 3, 4]